@@ -7,33 +7,34 @@ from app.services.clubs.managers import TransfermarktClubManagers
 from app.services.clubs.players import TransfermarktClubPlayers
 from app.services.clubs.profile import TransfermarktClubProfile
 from app.services.clubs.search import TransfermarktClubSearch
+from app.utils.responses import DumpJSONAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=DumpJSONAPIRoute)
 
 
 @router.get("/search/{club_name}", response_model=schemas.ClubSearch, response_model_exclude_none=True)
-def search_clubs(club_name: str, page_number: Optional[int] = 1) -> dict:
-    tfmkt = TransfermarktClubSearch(query=club_name, page_number=page_number)
+async def search_clubs(club_name: str, page_number: Optional[int] = 1) -> dict:
+    tfmkt = await TransfermarktClubSearch.acreate(query=club_name, page_number=page_number)
     found_clubs = tfmkt.search_clubs()
     return found_clubs
 
 
 @router.get("/{club_id}/profile", response_model=schemas.ClubProfile, response_model_exclude_defaults=True)
-def get_club_profile(club_id: str) -> dict:
-    tfmkt = TransfermarktClubProfile(club_id=club_id)
+async def get_club_profile(club_id: str) -> dict:
+    tfmkt = await TransfermarktClubProfile.acreate(club_id=club_id)
     club_profile = tfmkt.get_club_profile()
     return club_profile
 
 
 @router.get("/{club_id}/players", response_model=schemas.ClubPlayers, response_model_exclude_defaults=True)
-def get_club_players(club_id: str, season_id: Optional[str] = None, is_national: Optional[bool] = False) -> dict:
-    tfmkt = TransfermarktClubPlayers(club_id=club_id, is_national=is_national, season_id=season_id)
+async def get_club_players(club_id: str, season_id: Optional[str] = None, is_national: Optional[bool] = False) -> dict:
+    tfmkt = await TransfermarktClubPlayers.acreate(club_id=club_id, is_national=is_national, season_id=season_id)
     club_players = tfmkt.get_club_players()
     return club_players
 
 @router.get("/{club_id}/managers", response_model=schemas.ClubManagers, response_model_exclude_defaults=True)  # New route
-def get_club_managers(club_id: str) -> dict:
-    tfmkt = TransfermarktClubManagers(club_id=club_id)
+async def get_club_managers(club_id: str) -> dict:
+    tfmkt = await TransfermarktClubManagers.acreate(club_id=club_id)
     club_managers = tfmkt.get_club_managers()
     return club_managers
 
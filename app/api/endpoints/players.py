@@ -1,8 +1,11 @@
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter
 
 from app.schemas import players as schemas
+from app.schemas.base import ErrorDetail, Section
+from app.schemas.batch import BatchRequest
 from app.services.players.achievements import TransfermarktPlayerAchievements
 from app.services.players.injuries import TransfermarktPlayerInjuries
 from app.services.players.jersey_numbers import TransfermarktPlayerJerseyNumbers
@@ -11,61 +14,101 @@ from app.services.players.profile import TransfermarktPlayerProfile
 from app.services.players.search import TransfermarktPlayerSearch
 from app.services.players.stats import TransfermarktPlayerStats
 from app.services.players.transfers import TransfermarktPlayerTransfers
+from app.utils.batch import gather_batch, run_section, stream_batch
+from app.utils.responses import DumpJSONAPIRoute
 
-router = APIRouter()
+router = APIRouter(route_class=DumpJSONAPIRoute)
 
 
 @router.get("/search/{player_name}", response_model=schemas.PlayerSearch, response_model_exclude_none=True)
-def search_players(player_name: str, page_number: Optional[int] = 1):
-    tfmkt = TransfermarktPlayerSearch(query=player_name, page_number=page_number)
+async def search_players(player_name: str, page_number: Optional[int] = 1):
+    tfmkt = await TransfermarktPlayerSearch.acreate(query=player_name, page_number=page_number)
     found_players = tfmkt.search_players()
     return found_players
 
 
 @router.get("/{player_id}/profile", response_model=schemas.PlayerProfile, response_model_exclude_none=True)
-def get_player_profile(player_id: str):
-    tfmkt = TransfermarktPlayerProfile(player_id=player_id)
+async def get_player_profile(player_id: str):
+    tfmkt = await TransfermarktPlayerProfile.acreate(player_id=player_id)
     player_info = tfmkt.get_player_profile()
     return player_info
 
 
 @router.get("/{player_id}/market_value", response_model=schemas.PlayerMarketValue, response_model_exclude_none=True)
-def get_player_market_value(player_id: str):
-    tfmkt = TransfermarktPlayerMarketValue(player_id=player_id)
+async def get_player_market_value(player_id: str, history_only: bool = False):
+    tfmkt = await TransfermarktPlayerMarketValue.acreate(player_id=player_id, history_only=history_only)
     player_market_value = tfmkt.get_player_market_value()
     return player_market_value
 
 
 @router.get("/{player_id}/transfers", response_model=schemas.PlayerTransfers, response_model_exclude_none=True)
-def get_player_transfers(player_id: str):
-    tfmkt = TransfermarktPlayerTransfers(player_id=player_id)
+async def get_player_transfers(player_id: str, history_only: bool = False):
+    tfmkt = await TransfermarktPlayerTransfers.acreate(player_id=player_id, history_only=history_only)
     player_market_value = tfmkt.get_player_transfers()
     return player_market_value
 
 
 @router.get("/{player_id}/jersey_numbers", response_model=schemas.PlayerJerseyNumbers, response_model_exclude_none=True)
-def get_player_jersey_numbers(player_id: str):
-    tfmkt = TransfermarktPlayerJerseyNumbers(player_id=player_id)
+async def get_player_jersey_numbers(player_id: str):
+    tfmkt = await TransfermarktPlayerJerseyNumbers.acreate(player_id=player_id)
     player_jerseynumbers = tfmkt.get_player_jersey_numbers()
     return player_jerseynumbers
 
 
 @router.get("/{player_id}/stats", response_model=schemas.PlayerStats, response_model_exclude_none=True)
-def get_player_stats(player_id: str):
-    tfmkt = TransfermarktPlayerStats(player_id=player_id)
+async def get_player_stats(player_id: str):
+    tfmkt = await TransfermarktPlayerStats.acreate(player_id=player_id)
     player_stats = tfmkt.get_player_stats()
     return player_stats
 
 
 @router.get("/{player_id}/injuries", response_model=schemas.PlayerInjuries, response_model_exclude_none=True)
-def get_player_injuries(player_id: str, page_number: Optional[int] = 1):
-    tfmkt = TransfermarktPlayerInjuries(player_id=player_id, page_number=page_number)
+async def get_player_injuries(player_id: str, page_number: Optional[int] = 1):
+    tfmkt = await TransfermarktPlayerInjuries.acreate(player_id=player_id, page_number=page_number)
     players_injuries = tfmkt.get_player_injuries()
     return players_injuries
 
 
 @router.get("/{player_id}/achievements", response_model=schemas.PlayerAchievements, response_model_exclude_none=True)
-def get_player_achievements(player_id: str):
-    tfmkt = TransfermarktPlayerAchievements(player_id=player_id)
+async def get_player_achievements(player_id: str):
+    tfmkt = await TransfermarktPlayerAchievements.acreate(player_id=player_id)
     player_achievements = tfmkt.get_player_achievements()
     return player_achievements
+
+
+@router.get("/{player_id}/full", response_model=schemas.PlayerFull, response_model_exclude_none=True)
+async def get_player_full(player_id: str):
+    profile = asyncio.ensure_future(run_section(get_player_profile(player_id), schemas.PlayerProfile))
+
+    async def search() -> Section:
+        if (await profile).result is None:
+            error = ErrorDetail(status_code=424, detail="The search needs the name from the profile, which failed.")
+            return Section[schemas.PlayerSearch](error=error, duration_ms=0)
+        return await run_section(search_players((await profile).result.name), schemas.PlayerSearch)
+
+    sections = await asyncio.gather(
+        profile,
+        run_section(get_player_market_value(player_id), schemas.PlayerMarketValue),
+        run_section(get_player_transfers(player_id), schemas.PlayerTransfers),
+        run_section(get_player_stats(player_id), schemas.PlayerStats),
+        run_section(get_player_injuries(player_id), schemas.PlayerInjuries),
+        run_section(get_player_achievements(player_id), schemas.PlayerAchievements),
+        run_section(get_player_jersey_numbers(player_id), schemas.PlayerJerseyNumbers),
+        search(),
+    )
+    names = ["profile", "marketValue", "transfers", "stats", "injuries", "achievements", "jerseyNumbers", "search"]
+    return {"id": player_id, **dict(zip(names, sections))}
+
+
+@router.post("/profile:batch", response_model=schemas.PlayerProfileBatch, response_model_exclude_none=True)
+async def get_players_profiles(batch: BatchRequest, stream: bool = False):
+    if stream:
+        return stream_batch(batch.ids, get_player_profile, schemas.PlayerProfile)
+    return {"results": await gather_batch(batch.ids, get_player_profile, schemas.PlayerProfile)}
+
+
+@router.post("/market_value:batch", response_model=schemas.PlayerMarketValueBatch, response_model_exclude_none=True)
+async def get_players_market_values(batch: BatchRequest, stream: bool = False):
+    if stream:
+        return stream_batch(batch.ids, get_player_market_value, schemas.PlayerMarketValue)
+    return {"results": await gather_batch(batch.ids, get_player_market_value, schemas.PlayerMarketValue)}
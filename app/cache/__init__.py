@@ -0,0 +1,145 @@
+from functools import lru_cache
+from typing import Optional
+
+from app.cache.base import CacheEntry, CacheStats
+from app.cache.disk import DiskCache
+from app.cache.memory import MemoryCache
+from app.cache.negative import NegativeCache, NegativeEntry
+from app.cache.remote import (
+    MemoryRemoteCache,
+    RedisCache,
+    RemoteCache,
+    RemoteCacheError,
+    RemoteEntries,
+    create_remote_cache,
+)
+from app.cache.results import ResultCache, ResultEntry, approximate_size
+from app.cache.shared import SharedCache
+from app.cache.stale import (
+    RefreshQueue,
+    StaleAPIRoute,
+    StaleServing,
+    get_stale_serving,
+    refresh_queue,
+    serving_stale,
+)
+from app.cache.tiered import TieredCache
+from app.settings import settings
+from app.utils.utils import get_url_family
+
+__all__ = [
+    "CacheEntry",
+    "CacheStats",
+    "DiskCache",
+    "MemoryCache",
+    "MemoryRemoteCache",
+    "NegativeCache",
+    "NegativeEntry",
+    "RedisCache",
+    "RefreshQueue",
+    "RemoteCache",
+    "RemoteCacheError",
+    "RemoteEntries",
+    "ResultCache",
+    "ResultEntry",
+    "SharedCache",
+    "StaleAPIRoute",
+    "StaleServing",
+    "TieredCache",
+    "approximate_size",
+    "create_remote_cache",
+    "get_negative_cache",
+    "get_remote_entries",
+    "get_response_cache",
+    "get_result_cache",
+    "get_shared_cache",
+    "get_stale_serving",
+    "get_ttl",
+    "refresh_queue",
+    "serving_stale",
+]
+
+
+@lru_cache(maxsize=None)
+def get_response_cache() -> TieredCache:
+    """
+    Get the cache of upstream responses shared by all services, built from the settings on first use.
+
+    Returns:
+        TieredCache: The in-memory tier, backed by the shared tier if `CACHE_SHARED_PATH` is set, by a disk tier if
+            `CACHE_DISK_DIR` is set and by the remote tier if `CACHE_REMOTE_URL` is set.
+    """
+    disk = None
+    if settings.CACHE_DISK_DIR:
+        disk = DiskCache(settings.CACHE_DISK_DIR, settings.CACHE_DISK_MAX_BYTES)
+    return TieredCache(MemoryCache(settings.CACHE_MEMORY_MAX_BYTES), disk, get_shared_cache(), get_remote_entries())
+
+
+@lru_cache(maxsize=None)
+def get_negative_cache() -> NegativeCache:
+    """
+    Get the cache of the client errors of the upstream URLs shared by all services, built from the settings on first
+    use.
+
+    Returns:
+        NegativeCache: The in-memory cache, bounded by `CACHE_NEGATIVE_MAX_ENTRIES`.
+    """
+    return NegativeCache(settings.CACHE_NEGATIVE_MAX_ENTRIES)
+
+
+@lru_cache(maxsize=None)
+def get_result_cache() -> ResultCache:
+    """
+    Get the cache of the data extracted by the services, shared by all of them, built from the settings on first use.
+
+    Returns:
+        ResultCache: The in-memory cache, bounded by `CACHE_RESULTS_MAX_ENTRIES` and `CACHE_RESULTS_MAX_BYTES`, backed
+            by the shared cache if `CACHE_SHARED_PATH` is set.
+    """
+    return ResultCache(settings.CACHE_RESULTS_MAX_ENTRIES, settings.CACHE_RESULTS_MAX_BYTES, get_shared_cache())
+
+
+@lru_cache(maxsize=None)
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    Get the cache shared by the worker processes of the host, built from the settings on first use.
+
+    Returns:
+        Optional[SharedCache]: The SQLite cache at `CACHE_SHARED_PATH`, bounded by `CACHE_SHARED_MAX_BYTES`, or None if
+            the path is not set.
+    """
+    if not settings.CACHE_SHARED_PATH:
+        return None
+    return SharedCache(settings.CACHE_SHARED_PATH, settings.CACHE_SHARED_MAX_BYTES)
+
+
+@lru_cache(maxsize=None)
+def get_remote_entries() -> Optional[RemoteEntries]:
+    """
+    Get the upstream responses kept in the cache shared by the nodes of the deployment, built from the settings on
+    first use.
+
+    Returns:
+        Optional[RemoteEntries]: The entries kept at `CACHE_REMOTE_URL` under `CACHE_REMOTE_PREFIX`, past their expiry
+            for `CACHE_MAX_STALE` seconds, or None if the URL is not set.
+    """
+    if not settings.CACHE_REMOTE_URL:
+        return None
+    backend = create_remote_cache(settings.CACHE_REMOTE_URL, settings.CACHE_REMOTE_TIMEOUT)
+    return RemoteEntries(backend, settings.CACHE_REMOTE_PREFIX, lambda: settings.CACHE_MAX_STALE)
+
+
+def get_ttl(url: str) -> int:
+    """
+    Get the number of seconds a response from a URL is cached for.
+
+    The TTL is read from the `CACHE_TTL_<FAMILY>` setting of the URL family, e.g. `CACHE_TTL_PROFILE`, and falls back
+    to `CACHE_TTL_DEFAULT`.
+
+    Args:
+        url (str): The URL of the response.
+
+    Returns:
+        int: The TTL in seconds. 0 disables caching for the URL.
+    """
+    return getattr(settings, f"CACHE_TTL_{get_url_family(url).upper()}", settings.CACHE_TTL_DEFAULT)
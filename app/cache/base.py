@@ -0,0 +1,69 @@
+import hashlib
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Optional
+
+# A page parsed by lxml takes about ten times the bytes of its HTML
+PAGE_SIZE_RATIO = 10
+
+
+@dataclass
+class CacheEntry:
+    """
+    An upstream response kept in the cache.
+
+    Args:
+        content (bytes): The body of the response.
+        headers (dict): The response headers worth keeping, e.g. `Content-Type`.
+        status_code (int): The status code of the response.
+        expires_at (float): The Unix time after which the entry is no longer served.
+        stored_at (float): The Unix time the response was fetched, or last revalidated, at.
+        page (Any, optional): The page parsed from the body, kept by the in-memory tier only so that serving the entry
+            again does not parse it again.
+    """
+
+    content: bytes
+    headers: dict
+    status_code: int
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+    page: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    @property
+    def size(self) -> int:
+        """The number of bytes the entry accounts for in a size-bounded cache, its parsed page included."""
+        return len(self.content) * (1 + PAGE_SIZE_RATIO if self.page is not None else 1)
+
+    @cached_property
+    def version(self) -> str:
+        """A digest of the body, the same for entries revalidated or read back from disk as long as it is unchanged."""
+        return hashlib.blake2b(self.content, digest_size=16).hexdigest()
+
+    def is_expired(self, now: float = None) -> bool:
+        """
+        Check whether the entry has outlived its TTL.
+
+        Args:
+            now (float, optional): The Unix time to check against. Defaults to the current time.
+
+        Returns:
+            bool: True if the entry expired.
+        """
+        return (time.time() if now is None else now) >= self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a cache tier.
+
+    Attributes:
+        hits (int): Lookups answered by the tier.
+        misses (int): Lookups the tier had no fresh entry for, expired entries included.
+        evictions (int): Entries dropped to keep the tier within its size bound.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.cache.base import CacheEntry, CacheStats
+
+# Share of the size bound the eviction goes down to, so that the directory is only scanned once in a while
+LOW_WATER_RATIO = 0.9
+
+
+class DiskCache:
+    """
+    Cache keeping one file per entry in a directory, so that the cached responses survive restarts.
+
+    Each file holds a JSON line with the metadata of the entry followed by the raw body. Files are written to a
+    temporary name first and renamed into place, so readers never see a partial entry.
+
+    Args:
+        directory (str): The directory to keep the entries in. It is created if missing.
+        max_bytes (int): The maximum number of bytes kept on disk. Once it is exceeded, the least recently used files
+            are deleted until `LOW_WATER_RATIO` of it is left.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self.size = sum(path.stat().st_size for path in self._files())
+
+    def _path(self, key: str) -> Path:
+        """The file an entry is stored in, sharded by the first two characters of the hashed key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def _files(self) -> list[Path]:
+        """All the entry files currently on disk."""
+        return [path for path in self.directory.glob("??/*") if not path.name.startswith(".")]
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry, refreshing its modification time so that it is evicted last.
+
+        Args:
+            key (str): The key the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too, counted as a miss, instead of deleting it,
+                e.g. to revalidate it. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none or it expired.
+        """
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.is_expired() and not include_expired:
+            self.delete(key)
+            self.stats.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        if entry.is_expired():
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry without counting the lookup or refreshing its modification time, e.g. to check its
+        version.
+
+        Args:
+            key (str): The key the entry was stored under.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none or it expired.
+        """
+        entry = self._read(self._path(key))
+        return None if entry is None or entry.is_expired() else entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry, deleting the least recently used ones if the size bound is exceeded.
+
+        Args:
+            key (str): The key to store the entry under.
+            entry (CacheEntry): The entry to store.
+        """
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        metadata = {
+            "headers": entry.headers,
+            "status_code": entry.status_code,
+            "expires_at": entry.expires_at,
+            "stored_at": entry.stored_at,
+        }
+        data = json.dumps(metadata).encode() + b"\n" + entry.content
+        if len(data) > self.max_bytes:
+            return
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        with self._lock:
+            self.size -= self._file_size(path)
+            os.replace(tmp, path)
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                self._evict(keep=path)
+
+    def delete(self, key: str) -> None:
+        """
+        Drop the entry stored under a key, if any.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        path = self._path(key)
+        with self._lock:
+            size = self._file_size(path)
+            try:
+                path.unlink()
+            except OSError:
+                return
+            self.size -= size
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            for path in self._files():
+                path.unlink(missing_ok=True)
+            self.size = 0
+
+    def _evict(self, keep: Path) -> None:
+        """
+        Delete the least recently used files but one until `LOW_WATER_RATIO` of the size bound is left, in a single
+        scan of the directory, which also accounts for the files written or deleted by other processes. The caller
+        holds the lock.
+        """
+        files = []
+        self.size = 0
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            self.size += stat.st_size
+            if path != keep:
+                files.append((stat.st_mtime, stat.st_size, path))
+        files.sort(key=lambda file: file[0])
+        for _, size, path in files:
+            if self.size <= self.max_bytes * LOW_WATER_RATIO:
+                break
+            path.unlink(missing_ok=True)
+            self.size -= size
+            self.stats.evictions += 1
+
+    @staticmethod
+    def _read(path: Path) -> Optional[CacheEntry]:
+        """The entry stored in a file, or None if it does not exist or cannot be read."""
+        try:
+            with path.open("rb") as file:
+                metadata = json.loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(content=content, **metadata)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """The size of a file, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
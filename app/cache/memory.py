@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.cache.base import PAGE_SIZE_RATIO, CacheEntry, CacheStats
+
+
+class MemoryCache:
+    """
+    In-process LRU cache bounded by the total size of the cached bodies.
+
+    Args:
+        max_bytes (int): The maximum number of body bytes kept. The least recently used entries are evicted to stay
+            within it, and entries larger than the bound are not cached at all.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry, marking it as the most recently used.
+
+        Args:
+            key (str): The key the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too, counted as a miss, instead of dropping it,
+                e.g. to revalidate it. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none or it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            expired = entry is not None and entry.is_expired()
+            if expired and not include_expired:
+                self._remove(key)
+                entry = None
+            if entry is None or expired:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry without counting the lookup or marking the entry as used, e.g. to check its version.
+
+        Args:
+            key (str): The key the entry was stored under.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none or it expired.
+        """
+        entry = self._entries.get(key)
+        return None if entry is None or entry.is_expired() else entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry, evicting the least recently used ones if the size bound is exceeded.
+
+        Args:
+            key (str): The key to store the entry under.
+            entry (CacheEntry): The entry to store.
+        """
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            self._evict()
+
+    def keep_page(self, key: str, entry: CacheEntry, page: Any) -> None:
+        """
+        Keep the page parsed from the body of an entry along with it, accounting for its size.
+
+        Nothing is kept if another entry was stored under the key since, or if the entry would no longer fit.
+
+        Args:
+            key (str): The key the entry was stored under.
+            entry (CacheEntry): The entry the page was parsed from.
+            page (Any): The parsed page.
+        """
+        if len(entry.content) * (1 + PAGE_SIZE_RATIO) > self.max_bytes:
+            return
+        with self._lock:
+            if self._entries.get(key) is not entry or entry.page is not None:
+                return
+            self.size -= entry.size
+            entry.page = page
+            self.size += entry.size
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """
+        Drop the entry stored under a key, if any.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until the size bound is met. The caller holds the lock."""
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its size. The caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.cache.base import CacheStats
+
+
+@dataclass
+class NegativeEntry:
+    """
+    A recent failure of an upstream URL, answered again instead of requesting the URL.
+
+    Args:
+        status_code (int): The status code of the error, e.g. 404.
+        detail (str): The detail of the error.
+        expires_at (float): The Unix time after which the URL is requested again.
+    """
+
+    status_code: int
+    detail: str
+    expires_at: float
+
+
+class NegativeCache:
+    """
+    In-process LRU cache of the client errors of the upstream URLs, bounded by the number of entries.
+
+    Args:
+        max_entries (int): The maximum number of entries kept. The least recently used ones are evicted to stay within
+            it.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, NegativeEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[NegativeEntry]:
+        """
+        Look up an unexpired failure, marking it as the most recently used.
+
+        Args:
+            key (str): The URL that failed.
+
+        Returns:
+            Optional[NegativeEntry]: The failure, or None if there is none or it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set(self, key: str, entry: NegativeEntry) -> None:
+        """
+        Store a failure, evicting the least recently used ones if the bound is exceeded.
+
+        Args:
+            key (str): The URL that failed.
+            entry (NegativeEntry): The failure.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,424 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+from urllib.parse import unquote, urlsplit
+
+from app.cache.base import CacheEntry, CacheStats
+from app.cache.shared import COMPRESSION_LEVEL
+
+
+class RemoteCacheError(Exception):
+    """Raised when a remote cache answers a command with an error."""
+
+
+class RemoteCache(ABC):
+    """
+    Key-value store reached over the network and shared by the nodes of a deployment, holding bytes that expire after
+    their TTL.
+
+    Attributes:
+        round_trips (int): The number of requests sent to the store, each of them answered before the next is sent.
+    """
+
+    round_trips: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get the value stored under a key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[bytes]: The value, or None if there is none or it expired.
+        """
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        """
+        Get the values stored under several keys in a single round trip.
+
+        Args:
+            keys (list[str]): The keys.
+
+        Returns:
+            list[Optional[bytes]]: The value of each key, in the order of the keys, or None for those having none.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store a value under a key, replacing any other.
+
+        Args:
+            key (str): The key.
+            value (bytes): The value.
+            ttl (float): The number of seconds after which the value expires. Rounded up to the millisecond.
+        """
+
+    @abstractmethod
+    def ttl(self, key: str) -> Optional[float]:
+        """
+        Get the number of seconds the value stored under a key has left before it expires.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[float]: The remaining TTL in seconds, or None if there is no value.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Drop the value stored under a key, if any.
+
+        Args:
+            key (str): The key.
+        """
+
+
+class MemoryRemoteCache(RemoteCache):
+    """
+    In-process stand-in for a remote cache, keeping the values in a dict, for the tests and single-node setups.
+    """
+
+    def __init__(self):
+        self.round_trips = 0
+        self._values: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: str) -> Optional[tuple[bytes, float]]:
+        """The value and expiry stored under a key, dropping them if expired. The caller holds the lock."""
+        item = self._values.get(key)
+        if item is not None and item[1] <= time.time():
+            del self._values[key]
+            return None
+        return item
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        with self._lock:
+            self.round_trips += 1
+            return [item[0] if item is not None else None for item in map(self._lookup, keys)]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self.round_trips += 1
+            self._values[key] = (bytes(value), time.time() + ttl)
+
+    def ttl(self, key: str) -> Optional[float]:
+        with self._lock:
+            self.round_trips += 1
+            item = self._lookup(key)
+            return None if item is None else item[1] - time.time()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.round_trips += 1
+            self._values.pop(key, None)
+
+
+class RedisCache(RemoteCache):
+    """
+    Client of a server speaking the Redis protocol (RESP2), e.g. Redis, Valkey or KeyDB, over a single connection.
+
+    The commands of a lookup of several keys are pipelined: they are all written before any answer is read, so that
+    the lookup costs one round trip. The connection is opened on first use and again after any failure.
+
+    Args:
+        url (str): The URL of the server, e.g. `redis://:password@localhost:6379/0`.
+        timeout (float): The number of seconds to wait for the server to connect or answer before giving up.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.round_trips = 0
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _encode(*args) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            arg = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts += [b"$%d\r\n" % len(arg), arg, b"\r\n"]
+        return b"".join(parts)
+
+    def _read(self):
+        """Read one reply, returning the errors answered by the server instead of raising them."""
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection to the remote cache closed")
+        kind, value = line[:1], line[1:-2]
+        if kind == b"+":
+            return value
+        if kind == b"-":
+            return RemoteCacheError(value.decode(errors="replace"))
+        if kind == b":":
+            return int(value)
+        if kind == b"$":
+            if int(value) < 0:
+                return None
+            data = self._reader.read(int(value) + 2)
+            if len(data) < int(value) + 2:
+                raise ConnectionError("Connection to the remote cache closed")
+            return data[:-2]
+        if kind == b"*":
+            return None if int(value) < 0 else [self._read() for _ in range(int(value))]
+        raise RemoteCacheError(f"Unexpected reply from the remote cache: {line!r}")
+
+    def _connect(self) -> None:
+        """Open the connection, authenticating and selecting the database if needed. The caller holds the lock."""
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        commands = ([("AUTH", self.password)] if self.password else []) + ([("SELECT", self.db)] if self.db else [])
+        if not commands:
+            return
+        try:
+            self._send(commands)
+        except RemoteCacheError:
+            self.close()
+            raise
+
+    def _send(self, commands: list[tuple]) -> list:
+        """Write pipelined commands and read their replies. The caller holds the lock."""
+        self._socket.sendall(b"".join(self._encode(*command) for command in commands))
+        self.round_trips += 1
+        replies = [self._read() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RemoteCacheError):
+                raise reply
+        return replies
+
+    def pipeline(self, commands: list[tuple]) -> list:
+        """
+        Send several commands in a single round trip.
+
+        Args:
+            commands (list[tuple]): The commands, e.g. `[("GET", "a"), ("GET", "b")]`.
+
+        Returns:
+            list: The reply to each command, in order.
+
+        Raises:
+            RemoteCacheError: If the server answered any command with an error.
+            OSError: If the server could not be reached or did not answer in time.
+        """
+        with self._lock:
+            try:
+                if self._socket is None:
+                    self._connect()
+                return self._send(commands)
+            except OSError:
+                self.close()
+                raise
+
+    def close(self) -> None:
+        """Close the connection, if open. It is opened again on the next command."""
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = self._reader = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.pipeline([("GET", key)])[0]
+
+    def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        return self.pipeline([("GET", key) for key in keys]) if keys else []
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.pipeline([("SET", key, value, "PX", max(int(ttl * 1000 + 0.999), 1))])
+
+    def ttl(self, key: str) -> Optional[float]:
+        milliseconds = self.pipeline([("PTTL", key)])[0]
+        return None if milliseconds < 0 else milliseconds / 1000
+
+    def delete(self, key: str) -> None:
+        self.pipeline([("DEL", key)])
+
+
+def create_remote_cache(url: str, timeout: float) -> RemoteCache:
+    """
+    Create the client of the remote cache at a URL.
+
+    Args:
+        url (str): `redis://...` for a server speaking the Redis protocol, or `memory://` for the in-process stand-in.
+        timeout (float): The number of seconds to wait for the server before giving up.
+
+    Returns:
+        RemoteCache: The client.
+
+    Raises:
+        ValueError: If the scheme of the URL is not supported.
+    """
+    scheme = urlsplit(url).scheme
+    if scheme == "memory":
+        return MemoryRemoteCache()
+    if scheme == "redis":
+        return RedisCache(url, timeout)
+    raise ValueError(f"Unsupported remote cache URL: {url}")
+
+
+class RemoteEntries:
+    """
+    The upstream responses kept in a remote cache, compressed, under the URL they were fetched from.
+
+    Failures of the remote cache are never raised: lookups miss and writes are dropped. Lookups awaited by several
+    tasks in the same iteration of the event loop, e.g. by the items of a batch request, are sent together in a
+    single pipelined round trip, from a thread so that the event loop is not blocked. So are writes made from the
+    event loop, in the background.
+
+    Args:
+        backend (RemoteCache): The remote cache.
+        prefix (str): The prefix of the keys, e.g. to share a server with other applications.
+        grace (Callable[[], int]): Returns the number of seconds the entries are kept past their expiry, to be
+            revalidated or served stale.
+    """
+
+    def __init__(self, backend: RemoteCache, prefix: str, grace: Callable[[], int]):
+        self.backend = backend
+        self.prefix = prefix
+        self.grace = grace
+        self.stats = CacheStats()
+        self.errors = 0
+        self._pending: dict[str, list[asyncio.Future]] = {}
+
+    @staticmethod
+    def encode(entry: CacheEntry) -> bytes:
+        """Encode an entry as a JSON line of metadata followed by the compressed body."""
+        metadata = {
+            "headers": entry.headers,
+            "status_code": entry.status_code,
+            "expires_at": entry.expires_at,
+            "stored_at": entry.stored_at,
+        }
+        return json.dumps(metadata).encode() + b"\n" + zlib.compress(entry.content, COMPRESSION_LEVEL)
+
+    @staticmethod
+    def decode(value: Optional[bytes]) -> Optional[CacheEntry]:
+        """Decode an entry encoded by `encode`, or None if there is none or it cannot be decoded."""
+        if value is None:
+            return None
+        try:
+            metadata, content = value.split(b"\n", 1)
+            return CacheEntry(content=zlib.decompress(content), **json.loads(metadata))
+        except (ValueError, TypeError, zlib.error):
+            return None
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry.
+
+        Args:
+            key (str): The URL the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too, counted as a miss, e.g. to revalidate it.
+                Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none, it expired, or the remote cache failed.
+        """
+        return self.get_many([key], include_expired)[0]
+
+    def get_many(self, keys: list[str], include_expired: bool = False) -> list[Optional[CacheEntry]]:
+        """
+        Look up the fresh entries of several keys in a single round trip.
+
+        Args:
+            keys (list[str]): The URLs the entries were stored under.
+            include_expired (bool, optional): Return the expired entries too, counted as misses. Defaults to False.
+
+        Returns:
+            list[Optional[CacheEntry]]: The entry of each key, in the order of the keys, or None for those missing.
+        """
+        try:
+            values = self.backend.get_many([self.prefix + key for key in keys])
+        except (OSError, RemoteCacheError, ValueError):
+            self.errors += 1
+            values = [None] * len(keys)
+        entries = []
+        for entry in map(self.decode, values):
+            if entry is None or entry.is_expired():
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            entries.append(entry if entry is None or include_expired or not entry.is_expired() else None)
+        return entries
+
+    async def aget(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry along with the lookups awaited in the same iteration of the event loop.
+
+        Args:
+            key (str): The URL the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too, counted as a miss. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none, it expired, or the remote cache failed.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._flush, loop)
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        entry = await future
+        return entry if entry is None or include_expired or not entry.is_expired() else None
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Send the pending lookups in a single round trip from a thread, resolving their futures when answered, or with
+        None if the lookup failed or was cancelled.
+        """
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+
+        def resolve(lookup: asyncio.Future) -> None:
+            failed = lookup.cancelled() or lookup.exception() is not None
+            entries = [None] * len(keys) if failed else lookup.result()
+            for key, entry in zip(keys, entries):
+                for future in pending[key]:
+                    if not future.done():
+                        future.set_result(entry)
+
+        lookup = loop.run_in_executor(None, self.get_many, keys, True)
+        lookup.add_done_callback(resolve)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry until its expiry, plus the grace period, in the background if called from the event loop.
+
+        Args:
+            key (str): The URL to store the entry under.
+            entry (CacheEntry): The entry to store. Its parsed page, if any, is left out.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._set(key, entry)
+        else:
+            loop.run_in_executor(None, self._set, key, entry)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, dropping it if the remote cache fails."""
+        ttl = max(entry.expires_at - time.time(), 0) + self.grace()
+        if ttl <= 0:
+            return
+        try:
+            self.backend.set(self.prefix + key, self.encode(entry), ttl)
+        except (OSError, RemoteCacheError):
+            self.errors += 1
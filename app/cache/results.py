@@ -0,0 +1,164 @@
+import math
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from app.cache.base import CacheStats
+
+if TYPE_CHECKING:
+    from app.cache.shared import SharedCache
+
+
+def approximate_size(value: Any) -> int:
+    """
+    Approximate the number of bytes a result takes in memory, walking the dicts, lists and tuples it is made of.
+
+    Strings and numbers repeated across the result are counted every time, so the size is an upper bound of sorts.
+
+    Args:
+        value (Any): The result, e.g. the `response` dict of a service.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approximate_size(key) + approximate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(approximate_size(item) for item in value)
+    return size
+
+
+@dataclass
+class ResultEntry:
+    """
+    The data extracted by a service, along with the versions of the cached pages it was extracted from.
+
+    Args:
+        result (dict): The data returned by the extraction method of the service, e.g. `get_player_profile`.
+        versions (dict): The version of each page the service fetched (see `CacheEntry.version`), by URL.
+        size (int): The approximate number of bytes the result takes in memory.
+        expires_at (float, optional): The Unix time the first of the pages expires at, after which the entry is no
+            longer served. Defaults to never, the pages being looked up anyway.
+    """
+
+    result: dict
+    versions: dict
+    size: int
+    expires_at: float = math.inf
+
+    def is_current(self, current_version: Callable[[str], Optional[str]]) -> bool:
+        """
+        Check whether the pages the data was extracted from are still cached with the same versions.
+
+        Args:
+            current_version (Callable[[str], Optional[str]]): Returns the version of the fresh page cached for a URL,
+                or None if there is none.
+
+        Returns:
+            bool: True if the entry can be served.
+        """
+        return all(current_version(url) == version for url, version in self.versions.items())
+
+
+class ResultCache:
+    """
+    In-process LRU cache of the data extracted by the services, bounded by the number of entries and their approximate
+    size in memory.
+
+    An entry is only served while the pages it was extracted from are cached with the same versions: as soon as any
+    of them expires, is evicted or changes, the entry is dropped.
+
+    Args:
+        max_entries (int): The maximum number of entries kept.
+        max_bytes (int): The maximum approximate size of the results kept. The least recently used entries are evicted
+            to stay within both bounds, and results larger than this one are not cached at all.
+        shared (SharedCache, optional): The cache shared by the worker processes of the host, looked up when an entry
+            is missing from memory and written through, the keys being strings then. Defaults to None.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, shared: Optional["SharedCache"] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, ResultEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, current_version: Callable[[str], Optional[str]]) -> Optional[ResultEntry]:
+        """
+        Look up an entry whose pages are still cached with the same versions, marking it as the most recently used.
+        Entries missing from memory are looked up in the shared cache, if any, and kept in memory if found. The
+        versions are checked without holding the lock, so that other lookups never wait on `current_version`.
+
+        Args:
+            key (Hashable): The key the entry was stored under, e.g. the service class and its arguments.
+            current_version (Callable[[str], Optional[str]]): Returns the version of the fresh page cached for a URL,
+                or None if there is none.
+
+        Returns:
+            Optional[ResultEntry]: The entry, or None if there is none or any of its pages changed, in which case it is
+                dropped.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            current = entry.is_current(current_version)
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    if current:
+                        self._entries.move_to_end(key)
+                    else:
+                        self._remove(key)
+            if current:
+                self.stats.hits += 1
+                return entry
+        entry = self.shared.get_result(key) if self.shared is not None else None
+        if entry is not None and entry.is_current(current_version):
+            self._store(key, entry)
+            self.stats.hits += 1
+            return entry
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: Hashable, entry: ResultEntry) -> None:
+        """
+        Store an entry, in the shared cache too if any, evicting the least recently used ones if either bound is
+        exceeded.
+
+        Args:
+            key (Hashable): The key to store the entry under.
+            entry (ResultEntry): The entry to store.
+        """
+        self._store(key, entry)
+        if self.shared is not None:
+            self.shared.set_result(key, entry)
+
+    def _store(self, key: Hashable, entry: ResultEntry) -> None:
+        """Store an entry in memory, evicting the least recently used ones if either bound is exceeded."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry, if there is one, while the lock is held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
@@ -0,0 +1,282 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+import orjson
+
+from app.cache.base import CacheEntry, CacheStats
+from app.cache.results import ResultEntry
+
+# zlib level trading a little of the ratio of the highest levels for about three times their speed
+COMPRESSION_LEVEL = 6
+
+# Seconds a lookup or a write waits for a lock held by another process before giving up, as it runs on the event loop
+BUSY_TIMEOUT = 0.1
+
+# Failures of the database, or of decoding a corrupt entry, turning a lookup into a miss and a write into a no-op
+_ERRORS = (sqlite3.Error, zlib.error, ValueError, TypeError, KeyError)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    data BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO usage SELECT 0, COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE usage SET size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE usage SET size = size - OLD.size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE usage SET size = size - OLD.size;
+END;
+"""
+
+
+class SharedCache:
+    """
+    Cache kept in a SQLite database in WAL mode, shared by the worker processes of a host.
+
+    It holds the upstream responses, as the tier between the memory and the disk ones, and the data extracted by the
+    services, behind the result cache, both compressed with zlib. Readers never block the writer nor each other, and
+    the database is memory-mapped, so that a lookup costs about as much as reading the compressed entry. Each
+    process counts the lookups it made itself, so that the hit ratio is reported per worker.
+
+    Failures are never raised: a lookup the database fails, or that finds a corrupt entry, misses, and a write that
+    fails, e.g. because another process held the lock for more than `BUSY_TIMEOUT` seconds, is dropped. The total
+    size of the entries is kept up to date by triggers, so that writes do not add up the sizes of every entry.
+
+    Args:
+        path (str): The database file. It is created, along with its directory, if missing.
+        max_bytes (int): The maximum number of compressed bytes kept. The entries expiring first are deleted to stay
+            within it, and entries larger than the bound are not cached at all.
+        mmap_bytes (int, optional): The number of bytes of the database memory-mapped by each connection. Defaults to
+            256 MiB.
+    """
+
+    def __init__(self, path: str, max_bytes: int, mmap_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.mmap_bytes = mmap_bytes
+        self.stats = CacheStats()
+        self.errors = 0
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        try:
+            connection.executescript(f"BEGIN IMMEDIATE; {_SCHEMA} COMMIT;")
+        finally:
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        """The connection of the current thread, opened on first use in every thread of every process."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(f"PRAGMA mmap_size={int(self.mmap_bytes)}")
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    @property
+    def size(self) -> Optional[int]:
+        """The number of compressed bytes kept by all the processes, or None if the database failed."""
+        try:
+            return self._connection().execute("SELECT size FROM usage").fetchone()[0]
+        except sqlite3.Error:
+            self.errors += 1
+            return None
+
+    def __len__(self) -> int:
+        """The number of entries kept by all the processes, or 0 if the database failed."""
+        try:
+            return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except sqlite3.Error:
+            self.errors += 1
+            return 0
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh upstream response.
+
+        Args:
+            key (str): The key the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too, counted as a miss, instead of deleting it,
+                e.g. to revalidate it. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none, it expired, or the database failed.
+        """
+        try:
+            entry = self._decode(self._select("response", key))
+        except _ERRORS:
+            self.errors += 1
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.is_expired():
+            self.stats.misses += 1
+            if not include_expired:
+                self._delete("response", key)
+                return None
+            return entry
+        self.stats.hits += 1
+        return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh upstream response without counting the lookup, e.g. to check its version.
+
+        Args:
+            key (str): The key the entry was stored under.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if there is none, it expired, or the database failed.
+        """
+        try:
+            row = self._select("response", key)
+            return None if row is None or row[2] <= time.time() else self._decode(row)
+        except _ERRORS:
+            self.errors += 1
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an upstream response, deleting the entries expiring first if the size bound is exceeded.
+
+        Args:
+            key (str): The key to store the entry under.
+            entry (CacheEntry): The entry to store. Its parsed page, if any, is left out.
+        """
+        metadata = {
+            "headers": entry.headers,
+            "status_code": entry.status_code,
+            "expires_at": entry.expires_at,
+            "stored_at": entry.stored_at,
+        }
+        self._insert("response", key, json.dumps(metadata), zlib.compress(entry.content, COMPRESSION_LEVEL), entry)
+
+    def get_result(self, key: str) -> Optional[ResultEntry]:
+        """
+        Look up the data extracted by a service, whether its pages are unchanged or not.
+
+        Args:
+            key (str): The key the entry was stored under, e.g. the service class and its arguments.
+
+        Returns:
+            Optional[ResultEntry]: The entry, or None if there is none, any of its pages expired, or the database
+                failed.
+        """
+        try:
+            row = self._select("result", key)
+            if row is not None and row[2] > time.time():
+                metadata, result = json.loads(row[0]), orjson.loads(zlib.decompress(row[1]))
+                entry = ResultEntry(result, metadata["versions"], metadata["size"], row[2])
+                self.stats.hits += 1
+                return entry
+        except _ERRORS:
+            self.errors += 1
+        self.stats.misses += 1
+        return None
+
+    def set_result(self, key: str, entry: ResultEntry) -> None:
+        """
+        Store the data extracted by a service until the first of its pages expires, deleting the entries expiring first
+        if the size bound is exceeded. Data that cannot be encoded to JSON is not stored.
+
+        Args:
+            key (str): The key to store the entry under.
+            entry (ResultEntry): The entry to store.
+        """
+        try:
+            data = orjson.dumps(entry.result)
+        except TypeError:
+            return
+        metadata = json.dumps({"versions": entry.versions, "size": entry.size})
+        self._insert("result", key, metadata, zlib.compress(data, COMPRESSION_LEVEL), entry)
+
+    def delete(self, key: str) -> None:
+        """
+        Drop the upstream response stored under a key, if any.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        self._delete("response", key)
+
+    def clear(self) -> None:
+        """Drop every entry, responses and results alike."""
+        try:
+            self._connection().execute("DELETE FROM entries")
+        except sqlite3.Error:
+            self.errors += 1
+
+    def _select(self, kind: str, key: str) -> Optional[tuple]:
+        """The metadata, compressed data and expiry of an entry, or None if there is none."""
+        return (
+            self._connection()
+            .execute("SELECT metadata, data, expires_at FROM entries WHERE kind = ? AND key = ?", (kind, key))
+            .fetchone()
+        )
+
+    @staticmethod
+    def _decode(row: Optional[tuple]) -> Optional[CacheEntry]:
+        """The upstream response stored in a row, or None if there is no row."""
+        return None if row is None else CacheEntry(content=zlib.decompress(row[1]), **json.loads(row[0]))
+
+    def _insert(self, kind: str, key: str, metadata: str, data: bytes, entry) -> None:
+        """
+        Store an entry and delete the entries expiring first until the size bound is met, in one transaction, dropping
+        the entry if the database fails.
+        """
+        size = len(metadata) + len(data)
+        if size > self.max_bytes:
+            return
+        doomed = []
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (kind, key) DO UPDATE SET "
+                    "metadata = excluded.metadata, data = excluded.data, expires_at = excluded.expires_at, "
+                    "size = excluded.size",
+                    (kind, key, metadata, data, entry.expires_at, size),
+                )
+                total = connection.execute("SELECT size FROM usage").fetchone()[0]
+                if total > self.max_bytes:
+                    evicted = connection.execute(
+                        "SELECT kind, key, size FROM entries WHERE NOT (kind = ? AND key = ?) ORDER BY expires_at",
+                        (kind, key),
+                    )
+                    for row in evicted:
+                        if total <= self.max_bytes:
+                            break
+                        doomed.append(row[:2])
+                        total -= row[2]
+                    connection.executemany("DELETE FROM entries WHERE kind = ? AND key = ?", doomed)
+        except sqlite3.Error:
+            self.errors += 1
+            return
+        self.stats.evictions += len(doomed)
+
+    def _delete(self, kind: str, key: str) -> None:
+        """Drop an entry, if there is one."""
+        try:
+            self._connection().execute("DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key))
+        except sqlite3.Error:
+            self.errors += 1
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Hashable, Iterator, Optional
+
+from fastapi import Request, Response
+
+from app.cache.base import CacheEntry
+from app.settings import settings
+from app.utils.metrics import TimedAPIRoute, observe_refresh, observe_stale
+
+_stale_serving: ContextVar[Optional["StaleServing"]] = ContextVar("stale_serving", default=None)
+
+
+@dataclass
+class StaleServing:
+    """
+    The expired cached pages an API request accepts to be answered from, and those it was.
+
+    Args:
+        max_stale (int): The number of seconds past its expiry a cached page is still served for.
+    Attributes:
+        staleness (float): The number of seconds the stalest page served had expired for, or 0 if none was stale.
+    """
+
+    max_stale: int
+    staleness: float = field(default=0.0, init=False)
+
+    def serve(self, url: str, entry: CacheEntry) -> bool:
+        """
+        Accept to serve an expired cached page if it is not too stale, recording its staleness if so.
+
+        Args:
+            url (str): The URL of the page.
+            entry (CacheEntry): The expired cache entry of the page.
+
+        Returns:
+            bool: True if the entry is to be served as it is.
+        """
+        staleness = time.time() - entry.expires_at
+        if staleness > self.max_stale:
+            return False
+        self.staleness = max(self.staleness, staleness)
+        observe_stale(url)
+        return True
+
+
+def get_stale_serving() -> Optional[StaleServing]:
+    """Get what the current API request accepts to be answered from, or None if it is to get fresh pages only."""
+    return _stale_serving.get()
+
+
+@contextmanager
+def serving_stale(max_stale: Optional[int]) -> Iterator[Optional[StaleServing]]:
+    """
+    Accept expired cached pages in the block, up to `max_stale` seconds past their expiry, or none if it is None.
+
+    The block sees the same `StaleServing` from every task it starts, so the pages served stale to any of them are
+    recorded.
+
+    Args:
+        max_stale (int, optional): The number of seconds past its expiry a cached page is still served for.
+
+    Returns:
+        Iterator[Optional[StaleServing]]: What the block accepts, and is answered from.
+    """
+    serving = StaleServing(max_stale) if max_stale is not None else None
+    token = _stale_serving.set(serving)
+    try:
+        yield serving
+    finally:
+        _stale_serving.reset(token)
+
+
+class RefreshQueue:
+    """
+    Bounded set of refreshes running in the background, at most one per key.
+
+    Args:
+        max_size (Callable[[], int]): Returns the number of refreshes that may be pending at once. Further ones are
+            dropped, to be submitted again by the next request serving the stale pages.
+    """
+
+    def __init__(self, max_size: Callable[[], int]):
+        self.max_size = max_size
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def submit(self, key: Hashable, name: str, refresh: Callable[[], Awaitable]) -> bool:
+        """
+        Start a refresh in the background on the running event loop, unless one with the same key is pending or the
+        queue is full.
+
+        Args:
+            key (Hashable): The key identifying identical refreshes, e.g. the service class and its arguments.
+            name (str): The name the refresh is recorded under, e.g. the service class.
+            refresh (Callable[[], Awaitable]): The coroutine function refreshing the cached pages.
+
+        Returns:
+            bool: True if the refresh was started.
+        """
+        if key in self._tasks:
+            return False
+        if len(self._tasks) >= self.max_size():
+            observe_refresh(name, "dropped")
+            return False
+        self._tasks[key] = asyncio.ensure_future(self._run(name, refresh))
+        self._tasks[key].add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    @staticmethod
+    async def _run(name: str, refresh: Callable[[], Awaitable]) -> None:
+        """Run a refresh with fresh pages only, recording its outcome."""
+        _stale_serving.set(None)
+        try:
+            await refresh()
+        except Exception:
+            observe_refresh(name, "failed")
+        else:
+            observe_refresh(name, "completed")
+
+    async def join(self) -> None:
+        """Wait for the pending refreshes, those they start included."""
+        while self._tasks:
+            await asyncio.wait(list(self._tasks.values()))
+
+    def cancel(self) -> None:
+        """Cancel the pending refreshes."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+
+refresh_queue = RefreshQueue(lambda: settings.CACHE_REFRESH_QUEUE_SIZE)
+
+
+class StaleAPIRoute(TimedAPIRoute):
+    """
+    Route answered from expired cached pages when `CACHE_STALE_WHILE_REVALIDATE` is set, up to the max staleness of
+    the route, their services refreshing them in the background. Such responses get an `X-Cache-Stale` header with
+    the number of seconds the stalest page had expired for.
+
+    The max staleness of a route is set by its path in `CACHE_MAX_STALE_ROUTES`, e.g.
+    `{"/players/{player_id}/market_value": 604800}`, and defaults to `CACHE_MAX_STALE`. The pages of the streamed
+    batches are fetched while the response is sent, after its headers, so they are never served stale.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def app(request: Request) -> Response:
+            if not (settings.CACHE_ENABLE and settings.CACHE_STALE_WHILE_REVALIDATE):
+                return await handler(request)
+            with serving_stale(settings.CACHE_MAX_STALE_ROUTES.get(self.path, settings.CACHE_MAX_STALE)) as serving:
+                response = await handler(request)
+            if serving.staleness:
+                response.headers["X-Cache-Stale"] = str(int(serving.staleness))
+            return response
+
+        return app
@@ -0,0 +1,136 @@
+from dataclasses import asdict
+from typing import Optional
+
+from app.cache.base import CacheEntry
+from app.cache.disk import DiskCache
+from app.cache.memory import MemoryCache
+from app.cache.remote import RemoteEntries
+from app.cache.shared import SharedCache
+
+
+class TieredCache:
+    """
+    Cache looking up the in-memory tier first and falling back to the optional shared, disk and remote tiers, in this
+    order.
+
+    Entries found in a lower tier are promoted into the tiers above it, so that repeated lookups stay in-process.
+
+    Args:
+        memory (MemoryCache): The in-memory tier.
+        disk (DiskCache, optional): The disk tier. Defaults to None.
+        shared (SharedCache, optional): The tier shared by the worker processes of the host. Defaults to None.
+        remote (RemoteEntries, optional): The tier shared by the nodes of the deployment. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCache,
+        disk: Optional[DiskCache] = None,
+        shared: Optional[SharedCache] = None,
+        remote: Optional[RemoteEntries] = None,
+    ):
+        self.memory = memory
+        self.disk = disk
+        self.shared = shared
+        self.remote = remote
+
+    @property
+    def tiers(self) -> dict:
+        """The tiers in lookup order, by name."""
+        tiers = {"memory": self.memory, "shared": self.shared, "disk": self.disk, "remote": self.remote}
+        return {name: tier for name, tier in tiers.items() if tier is not None}
+
+    def get(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry in every tier, in order.
+
+        Args:
+            key (str): The key the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too if no tier holds a fresh one, e.g. to
+                revalidate it. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if no tier holds a fresh one (or an expired one, if included).
+        """
+        entry = None
+        for tier in self.tiers.values():
+            if entry is not None and not entry.is_expired():
+                break
+            entry = self._promote(key, entry, tier, tier.get(key, include_expired))
+        return entry
+
+    async def aget(self, key: str, include_expired: bool = False) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry in every tier, in order, like `get`, without blocking the event loop on the remote tier:
+        its lookup is sent along with the others awaited in the same iteration of the loop, from a thread.
+
+        Args:
+            key (str): The key the entry was stored under.
+            include_expired (bool, optional): Return an expired entry too if no tier holds a fresh one, e.g. to
+                revalidate it. Defaults to False.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if no tier holds a fresh one (or an expired one, if included).
+        """
+        entry = None
+        for tier in self.tiers.values():
+            if entry is not None and not entry.is_expired():
+                break
+            stored = await tier.aget(key, include_expired) if tier is self.remote else tier.get(key, include_expired)
+            entry = self._promote(key, entry, tier, stored)
+        return entry
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a fresh entry in every tier of the host, in order, without counting the lookups nor promoting the
+        entry, e.g. to check its version. The remote tier is left out, so that this never waits on the network.
+
+        Args:
+            key (str): The key the entry was stored under.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if no tier of the host holds a fresh one.
+        """
+        for tier in self.tiers.values():
+            if tier is self.remote:
+                continue
+            entry = tier.peek(key)
+            if entry is not None:
+                return entry
+        return None
+
+    def _promote(self, key: str, entry: Optional[CacheEntry], tier, stored: Optional[CacheEntry]):
+        """Keep the newer of the entry found so far and the one stored in a tier, promoting the latter if kept."""
+        if stored is None or (entry is not None and stored.stored_at <= entry.stored_at):
+            return entry
+        for upper in self.tiers.values():
+            if upper is tier:
+                break
+            upper.set(key, stored)
+        return stored
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry in every tier.
+
+        Args:
+            key (str): The key to store the entry under.
+            entry (CacheEntry): The entry to store.
+        """
+        for tier in self.tiers.values():
+            tier.set(key, entry)
+
+    def clear(self) -> None:
+        """Drop every entry from every tier but the remote one, which other nodes rely on."""
+        for tier in self.tiers.values():
+            if tier is not self.remote:
+                tier.clear()
+
+    def stats(self) -> dict:
+        """
+        Report the counters and the size of each tier.
+
+        Returns:
+            dict: The hits, misses, evictions and size in bytes (None for the remote tier), by tier.
+        """
+        return {name: {**asdict(tier.stats), "size": getattr(tier, "size", None)} for name, tier in self.tiers.items()}
@@ -1,20 +1,38 @@
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 import uvicorn
 from fastapi import FastAPI
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
-from starlette.responses import RedirectResponse
+from starlette.responses import RedirectResponse, Response
 
 from app.api.api import api_router
+from app.cache import get_response_cache, get_result_cache, refresh_queue
+from app.services.base import construction_flights, fetch_flights
 from app.settings import settings
+from app.utils.metrics import StatsCollector
+from app.utils.responses import FastJSONResponse
+from app.utils.session import close_async_client
 
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=[settings.RATE_LIMITING_FREQUENCY],
     enabled=settings.RATE_LIMITING_ENABLE,
 )
-app = FastAPI(title="Transfermarkt API")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    refresh_queue.cancel()
+    await close_async_client()
+
+
+app = FastAPI(title="Transfermarkt API", lifespan=lifespan, default_response_class=FastJSONResponse)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
@@ -26,5 +44,29 @@ def docs_redirect():
     return RedirectResponse(url="/docs")
 
 
+def cache_stats() -> dict:
+    """Report the stats of the response cache by tier, the result cache included, if the cache is enabled."""
+    if not settings.CACHE_ENABLE:
+        return {}
+    stats = get_response_cache().stats()
+    if settings.CACHE_RESULTS_ENABLE:
+        results = get_result_cache()
+        stats["results"] = {**asdict(results.stats), "size": results.size}
+    return stats
+
+
+if settings.METRICS_ENABLE:
+    REGISTRY.register(
+        StatsCollector(
+            cache_stats=cache_stats,
+            flights={"constructions": construction_flights, "fetches": fetch_flights},
+        ),
+    )
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
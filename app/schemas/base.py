@@ -1,11 +1,14 @@
-import re
 from datetime import datetime
-from typing import Optional
+from typing import Generic, Optional, TypeVar
 
-from dateutil import parser
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic.alias_generators import to_camel
 
+from app.utils.dates import parse_date
+from app.utils.numbers import parse_number
+
+T = TypeVar("T")
+
 
 class AuditMixin(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -32,12 +35,7 @@ class TransfermarktBaseModel(BaseModel):
         check_fields=False,
     )
     def parse_str_to_date(cls, v):
-        if v is None:
-            return None
-        try:
-            return parser.parse(v).date() if v else None
-        except parser.ParserError:
-            return None
+        return parse_date(v)
 
     @field_validator("points_per_game", mode="before", check_fields=False)
     def parse_str_to_float(cls, v: str) -> Optional[float]:
@@ -71,30 +69,7 @@ class TransfermarktBaseModel(BaseModel):
         check_fields=False,
     )
     def parse_str_to_int(cls, v) -> Optional[int]:
-        if v is None:
-            return None
-        if not v or not any(char.isdigit() for char in v):
-            return None
-
-        # Clean up HTML tags if present
-        if "<" in str(v):
-            matches = re.findall(r"€([\d,.]+[kmb]?)", v.lower())
-            if not matches:
-                return None
-            value_str = matches[0]
-        else:
-            value_str = v.lower().replace("€", "").replace("+", "").replace("'", "").strip()
-
-        if "k" in value_str:
-            return int(float(value_str.replace("k", "")) * 1_000)
-        elif "m" in value_str:
-            return int(float(value_str.replace("m", "")) * 1_000_000)
-        elif "bn" in value_str:
-            return int(float(value_str.replace("bn", "")) * 1_000_000_000)
-        elif "b" in value_str:
-            return int(float(value_str.replace("b", "")) * 1_000_000_000)
-        else:
-            return int(float(value_str))
+        return parse_number(v)
 
     @field_validator(
         "height",
@@ -113,4 +88,19 @@ class TransfermarktBaseModel(BaseModel):
         if v is None:
             return None
         days = "".join(filter(str.isdigit, v))
-        return int(days) if days else None
\ No newline at end of file
+        return int(days) if days else None
+
+
+class ErrorDetail(TransfermarktBaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    status_code: int
+    detail: str
+
+
+class Section(TransfermarktBaseModel, Generic[T]):
+    model_config = ConfigDict(populate_by_name=True)
+
+    result: Optional[T] = None
+    error: Optional[ErrorDetail] = None
+    duration_ms: float
@@ -0,0 +1,20 @@
+from typing import Generic, Optional
+
+from pydantic import Field
+
+from app.schemas.base import ErrorDetail, T, TransfermarktBaseModel
+from app.settings import settings
+
+
+class BatchRequest(TransfermarktBaseModel):
+    ids: list[str] = Field(min_length=1, max_length=settings.BATCH_MAX_IDS)
+
+
+class BatchItem(TransfermarktBaseModel, Generic[T]):
+    id: str
+    result: Optional[T] = None
+    error: Optional[ErrorDetail] = None
+
+
+class BatchResponse(TransfermarktBaseModel, Generic[T]):
+    results: list[BatchItem[T]]
@@ -1,8 +1,11 @@
 from app.schemas.players.achievements import PlayerAchievements as PlayerAchievements
+from app.schemas.players.full import PlayerFull as PlayerFull
 from app.schemas.players.injuries import PlayerInjuries as PlayerInjuries
 from app.schemas.players.jersey_numbers import PlayerJerseyNumbers as PlayerJerseyNumbers
 from app.schemas.players.market_value import PlayerMarketValue as PlayerMarketValue
+from app.schemas.players.market_value import PlayerMarketValueBatch as PlayerMarketValueBatch
 from app.schemas.players.profile import PlayerProfile as PlayerProfile
+from app.schemas.players.profile import PlayerProfileBatch as PlayerProfileBatch
 from app.schemas.players.search import PlayerSearch as PlayerSearch
 from app.schemas.players.stats import PlayerStats as PlayerStats
 from app.schemas.players.transfers import PlayerTransfers as PlayerTransfers
@@ -0,0 +1,28 @@
+from pydantic import ConfigDict
+from pydantic.alias_generators import to_camel
+
+from app.schemas.base import AuditMixin, Section
+from app.schemas.players.achievements import PlayerAchievements
+from app.schemas.players.injuries import PlayerInjuries
+from app.schemas.players.jersey_numbers import PlayerJerseyNumbers
+from app.schemas.players.market_value import PlayerMarketValue
+from app.schemas.players.profile import PlayerProfile
+from app.schemas.players.search import PlayerSearch
+from app.schemas.players.stats import PlayerStats
+from app.schemas.players.transfers import PlayerTransfers
+
+
+class PlayerFull(AuditMixin):
+    # Not a TransfermarktBaseModel: its field validators would apply to the sections named like the parsed fields
+    # (e.g. `market_value`).
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    id: str
+    profile: Section[PlayerProfile]
+    market_value: Section[PlayerMarketValue]
+    transfers: Section[PlayerTransfers]
+    stats: Section[PlayerStats]
+    injuries: Section[PlayerInjuries]
+    achievements: Section[PlayerAchievements]
+    jersey_numbers: Section[PlayerJerseyNumbers]
+    search: Section[PlayerSearch]
@@ -4,6 +4,7 @@ from typing import Dict, Optional
 from pydantic import RootModel, model_validator
 
 from app.schemas.base import AuditMixin, TransfermarktBaseModel
+from app.schemas.batch import BatchResponse
 
 
 class MarketValueHistory(TransfermarktBaseModel):
@@ -28,6 +29,10 @@ class PlayerRanking(RootModel):
 
 class PlayerMarketValue(TransfermarktBaseModel, AuditMixin):
     id: str
-    market_value: Optional[int]
+    market_value: Optional[int] = None
     marketValueHistory: list[MarketValueHistory]
-    ranking: PlayerRanking
+    ranking: Optional[PlayerRanking] = None
+
+
+class PlayerMarketValueBatch(BatchResponse[PlayerMarketValue]):
+    pass
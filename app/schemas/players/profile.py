@@ -5,6 +5,7 @@ from typing import Optional
 from pydantic import HttpUrl
 
 from app.schemas.base import AuditMixin, TransfermarktBaseModel
+from app.schemas.batch import BatchResponse
 
 
 class PlayerPlaceOfBirth(TransfermarktBaseModel):
@@ -77,3 +78,7 @@ class PlayerProfile(TransfermarktBaseModel, AuditMixin):
     socialMedia: Optional[list[str]]
     trainer_profile: Optional[TrainerProfile]
     relatives: Optional[list[Relatives]]
+
+
+class PlayerProfileBatch(BatchResponse[PlayerProfile]):
+    pass
@@ -23,4 +23,4 @@ class PlayerTransfer(TransfermarktBaseModel):
 class PlayerTransfers(TransfermarktBaseModel, AuditMixin):
     id: str
     transfers: List[PlayerTransfer]
-    youth_clubs: Optional[List[str]] 
\ No newline at end of file
+    youth_clubs: Optional[List[str]] = None
\ No newline at end of file
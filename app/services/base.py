@@ -1,15 +1,253 @@
+import asyncio
+import copy
+import functools
+import inspect
+import json
+import re
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Iterator, Optional, Union
+from weakref import WeakKeyDictionary
 from xml.etree import ElementTree
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from fastapi import HTTPException
 from lxml import etree
 from requests import Response, TooManyRedirects
 
-from app.utils.utils import trim
-from app.utils.xpath import Pagination
+from app.cache import (
+    CacheEntry,
+    NegativeEntry,
+    ResultEntry,
+    approximate_size,
+    get_negative_cache,
+    get_response_cache,
+    get_result_cache,
+    get_stale_serving,
+    get_ttl,
+    refresh_queue,
+)
+from app.settings import settings
+from app.utils.metrics import (
+    observe_fetch,
+    observe_negative_hit,
+    observe_parse,
+    observe_revalidation,
+    timed_extraction,
+)
+from app.utils.session import get_async_client, get_session
+from app.utils.single_flight import SingleFlight
+from app.utils.utils import iter_trimmed, replace_base_url, trim
+from app.utils.xpath import Pagination, XPathElement
+
+_prefetched_responses: ContextVar[Optional[dict]] = ContextVar("prefetched_responses", default=None)
+
+construction_flights = SingleFlight()
+
+fetch_flights = SingleFlight()
+
+_CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+_ELEMENT_CLASS_LOOKUP = etree.ElementDefaultClassLookup(element=XPathElement)
+
+
+def _html_parser(encoding: Optional[str] = None) -> etree.HTMLParser:
+    """Create an HTML parser building `XPathElement` trees, decoding the input with the given encoding if any."""
+    parser = etree.HTMLParser(encoding=encoding)
+    parser.set_element_class_lookup(_ELEMENT_CLASS_LOOKUP)
+    return parser
+
+
+_CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+# The cache entries the responses returned by `make_request` were served from or stored in, by response
+_response_entries: "WeakKeyDictionary[Union[Response, httpx.Response], CacheEntry]" = WeakKeyDictionary()
+
+
+def _conditional_headers(entry: Optional[CacheEntry]) -> dict:
+    """
+    The headers making the request for an expired entry conditional on its validators (e.g. its ETag), if
+    `CACHE_REVALIDATE_ENABLE` is set.
+    """
+    if entry is None or not settings.CACHE_REVALIDATE_ENABLE:
+        return {}
+    return {header: entry.headers[name] for name, header in _VALIDATORS.items() if name in entry.headers}
+
+
+def _get_cached_entry(url: str) -> Optional[CacheEntry]:
+    """
+    Get the entry cached for a URL, if the cache is enabled and holds one. Expired entries are returned too, to be
+    revalidated or served stale, if either is enabled.
+    """
+    if not settings.CACHE_ENABLE:
+        return None
+    include_expired = settings.CACHE_REVALIDATE_ENABLE or settings.CACHE_STALE_WHILE_REVALIDATE
+    return get_response_cache().get(url, include_expired=include_expired)
+
+
+async def _aget_cached_entry(url: str) -> Optional[CacheEntry]:
+    """
+    Get the entry cached for a URL like `_get_cached_entry`, the remote cache, if any, being looked up along with the
+    other URLs requested at the same time (e.g. by the items of a batch) in a single round trip.
+    """
+    if not settings.CACHE_ENABLE:
+        return None
+    include_expired = settings.CACHE_REVALIDATE_ENABLE or settings.CACHE_STALE_WHILE_REVALIDATE
+    return await get_response_cache().aget(url, include_expired=include_expired)
+
+
+def _entry_response(url: str, entry: CacheEntry) -> httpx.Response:
+    """Build the response served from a cache entry."""
+    response = httpx.Response(
+        entry.status_code,
+        headers=entry.headers,
+        content=entry.content,
+        request=httpx.Request("GET", url),
+    )
+    _response_entries[response] = entry
+    return response
+
+
+def _cache_response(url: str, response: Union[Response, httpx.Response]) -> None:
+    """Cache a successful response for the TTL of its URL family, keeping only the headers needed to parse it."""
+    if not settings.CACHE_ENABLE:
+        return
+    ttl = get_ttl(url)
+    if ttl <= 0:
+        return
+    now = time.time()
+    entry = CacheEntry(
+        content=response.content,
+        headers={name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers},
+        status_code=response.status_code,
+        expires_at=now + ttl,
+        stored_at=now,
+    )
+    get_response_cache().set(url, entry)
+    _response_entries[response] = entry
+
+
+def _revalidated_response(
+    url: str,
+    entry: CacheEntry,
+    response: Union[Response, httpx.Response],
+) -> Optional[httpx.Response]:
+    """
+    Handle the answer to a conditional request for an expired entry.
+
+    On a 304 Not Modified, the entry is cached again for the TTL of its URL family, with the validators of the answer,
+    and served along with the page parsed from it, if any. Any other answer is left to the caller, and None returned.
+    """
+    not_modified = response.status_code == 304
+    observe_revalidation(url, not_modified, len(entry.content))
+    if not not_modified:
+        return None
+    now, ttl = time.time(), get_ttl(url)
+    headers = {name: response.headers.get(name, entry.headers.get(name)) for name in _CACHED_HEADERS}
+    entry = CacheEntry(
+        content=entry.content,
+        headers={name: value for name, value in headers.items() if value is not None},
+        status_code=entry.status_code,
+        expires_at=now + ttl,
+        stored_at=now,
+        page=entry.page,
+    )
+    if ttl > 0:
+        get_response_cache().set(url, entry)
+    return _entry_response(url, entry)
+
+
+# Client errors that are not about the URL itself, and may well not happen again
+_TRANSIENT_STATUS_CODES = (408, 429)
+
+
+def _raise_if_failed_recently(url: str) -> None:
+    """Raise the client error a URL failed with, if the negative cache still holds it, instead of requesting it."""
+    if not settings.CACHE_ENABLE or settings.CACHE_NEGATIVE_TTL <= 0:
+        return
+    entry = get_negative_cache().get(url)
+    if entry is not None:
+        observe_negative_hit(url)
+        raise HTTPException(status_code=entry.status_code, detail=entry.detail)
+
+
+def _remember_failure(url: str, exception: HTTPException) -> HTTPException:
+    """Keep the client error of a URL in the negative cache for `CACHE_NEGATIVE_TTL` seconds, and return it."""
+    if not settings.CACHE_ENABLE or settings.CACHE_NEGATIVE_TTL <= 0:
+        return exception
+    if exception.status_code not in _TRANSIENT_STATUS_CODES:
+        entry = NegativeEntry(exception.status_code, exception.detail, time.time() + settings.CACHE_NEGATIVE_TTL)
+        get_negative_cache().set(url, entry)
+    return exception
+
+
+def _current_version(url: str) -> Optional[str]:
+    """Get the version of the fresh entry cached for a URL, or None if there is none, without counting the lookup."""
+    entry = get_response_cache().peek(url)
+    return None if entry is None else entry.version
+
+
+def _result_key(cls: type, kwargs: dict) -> str:
+    """The key the data extracted by a service is cached under, the same in every worker process."""
+    return f"{cls.__module__}.{cls.__qualname__}:{json.dumps(sorted(kwargs.items()), default=str)}"
+
+
+def _get_cached_result(key: str) -> Optional[dict]:
+    """
+    Get the data extracted by a service constructed with the same arguments, if the result cache is enabled and the
+    pages it was extracted from are still cached, fresh and unchanged.
+    """
+    if not (settings.CACHE_ENABLE and settings.CACHE_RESULTS_ENABLE):
+        return None
+    entry = get_result_cache().get(key, _current_version)
+    return None if entry is None else entry.result
+
+
+def _cache_result(tfmkt: "TransfermarktBase", result: dict) -> None:
+    """
+    Cache the data extracted by a service created by `acreate`, along with the versions of the pages it was extracted
+    from, if the result cache is enabled and all of them are cached and fresh.
+    """
+    if tfmkt._result_key is None or not (settings.CACHE_ENABLE and settings.CACHE_RESULTS_ENABLE):
+        return
+    entries = tfmkt._entries
+    if not entries or any(entry is None or entry.is_expired() for entry in entries.values()):
+        return
+    result = dict(result)
+    versions = {url: entry.version for url, entry in entries.items()}
+    expires_at = min(entry.expires_at for entry in entries.values())
+    get_result_cache().set(tfmkt._result_key, ResultEntry(result, versions, approximate_size(result), expires_at))
+
+
+def _cached_extraction(method: Callable) -> Callable:
+    """
+    Wrap the extraction method of a service so that its data is cached, and returned as it is by the instances
+    `acreate` answers from the result cache.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        """Return the cached response when answered from the result cache, else extract and cache the data."""
+        if self._from_result:
+            return self.response
+        result = method(self, *args, **kwargs)
+        _cache_result(self, result)
+        return result
+
+    return wrapper
+
+
+class _PendingRequest(Exception):
+    """Raised by `make_request` inside `acreate` when the requested URLs have not been fetched yet."""
+
+    def __init__(self, *urls: str):
+        """Keep the URLs that have to be fetched before `make_request` can answer."""
+        super().__init__(*urls)
+        self.urls = urls
 
 
 @dataclass
@@ -27,10 +265,158 @@ class TransfermarktBase:
     URL: str
     page: ElementTree = field(default_factory=lambda: None, init=False)
     response: dict = field(default_factory=lambda: {}, init=False)
+    _entries: dict = field(default_factory=lambda: {}, init=False, repr=False)
+    _result_key: Optional[str] = field(default=None, init=False, repr=False)
+    _from_result: bool = field(default=False, init=False, repr=False)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Time the public extraction methods (e.g. `get_player_profile`) defined by each service class, and cache the
+        data they extract.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute):
+                setattr(cls, name, _cached_extraction(timed_extraction(cls.__name__, attribute)))
+
+    @classmethod
+    async def acreate(cls, **kwargs) -> "TransfermarktBase":
+        """
+        Asynchronously create an instance of the service, fetching its upstream pages without blocking the event loop.
+
+        The service is constructed as usual, but every page it requests is fetched with the async HTTP client and
+        handed back to `make_request`. Whenever the construction reaches a page that was not fetched yet, it stops,
+        the page is awaited, and the construction is replayed with it. Only the code before the first request runs
+        more than once, so the pages are still parsed a single time. Pages announced together through
+        `prefetch_requests` are awaited concurrently.
+
+        Concurrent calls with the same arguments are coalesced when `SINGLE_FLIGHT_ENABLE` is set: the pages are
+        fetched and parsed once, and every caller gets its own copy of the constructed instance sharing the parsed
+        pages.
+
+        When `CACHE_RESULTS_ENABLE` is set, the data extracted by the instances created here is cached along with the
+        versions of the pages it was extracted from. As long as those pages are cached, fresh and unchanged, a call
+        with the same arguments fetches and parses nothing: it gets an instance whose extraction method returns the
+        cached data, and which has none of the other attributes set in the construction (e.g. `page`).
+
+        Args:
+            **kwargs: The arguments the service class is constructed with (e.g. `player_id`).
+
+        Returns:
+            TransfermarktBase: The constructed service instance, ready for data extraction.
+
+        Raises:
+            HTTPException: If any of the upstream requests fails, or if the service rejects the fetched page.
+        """
+        key, result_key = (cls, tuple(sorted(kwargs.items()))), _result_key(cls, kwargs)
+        result = _get_cached_result(result_key)
+        if result is not None:
+            tfmkt = cls.__new__(cls)
+            vars(tfmkt).update(kwargs, page=None, response=dict(result), _entries={}, _from_result=True)
+            return tfmkt
+        if not settings.SINGLE_FLIGHT_ENABLE:
+            tfmkt = await cls._construct(**kwargs)
+        else:
+            tfmkt = copy.copy(await construction_flights.do(key, lambda: cls._construct(**kwargs)))
+            tfmkt.response = {}
+        tfmkt._result_key = result_key
+        return tfmkt
+
+    @classmethod
+    async def _construct(cls, **kwargs) -> "TransfermarktBase":
+        """
+        Construct an instance of the service, replaying the construction until all its pages are fetched.
+
+        If any page was served stale, the service is constructed again in the background with fresh pages, which
+        refreshes them in the cache.
+        """
+        responses: dict = {}
+        while True:
+            token = _prefetched_responses.set(responses)
+            try:
+                tfmkt = cls(**kwargs)
+                break
+            except _PendingRequest as pending:
+                urls = pending.urls
+            finally:
+                _prefetched_responses.reset(token)
+            responses.update(zip(urls, await asyncio.gather(*[cls.amake_request(url) for url in urls])))
+        tfmkt._entries = {url: _response_entries.get(response) for url, response in responses.items()}
+        if any(entry is not None and entry.is_expired() for entry in tfmkt._entries.values()):
+            key = (cls, tuple(sorted(kwargs.items())))
+            refresh_queue.submit(key, cls.__name__, lambda: cls._construct(**kwargs))
+        return tfmkt
+
+    @staticmethod
+    async def amake_request(url: str) -> httpx.Response:
+        """
+        Make an asynchronous HTTP GET request to the specified URL through the shared async client.
 
-    def make_request(self, url: Optional[str] = None) -> Response:
+        Like `make_request`, a fresh cached response is returned when the response cache is enabled. An expired one
+        is returned too, without waiting for the upstream, if the current API request accepts stale pages (see
+        `StaleAPIRoute`). Concurrent requests to the same URL share a single upstream fetch when
+        `SINGLE_FLIGHT_ENABLE` is set. The lookups of the remote cache, if any, made by concurrent requests (e.g. by
+        the items of a batch) are pipelined into a single round trip.
+
+        Args:
+            url (str): The URL to make the request to.
+
+        Returns:
+            httpx.Response: An HTTP Response object containing the server's response to the request.
+
+        Raises:
+            HTTPException: If there are too many redirects, or if the server returns a client or
+                server error status code.
         """
-        Make an HTTP GET request to the specified URL.
+        _raise_if_failed_recently(url)
+        cached = await _aget_cached_entry(url)
+        if cached is not None and not cached.is_expired():
+            return _entry_response(url, cached)
+        serving = get_stale_serving()
+        if cached is not None and serving is not None and serving.serve(url, cached):
+            return _entry_response(url, cached)
+        if not settings.SINGLE_FLIGHT_ENABLE:
+            return await TransfermarktBase._fetch(url, cached)
+        return await fetch_flights.do(url, lambda: TransfermarktBase._fetch(url, cached))
+
+    @staticmethod
+    async def _fetch(url: str, cached: Optional[CacheEntry]) -> httpx.Response:
+        """
+        Fetch a URL with the async client, caching the response if it succeeded. The request is conditional if the
+        cache holds an expired entry for the URL, `cached`, which is served again if it was not modified.
+        """
+        conditional = _conditional_headers(cached)
+        status, start = None, time.perf_counter()
+        try:
+            response: httpx.Response = await get_async_client().get(
+                replace_base_url(url, settings.TRANSFERMARKT_BASE_URL),
+                headers=conditional,
+            )
+            status = response.status_code
+        except httpx.TooManyRedirects:
+            raise _remember_failure(url, HTTPException(status_code=404, detail=f"Not found for url: {url}"))
+        except httpx.ConnectError:
+            raise HTTPException(status_code=500, detail=f"Connection error for url: {url}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error for url: {url}. {e}")
+        finally:
+            observe_fetch(url, status, start)
+        revalidated = _revalidated_response(url, cached, response) if conditional else None
+        if revalidated is not None:
+            return revalidated
+        TransfermarktBase.raise_exception_for_status(response.status_code, response.reason_phrase, url)
+        _cache_response(url, response)
+        return response
+
+    def make_request(self, url: Optional[str] = None) -> Union[Response, httpx.Response]:
+        """
+        Make an HTTP GET request to the specified URL through the shared, keep-alive session.
+
+        When the instance is being created by `acreate`, the response already fetched asynchronously
+        for the URL is returned instead. If the response cache is enabled, a fresh cached response is
+        returned without contacting the upstream, and successful responses are cached. An expired
+        cached response is revalidated with a conditional request, and served again if Transfermarkt
+        answers that it was not modified.
 
         Args:
             url (str, optional): The URL to make the request to. If not provided, the class's URL
@@ -44,35 +430,82 @@ class TransfermarktBase:
                 server error status code.
         """
         url = self.URL if not url else url
+        prefetched = _prefetched_responses.get()
+        if prefetched is not None:
+            if url not in prefetched:
+                raise _PendingRequest(url)
+            return prefetched[url]
+        _raise_if_failed_recently(url)
+        cached = _get_cached_entry(url)
+        if cached is not None and not cached.is_expired():
+            return _entry_response(url, cached)
+        conditional = _conditional_headers(cached)
+        status, start = None, time.perf_counter()
         try:
-            response: Response = requests.get(
-                url=url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/113.0.0.0 "
-                        "Safari/537.36"
-                    ),
-                },
+            response: Response = get_session().get(
+                url=replace_base_url(url, settings.TRANSFERMARKT_BASE_URL),
+                headers=conditional,
+                timeout=settings.HTTP_TIMEOUT,
             )
+            status = response.status_code
         except TooManyRedirects:
-            raise HTTPException(status_code=404, detail=f"Not found for url: {url}")
+            raise _remember_failure(url, HTTPException(status_code=404, detail=f"Not found for url: {url}"))
         except ConnectionError:
             raise HTTPException(status_code=500, detail=f"Connection error for url: {url}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error for url: {url}. {e}")
-        if 400 <= response.status_code < 500:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Client Error. {response.reason} for url: {url}",
+        finally:
+            observe_fetch(url, status, start)
+        revalidated = _revalidated_response(url, cached, response) if conditional else None
+        if revalidated is not None:
+            return revalidated
+        self.raise_exception_for_status(response.status_code, response.reason, url)
+        _cache_response(url, response)
+        return response
+
+    def prefetch_requests(self, *urls: str) -> None:
+        """
+        Fetch several URLs concurrently before the construction goes on, when the instance is being created by
+        `acreate`. The responses are then returned by `make_request` without waiting.
+
+        Outside `acreate` this does nothing, and the URLs are fetched one after the other as they are requested.
+
+        Args:
+            *urls (str): The URLs the service is about to request.
+        """
+        prefetched = _prefetched_responses.get()
+        if prefetched is None:
+            return
+        pending = [url for url in urls if url not in prefetched]
+        if pending:
+            raise _PendingRequest(*pending)
+
+    @staticmethod
+    def raise_exception_for_status(status_code: int, reason: Optional[str], url: str) -> None:
+        """
+        Raise an exception if the upstream server answered with a client or server error status code.
+
+        Client errors are kept in the negative cache, if the cache is enabled, so that the URL is answered with the
+        same error without being requested again for `CACHE_NEGATIVE_TTL` seconds.
+
+        Args:
+            status_code (int): The HTTP status code of the response.
+            reason (str, optional): The reason phrase of the response.
+            url (str): The URL the response was fetched from.
+
+        Raises:
+            HTTPException: If the status code is a client (4xx) or server (5xx) error.
+        """
+        if 400 <= status_code < 500:
+            raise _remember_failure(
+                url,
+                HTTPException(status_code=status_code, detail=f"Client Error. {reason} for url: {url}"),
             )
-        elif 500 <= response.status_code < 600:
+        elif 500 <= status_code < 600:
             raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Server Error. {response.reason} for url: {url}",
+                status_code=status_code,
+                detail=f"Server Error. {reason} for url: {url}",
             )
-        return response
 
     def request_url_bsoup(self) -> BeautifulSoup:
         """
@@ -99,11 +532,33 @@ class TransfermarktBase:
         Returns:
             ElementTree: An ElementTree representing the parsed web page content for further processing.
         """
-        return etree.HTML(str(bsoup))
+        return etree.HTML(str(bsoup), parser=_html_parser())
+
+    @staticmethod
+    def convert_response_to_page(response: Union[Response, httpx.Response]) -> ElementTree:
+        """
+        Parse the raw bytes of a response straight into an ElementTree with lxml.
+
+        The charset announced in the Content-Type header is passed on to the parser. Without one, lxml
+        picks up the encoding declared in the page itself.
+
+        Args:
+            response (Response): The response holding the web page content.
+
+        Returns:
+            ElementTree: An ElementTree representing the parsed web page content for further processing.
+        """
+        charset = _CHARSET_PATTERN.search(response.headers.get("Content-Type", ""))
+        return etree.HTML(response.content, parser=_html_parser(encoding=charset.group(1) if charset else None))
 
     def request_url_page(self) -> ElementTree:
         """
-        Fetch the web page content, parse it using BeautifulSoup, and convert it to an ElementTree.
+        Fetch the web page content and parse it into an ElementTree.
+
+        The page is parsed directly from the response bytes by lxml, unless the `HTML_PARSER` setting is
+        `bs4`, in which case it is parsed by BeautifulSoup first and converted afterwards. Pages parsed
+        from a cached response are kept in the in-memory cache along with it, and reused whenever the
+        response is served from the cache again, e.g. after a 304 Not Modified.
 
         Returns:
             ElementTree: An ElementTree representing the parsed web page content for further
@@ -113,13 +568,26 @@ class TransfermarktBase:
             HTTPException: If there are too many redirects, or if the server returns a client or
                 server error status code.
         """
-        bsoup: BeautifulSoup = self.request_url_bsoup()
-        return self.convert_bsoup_to_page(bsoup=bsoup)
+        response: Response = self.make_request()
+        entry = _response_entries.get(response)
+        if entry is not None and entry.page is not None:
+            return entry.page
+        with observe_parse(settings.HTML_PARSER, len(response.content)):
+            if settings.HTML_PARSER == "bs4":
+                bsoup = BeautifulSoup(markup=response.content, features="html.parser")
+                page = self.convert_bsoup_to_page(bsoup=bsoup)
+            else:
+                page = self.convert_response_to_page(response=response)
+        if entry is not None:
+            get_response_cache().memory.keep_page(self.URL, entry, page)
+        return page
 
     def raise_exception_if_not_found(self, xpath: str):
         """
         Raise an exception if the specified XPath does not yield any results on the web page.
 
+        Like the client errors of the upstream, the exception is kept in the negative cache for the URL of the page.
+
         Args:
             xpath (str): The XPath expression to query elements on the page.
 
@@ -127,7 +595,10 @@ class TransfermarktBase:
             HTTPException: If the specified XPath query does not yield any results, indicating an invalid request.
         """
         if not self.get_text_by_xpath(xpath):
-            raise HTTPException(status_code=404, detail=f"Invalid request (url: {self.URL})")
+            raise _remember_failure(
+                self.URL,
+                HTTPException(status_code=404, detail=f"Invalid request (url: {self.URL})"),
+            )
 
     def get_list_by_xpath(self, xpath: str, remove_empty: Optional[bool] = True) -> Optional[list]:
         """
@@ -142,12 +613,22 @@ class TransfermarktBase:
             Optional[list]: A list of elements extracted from the web page based on the XPath query.
                 If remove_empty is True, empty or whitespace-only elements are filtered out.
         """
-        elements: list = self.page.xpath(xpath)
-        if remove_empty:
-            elements_valid: list = [trim(e) for e in elements if trim(e)]
-        else:
-            elements_valid: list = [trim(e) for e in elements]
-        return elements_valid or []
+        return list(self.iter_list_by_xpath(xpath, remove_empty=remove_empty))
+
+    def iter_list_by_xpath(self, xpath: str, remove_empty: Optional[bool] = True) -> Iterator[str]:
+        """
+        Lazily iterate over the elements of the web page matching the specified XPath expression, like
+        `get_list_by_xpath` does without building the list.
+
+        Args:
+            xpath (str): The XPath expression to query elements on the page.
+            remove_empty (bool, optional): If True, skip empty or whitespace-only elements. Default is True.
+
+        Returns:
+            Iterator[str]: The trimmed elements extracted from the web page based on the XPath query, each trimmed as
+                it is consumed.
+        """
+        return iter_trimmed(self.page.xpath(xpath), remove_empty=bool(remove_empty))
 
     def get_text_by_xpath(
         self,
@@ -182,11 +663,14 @@ class TransfermarktBase:
         if not element:
             return None
 
-        if isinstance(element, list):
-            element = [trim(e) for e in element if trim(e)]
+        # The elements of a node-set are trimmed here once, those of a string result when they are picked below
+        trimmed = isinstance(element, list)
+        if trimmed:
+            element = list(iter_trimmed(element))
 
         if isinstance(iloc, int):
             element = element[iloc]
+            trimmed = False
 
         if isinstance(iloc_from, int) and isinstance(iloc_to, int):
             element = element[iloc_from:iloc_to]
@@ -198,10 +682,10 @@ class TransfermarktBase:
             element = element[iloc_from:]
 
         if isinstance(join_str, str):
-            return join_str.join([trim(e) for e in element])
+            return join_str.join(element if trimmed else map(trim, element))
 
         try:
-            return trim(element[pos])
+            return element[pos] if trimmed else trim(element[pos])
         except IndexError:
             return None
 
@@ -1,11 +1,42 @@
 from dataclasses import dataclass
+from typing import Optional
+
+from lxml import etree
 
 from app.services.base import TransfermarktBase
 from app.utils.regex import REGEX_DOB
-from app.utils.utils import extract_from_url, safe_regex
+from app.utils.utils import extract_from_url, safe_regex, trim
 from app.utils.xpath import Clubs
 
 
+def _row_values(row: etree.ElementBase, xpath: str) -> list[str]:
+    """
+    Extract the text nodes or attribute values matched by an XPath expression relative to a row of the squad table.
+
+    Args:
+        row (etree.ElementBase): The table row.
+        xpath (str): The XPath expression, relative to the row.
+
+    Returns:
+        list[str]: The matched values, as plain strings holding no reference to the page.
+    """
+    return row.xpath(xpath, smart_strings=False)
+
+
+def _row_text(row: etree.ElementBase, xpath: str) -> Optional[str]:
+    """
+    Extract the text matched by an XPath expression relative to a row of the squad table.
+
+    Args:
+        row (etree.ElementBase): The table row.
+        xpath (str): The XPath expression, relative to the row.
+
+    Returns:
+        Optional[str]: The matched values joined and trimmed, or None if they are empty.
+    """
+    return trim(_row_values(row, xpath)) or None
+
+
 @dataclass
 class TransfermarktClubPlayers(TransfermarktBase):
     """
@@ -47,178 +78,69 @@ class TransfermarktClubPlayers(TransfermarktBase):
         Returns:
             list[dict]: A list of player information dictionaries.
         """
-        # Extract player rows for context
-        player_rows = self.page.xpath(Clubs.NationalPlayers.PLAYER_ROWS)
-
-        # Get basic player information
-        players_ids = [extract_from_url(url) for url in self.get_list_by_xpath(Clubs.NationalPlayers.URLS)]
-        players_names = self.get_list_by_xpath(Clubs.NationalPlayers.NAMES)
-        players_positions = self.get_list_by_xpath(Clubs.NationalPlayers.POSITIONS)
-
-        # Get DOB and age information
-        dob_age_data = self.get_list_by_xpath(Clubs.NationalPlayers.DOB_AGE)
-        players_dobs = [safe_regex(dob_age, REGEX_DOB, "dob") for dob_age in dob_age_data]
-        players_ages = [safe_regex(dob_age, REGEX_DOB, "age") for dob_age in dob_age_data]
-
-        # For national teams, every player has the nationality of the team
-        players_nationalities = [[] for _ in range(len(players_ids))]
-
-        # Get club information
-        players_current_club = self.get_list_by_xpath(Clubs.NationalPlayers.CURRENT_CLUBS)
-
-        # Get physical attributes
-        players_heights = self.get_list_by_xpath(Clubs.NationalPlayers.HEIGHTS)
-        players_foots = self.get_list_by_xpath(Clubs.NationalPlayers.FOOTS, remove_empty=False)
-
-        # Get national team statistics
-        players_intl_matches = self.get_list_by_xpath(Clubs.NationalPlayers.INTERNATIONAL_MATCHES)
-        players_goals = self.get_list_by_xpath(Clubs.NationalPlayers.GOALS)
-
-        # Get debut dates using row-by-row approach for more reliability
-        players_joined_on = []
-        for row in player_rows:
-            debut = row.xpath(Clubs.NationalPlayers.WithinRow.DEBUT)
-            players_joined_on.append(debut[0] if debut else "")
-
-        # Set national team specific fields
-        players_joined = ["National Team Debut"] * len(players_ids)
-        players_signed_from = [""] * len(players_ids)
-        players_contracts = [""] * len(players_ids)
-
-        # Get market values
-        players_marketvalues = self.get_list_by_xpath(Clubs.NationalPlayers.MARKET_VALUES)
-
-        # Get player statuses
-        players_statuses = []
-        for row in player_rows:
-            status = row.xpath(Clubs.NationalPlayers.WithinRow.STATUS)
-            players_statuses.append("; ".join(status) if status else "")
-
-        return [
-            {
-                "id": idx,
-                "name": name,
-                "position": position,
-                "dateOfBirth": dob,
-                "age": age,
-                "nationality": nationality,
-                "currentClub": current_club,
-                "height": height,
-                "foot": foot,
-                "internationalMatches": intl_matches,
-                "goals": goals,
-                "joinedOn": joined_on,
-                "joined": joined,
-                "signedFrom": signed_from,
-                "contract": contract,
-                "marketValue": market_value,
-                "status": status,
-            }
-            for
-            idx, name, position, dob, age, nationality, current_club, height, foot, intl_matches, goals, joined_on, joined, signed_from, contract, market_value, status
-            in zip(
-                players_ids,
-                players_names,
-                players_positions,
-                players_dobs,
-                players_ages,
-                players_nationalities,
-                players_current_club,
-                players_heights,
-                players_foots,
-                players_intl_matches,
-                players_goals,
-                players_joined_on,
-                players_joined,
-                players_signed_from,
-                players_contracts,
-                players_marketvalues,
-                players_statuses,
+        within = Clubs.NationalPlayers.WithinRow
+        players = []
+        for row in self.page.xpath(Clubs.NationalPlayers.PLAYER_ROWS):
+            dob_age = _row_text(row, within.DOB_AGE)
+            players.append(
+                {
+                    "id": extract_from_url(_row_text(row, within.URL)),
+                    "name": _row_text(row, within.NAME),
+                    "position": _row_text(row, within.POSITION),
+                    "dateOfBirth": safe_regex(dob_age, REGEX_DOB, "dob"),
+                    "age": safe_regex(dob_age, REGEX_DOB, "age"),
+                    # For national teams, every player has the nationality of the team
+                    "nationality": [],
+                    "currentClub": _row_text(row, within.CLUB),
+                    "height": _row_text(row, within.HEIGHT),
+                    "foot": trim(_row_values(row, within.FOOT)),
+                    "internationalMatches": _row_text(row, within.MATCHES),
+                    "goals": _row_text(row, within.GOALS),
+                    "joinedOn": next(iter(_row_values(row, within.DEBUT)), ""),
+                    "joined": "National Team Debut",
+                    "signedFrom": "",
+                    "contract": "",
+                    "marketValue": _row_text(row, within.MARKET_VALUE),
+                    "status": "; ".join(_row_values(row, within.STATUS)),
+                },
             )
-        ]
+        return players
 
     def __parse_club_players(self) -> list[dict]:
         """
         Parse player information for regular clubs from the webpage.
 
+        Each row of the squad table is read on its own, so that an empty cell leaves its field empty instead of
+        shifting the values of the following players.
+
         Returns:
             list[dict]: A list of player information dictionaries.
         """
-        page_nationalities = self.page.xpath(Clubs.Players.PAGE_NATIONALITIES)
-        page_players_infos = self.page.xpath(Clubs.Players.PAGE_INFOS)
-        page_players_signed_from = self.page.xpath(
-            Clubs.Players.Past.PAGE_SIGNED_FROM if self.past else Clubs.Players.Present.PAGE_SIGNED_FROM,
-        )
-        page_players_joined_on = self.page.xpath(
-            Clubs.Players.Past.PAGE_JOINED_ON if self.past else Clubs.Players.Present.PAGE_JOINED_ON,
-        )
-        players_ids = [extract_from_url(url) for url in self.get_list_by_xpath(Clubs.Players.URLS)]
-        players_names = self.get_list_by_xpath(Clubs.Players.NAMES)
-        players_positions = self.get_list_by_xpath(Clubs.Players.POSITIONS)
-        players_dobs = [
-            safe_regex(dob_age, REGEX_DOB, "dob") for dob_age in self.get_list_by_xpath(Clubs.Players.DOB_AGE)
-        ]
-        players_ages = [
-            safe_regex(dob_age, REGEX_DOB, "age") for dob_age in self.get_list_by_xpath(Clubs.Players.DOB_AGE)
-        ]
-        players_nationalities = [nationality.xpath(Clubs.Players.NATIONALITIES) for nationality in page_nationalities]
-        players_current_club = (
-            self.get_list_by_xpath(Clubs.Players.Past.CURRENT_CLUB) if self.past else [None] * len(players_ids)
-        )
-        players_heights = self.get_list_by_xpath(
-            Clubs.Players.Past.HEIGHTS if self.past else Clubs.Players.Present.HEIGHTS,
-        )
-        players_foots = self.get_list_by_xpath(
-            Clubs.Players.Past.FOOTS if self.past else Clubs.Players.Present.FOOTS,
-            remove_empty=False,
-        )
-        players_joined_on = ["; ".join(e.xpath(Clubs.Players.JOINED_ON)) for e in page_players_joined_on]
-        players_joined = ["; ".join(e.xpath(Clubs.Players.JOINED)) for e in page_players_infos]
-        players_signed_from = ["; ".join(e.xpath(Clubs.Players.SIGNED_FROM)) for e in page_players_signed_from]
-        players_contracts = (
-            [None] * len(players_ids) if self.past else self.get_list_by_xpath(Clubs.Players.Present.CONTRACTS)
-        )
-        players_marketvalues = self.get_list_by_xpath(Clubs.Players.MARKET_VALUES)
-        players_statuses = ["; ".join(e.xpath(Clubs.Players.STATUSES)) for e in page_players_infos if e is not None]
-
-        return [
-            {
-                "id": idx,
-                "name": name,
-                "position": position,
-                "dateOfBirth": dob,
-                "age": age,
-                "nationality": nationality,
-                "currentClub": current_club,
-                "height": height,
-                "foot": foot,
-                "joinedOn": joined_on,
-                "joined": joined,
-                "signedFrom": signed_from,
-                "contract": contract,
-                "marketValue": market_value,
-                "status": status,
-            }
-            for
-            idx, name, position, dob, age, nationality, current_club, height, foot, joined_on, joined, signed_from, contract, market_value, status,
-            in zip(
-                players_ids,
-                players_names,
-                players_positions,
-                players_dobs,
-                players_ages,
-                players_nationalities,
-                players_current_club,
-                players_heights,
-                players_foots,
-                players_joined_on,
-                players_joined,
-                players_signed_from,
-                players_contracts,
-                players_marketvalues,
-                players_statuses,
+        within = Clubs.Players.WithinRow
+        columns = within.Past if self.past else within.Present
+        players = []
+        for row in self.page.xpath(Clubs.Players.ROWS):
+            dob_age = _row_text(row, within.DOB_AGE)
+            players.append(
+                {
+                    "id": extract_from_url(_row_text(row, within.URL)),
+                    "name": _row_text(row, within.NAME),
+                    "position": _row_text(row, within.POSITION),
+                    "dateOfBirth": safe_regex(dob_age, REGEX_DOB, "dob"),
+                    "age": safe_regex(dob_age, REGEX_DOB, "age"),
+                    "nationality": _row_values(row, within.NATIONALITIES),
+                    "currentClub": _row_text(row, columns.CURRENT_CLUB) if self.past else None,
+                    "height": _row_text(row, columns.HEIGHT),
+                    "foot": trim(_row_values(row, columns.FOOT)),
+                    "joinedOn": "; ".join(_row_values(row, columns.JOINED_ON)),
+                    "joined": "; ".join(_row_values(row, within.JOINED)),
+                    "signedFrom": "; ".join(_row_values(row, columns.SIGNED_FROM)),
+                    "contract": None if self.past else _row_text(row, columns.CONTRACT),
+                    "marketValue": _row_text(row, within.MARKET_VALUE),
+                    "status": "; ".join(_row_values(row, within.STATUSES)),
+                },
             )
-        ]
+        return players
 
     def get_club_players(self) -> dict:
         """
@@ -236,4 +158,4 @@ class TransfermarktClubPlayers(TransfermarktBase):
         else:
             self.response["players"] = self.__parse_club_players()
 
-        return self.response
\ No newline at end of file
+        return self.response
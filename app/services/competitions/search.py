@@ -36,7 +36,7 @@ class TransfermarktCompetitionSearch(TransfermarktBase):
                 including its unique identifier, name, country, associated clubs, number of players,
                 total market value, mean market value, and continent.
         """
-        idx = [extract_from_url(url) for url in self.get_list_by_xpath(Competitions.Search.URLS)]
+        idx = [extract_from_url(url) for url in self.iter_list_by_xpath(Competitions.Search.URLS)]
         name = self.get_list_by_xpath(Competitions.Search.NAMES)
         country = self.get_list_by_xpath(Competitions.Search.COUNTRIES)
         clubs = self.get_list_by_xpath(Competitions.Search.CLUBS)
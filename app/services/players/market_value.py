@@ -14,6 +14,9 @@ class TransfermarktPlayerMarketValue(TransfermarktBase):
 
     Args:
         player_id (str): The unique identifier of the player.
+        history_only (bool): Whether to fetch the market value history only, skipping the HTML page holding the
+            current market value and the rankings, unless the history is empty and the page has to tell whether the
+            player exists.
 
     Attributes:
         URL (str): The URL to fetch the player's market value data.
@@ -21,15 +24,23 @@ class TransfermarktPlayerMarketValue(TransfermarktBase):
     """
 
     player_id: str = None
+    history_only: bool = False
     URL: str = "https://www.transfermarkt.com/-/marktwertverlauf/spieler/{player_id}"
     URL_MARKET_VALUE: str = "https://www.transfermarkt.com/ceapi/marketValueDevelopment/graph/{player_id}"
 
     def __post_init__(self) -> None:
         """Initialize the TransfermarktPlayerMarketValue class."""
         self.URL = self.URL.format(player_id=self.player_id)
-        self.page = self.request_url_page()
-        self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
-        self.market_value_chart = self.make_request(url=self.URL_MARKET_VALUE.format(player_id=self.player_id))
+        url_market_value = self.URL_MARKET_VALUE.format(player_id=self.player_id)
+        if not self.history_only:
+            self.prefetch_requests(self.URL, url_market_value)
+            self.page = self.request_url_page()
+            self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
+        self.market_value_chart = self.make_request(url=url_market_value)
+        if self.history_only and not json.loads(self.market_value_chart.content).get("list"):
+            # A nonexistent player gets an empty history too: only the page tells it apart from one without any
+            self.page = self.request_url_page()
+            self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
 
     def __parse_market_value_history(self) -> list:
         """
@@ -65,10 +76,13 @@ class TransfermarktPlayerMarketValue(TransfermarktBase):
         Returns:
             dict: A dictionary containing the player's unique identifier, current market value,
                 market value history, ranking, and the timestamp of when the data was last updated.
+                With `history_only`, the current market value and the ranking are left out.
         """
         self.response["id"] = self.player_id
-        self.response["marketValue"] = self.get_text_by_xpath(Players.MarketValue.CURRENT, join_str="")
         self.response["marketValueHistory"] = self.__parse_market_value_history()
+        if self.history_only:
+            return self.response
+        self.response["marketValue"] = self.get_text_by_xpath(Players.MarketValue.CURRENT, join_str="")
         self.response["ranking"] = zip_lists_into_dict(
             self.get_list_by_xpath(Players.MarketValue.RANKINGS_NAMES),
             self.get_list_by_xpath(Players.MarketValue.RANKINGS_POSITIONS),
@@ -39,10 +39,8 @@ class TransfermarktPlayerStats(TransfermarktBase):
             + self.get_list_by_xpath(Players.Stats.HEADERS),
         )
 
-        competitions_urls = self.get_list_by_xpath(Players.Stats.COMPETITIONS_URLS)
-        clubs_urls = self.get_list_by_xpath(Players.Stats.CLUBS_URLS)
-        competitions_ids = [extract_from_url(url) for url in competitions_urls]
-        clubs_ids = [extract_from_url(url) for url in clubs_urls]
+        competitions_ids = [extract_from_url(url) for url in self.iter_list_by_xpath(Players.Stats.COMPETITIONS_URLS)]
+        clubs_ids = [extract_from_url(url) for url in self.iter_list_by_xpath(Players.Stats.CLUBS_URLS)]
         stats = [
             [item for text in row.xpath(Players.Stats.DATA) if text != "\xa0" for item in text.split("\xa0/\xa0")][1:]
             for row in rows
@@ -13,19 +13,29 @@ class TransfermarktPlayerTransfers(TransfermarktBase):
 
     Args:
         player_id (str): The unique identifier of the player.
+        history_only (bool): Whether to fetch the transfer history only, skipping the HTML page holding the youth
+            clubs, unless the history is empty and the page has to tell whether the player exists.
         URL (str): The URL template for the player's transfers page on Transfermarkt.
     """
 
     player_id: str = None
+    history_only: bool = False
     URL: str = "https://www.transfermarkt.com/-/transfers/spieler/{player_id}"
     URL_TRANSFERS: str = "https://www.transfermarkt.com/ceapi/transferHistory/list/{player_id}"
 
     def __post_init__(self) -> None:
         """Initialize the TransfermarktPlayerTransfers class."""
         self.URL = self.URL.format(player_id=self.player_id)
-        self.page = self.request_url_page()
-        self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
-        self.transfer_history = self.make_request(url=self.URL_TRANSFERS.format(player_id=self.player_id))
+        url_transfers = self.URL_TRANSFERS.format(player_id=self.player_id)
+        if not self.history_only:
+            self.prefetch_requests(self.URL, url_transfers)
+            self.page = self.request_url_page()
+            self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
+        self.transfer_history = self.make_request(url=url_transfers)
+        if self.history_only and not self.transfer_history.json().get("transfers"):
+            # A nonexistent player gets an empty history too: only the page tells it apart from one without any
+            self.page = self.request_url_page()
+            self.raise_exception_if_not_found(xpath=Players.Profile.NAME)
 
     def __parse_player_transfer_history(self) -> list:
         """
@@ -97,7 +107,8 @@ class TransfermarktPlayerTransfers(TransfermarktBase):
 
         Returns:
             dict: A dictionary containing the player's unique identifier, parsed transfer history, youth clubs,
-                  and the timestamp of when the data was last updated.
+                  and the timestamp of when the data was last updated. With `history_only`, the youth clubs
+                  are left out.
         """
         self.response["id"] = self.player_id
 
@@ -107,6 +118,9 @@ class TransfermarktPlayerTransfers(TransfermarktBase):
             logging.error(f"Failed to parse transfer history for player {self.player_id}: {str(e)}")
             self.response["transfers"] = []
 
+        if self.history_only:
+            return self.response
+
         try:
             self.response["youthClubs"] = safe_split(self.get_text_by_xpath(Players.Transfers.YOUTH_CLUBS), ",")
         except Exception as e:
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,6 +7,47 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
     RATE_LIMITING_ENABLE: bool = False
     RATE_LIMITING_FREQUENCY: str = "2/3seconds"
+    HTTP_POOL_CONNECTIONS: int = 10
+    HTTP_POOL_MAXSIZE: int = 20
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_ASYNC_MAX_CONNECTIONS: int = 200
+    TRANSFERMARKT_BASE_URL: Optional[str] = None
+    HTML_PARSER: Literal["lxml", "bs4"] = "lxml"
+    SINGLE_FLIGHT_ENABLE: bool = True
+    BATCH_MAX_IDS: int = 100
+    BATCH_MAX_CONCURRENCY: int = 10
+    SECTION_TIMEOUT: float = 15.0
+    METRICS_ENABLE: bool = True
+    FAST_SERIALIZATION_ENABLE: bool = True
+    JSON_ENCODER: Literal["orjson", "json"] = "orjson"
+    STREAMING_MIN_ITEMS: int = 200
+    STREAMING_CHUNK_ITEMS: int = 50
+    CACHE_ENABLE: bool = False
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_DISK_DIR: Optional[str] = None
+    CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024
+    CACHE_SHARED_PATH: Optional[str] = None
+    CACHE_SHARED_MAX_BYTES: int = 256 * 1024 * 1024
+    CACHE_REMOTE_URL: Optional[str] = None
+    CACHE_REMOTE_TIMEOUT: float = 0.5
+    CACHE_REMOTE_PREFIX: str = "transfermarkt:"
+    CACHE_REVALIDATE_ENABLE: bool = True
+    CACHE_STALE_WHILE_REVALIDATE: bool = False
+    CACHE_MAX_STALE: int = 86400
+    CACHE_MAX_STALE_ROUTES: dict[str, int] = {}
+    CACHE_REFRESH_QUEUE_SIZE: int = 100
+    CACHE_NEGATIVE_TTL: int = 300
+    CACHE_NEGATIVE_MAX_ENTRIES: int = 10000
+    CACHE_RESULTS_ENABLE: bool = True
+    CACHE_RESULTS_MAX_ENTRIES: int = 10000
+    CACHE_RESULTS_MAX_BYTES: int = 32 * 1024 * 1024
+    CACHE_TTL_DEFAULT: int = 3600
+    CACHE_TTL_PROFILE: int = 86400
+    CACHE_TTL_KADER: int = 21600
+    CACHE_TTL_MARKTWERTVERLAUF: int = 86400
+    CACHE_TTL_CEAPI_MARKET_VALUE: int = 86400
+    CACHE_TTL_CEAPI_TRANSFER_HISTORY: int = 86400
+    CACHE_TTL_SCHNELLSUCHE: int = 3600
 
 
 settings = Settings()
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.base import ErrorDetail, Section
+from app.schemas.batch import BatchItem
+from app.settings import settings
+
+BatchFetch = Callable[[str], Awaitable[dict]]
+
+
+async def _validate(
+    fetch: Awaitable[dict],
+    model: type[BaseModel],
+) -> tuple[Optional[BaseModel], Optional[ErrorDetail]]:
+    """
+    Await a result and validate it against its schema, turning any failure into an error instead.
+
+    Failures other than an `HTTPException` or an invalid result, e.g. a scraper breaking on an unexpected page, are
+    logged and reported as a 500 error, so that they only fail their own item or section.
+    """
+    try:
+        return model.model_validate(await fetch), None
+    except HTTPException as e:
+        return None, ErrorDetail(status_code=e.status_code, detail=str(e.detail))
+    except ValidationError as e:
+        return None, ErrorDetail(status_code=500, detail=f"Invalid {model.__name__}. {e}")
+    except Exception as e:
+        logging.exception(f"Failed to fetch {model.__name__}")
+        return None, ErrorDetail(status_code=500, detail=f"Failed to fetch {model.__name__}. {type(e).__name__}")
+
+
+async def _fetch_item(id: str, fetch: BatchFetch, model: type[BaseModel], semaphore: asyncio.Semaphore) -> BatchItem:
+    """Fetch and validate the result for one ID, turning any failure into the error of the item."""
+    async with semaphore:
+        result, error = await _validate(fetch(id), model)
+    return BatchItem[model](id=id, result=result, error=error)
+
+
+async def gather_batch(ids: list[str], fetch: BatchFetch, model: type[BaseModel]) -> list[BatchItem]:
+    """
+    Fetch the results for many IDs concurrently, at most `BATCH_MAX_CONCURRENCY` at once.
+
+    A failing ID does not fail the batch: its item holds the error instead of the result. The pages the items look
+    up in the remote cache at the same time are fetched from it in a single pipelined round trip.
+
+    Args:
+        ids (list[str]): The IDs to fetch the results for.
+        fetch (BatchFetch): The coroutine function fetching the result for one ID, e.g. a single-ID route.
+        model (type[BaseModel]): The schema the results are validated against.
+
+    Returns:
+        list[BatchItem]: One item per ID, in the order of the IDs.
+    """
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+    return await asyncio.gather(*[_fetch_item(id, fetch, model, semaphore) for id in ids])
+
+
+def stream_batch(ids: list[str], fetch: BatchFetch, model: type[BaseModel]) -> StreamingResponse:
+    """
+    Fetch the results for many IDs like `gather_batch`, streaming each item as an NDJSON line as soon as it is ready.
+
+    The items are written in completion order, so the first results arrive before the slowest upstream answers.
+
+    Args:
+        ids (list[str]): The IDs to fetch the results for.
+        fetch (BatchFetch): The coroutine function fetching the result for one ID, e.g. a single-ID route.
+        model (type[BaseModel]): The schema the results are validated against.
+
+    Returns:
+        StreamingResponse: An `application/x-ndjson` response with one item per line.
+    """
+
+    async def lines() -> AsyncIterator[str]:
+        semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+        tasks = [asyncio.ensure_future(_fetch_item(id, fetch, model, semaphore)) for id in ids]
+        try:
+            for next_item in asyncio.as_completed(tasks):
+                item = await next_item
+                yield item.model_dump_json(by_alias=True, exclude_none=True) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def run_section(fetch: Awaitable[dict], model: type[BaseModel]) -> Section:
+    """
+    Run one section of a composite document, timing it and isolating its failures from the other sections.
+
+    Args:
+        fetch (Awaitable[dict]): The awaitable fetching the result of the section, e.g. a call to a route.
+        model (type[BaseModel]): The schema the result is validated against.
+
+    Returns:
+        Section: The result of the section, or its error if it raised, returned an invalid result or did not finish
+            within `SECTION_TIMEOUT` seconds, along with its duration.
+    """
+    start = time.perf_counter()
+    try:
+        result, error = await asyncio.wait_for(_validate(fetch, model), timeout=settings.SECTION_TIMEOUT)
+    except asyncio.TimeoutError:
+        result, error = None, ErrorDetail(status_code=504, detail=f"Timed out after {settings.SECTION_TIMEOUT}s")
+    return Section[model](result=result, error=error, duration_ms=(time.perf_counter() - start) * 1000)
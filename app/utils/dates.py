@@ -0,0 +1,131 @@
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from dateutil import parser
+
+MONTHS: dict[str, int] = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+
+# The texts dateutil does not find a date in, in insertion order, as keys of a dict bounded to this many
+NOT_DATES_MAX_SIZE = 1024
+_NOT_DATES: dict[str, None] = {}
+
+
+def _number(text: str, min_size: int, max_size: int) -> Optional[int]:
+    """
+    Read a number written with min_size to max_size ASCII digits.
+
+    Args:
+        text (str): The text to read.
+        min_size (int): The minimum number of digits.
+        max_size (int): The maximum number of digits.
+
+    Returns:
+        Optional[int]: The number, or None if the text is not made of that many ASCII digits.
+    """
+    if min_size <= len(text) <= max_size and text.isascii() and text.isdecimal():
+        return int(text)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_known_date(text: str) -> Optional[date]:
+    """
+    Parse a date written in one of the formats Transfermarkt emits: `Mon D, YYYY` (e.g. 'Jun 24, 1987'),
+    `YYYY-MM-DD`, `DD/MM/YYYY` or `DD.MM.YYYY`.
+
+    The results are memoized, as the same dates (e.g. the start of a season) come up again and again.
+
+    Args:
+        text (str): The stripped text of the date.
+
+    Returns:
+        Optional[date]: The date, or None if the text is not a valid date in one of these formats.
+    """
+    if "," in text:
+        parts = text.split(" ")
+        if len(parts) != 3 or not parts[1].endswith(","):
+            return None
+        year, month, day = _number(parts[2], 4, 4), MONTHS.get(parts[0].lower()), _number(parts[1][:-1], 1, 2)
+    elif "-" in text:
+        parts = text.split("-")
+        if len(parts) != 3:
+            return None
+        year, month, day = _number(parts[0], 4, 4), _number(parts[1], 2, 2), _number(parts[2], 2, 2)
+    else:
+        parts = text.split("/" if "/" in text else ".")
+        if len(parts) != 3:
+            return None
+        year, month, day = _number(parts[2], 4, 4), _number(parts[1], 1, 2), _number(parts[0], 1, 2)
+
+    # dateutil reads the years before 100 as two-digit years of the current century, which is left to it
+    if year is None or month is None or day is None or year < 100:
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _remember_not_a_date(text: str) -> None:
+    """
+    Memoize a text dateutil does not find a date in, forgetting the oldest one beyond `NOT_DATES_MAX_SIZE`.
+
+    Only the failures are worth memoizing: the same labels (e.g. 'National Team Debut') can fill a whole column of
+    dates, while the dates dateutil finds may depend on the current date.
+
+    Args:
+        text (str): The text of the date.
+    """
+    if len(_NOT_DATES) >= NOT_DATES_MAX_SIZE:
+        del _NOT_DATES[next(iter(_NOT_DATES))]
+    _NOT_DATES[text] = None
+
+
+def parse_date(text: Optional[str]) -> Optional[date]:
+    """
+    Parse a date from Transfermarkt.
+
+    The formats Transfermarkt emits are parsed directly, with the day first in `DD/MM/YYYY` and `DD.MM.YYYY`. Any
+    other text is left to `dateutil.parser.parse`, which fills the parts it does not find (e.g. the day of 'Jun 2024')
+    from the current date. The dates of the known formats and the texts dateutil fails on are memoized.
+
+    Args:
+        text (Optional[str]): The text of the date.
+
+    Returns:
+        Optional[date]: The date, or None if the text is empty or not a date.
+    """
+    if not text:
+        return None
+
+    parsed = _parse_known_date(text.strip())
+    if parsed is not None:
+        return parsed
+    if text in _NOT_DATES:
+        return None
+    try:
+        return parser.parse(text).date()
+    except (parser.ParserError, OverflowError, ValueError):
+        _remember_not_a_date(text)
+        return None
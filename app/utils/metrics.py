@@ -0,0 +1,279 @@
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from fastapi.routing import APIRoute
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from app.settings import settings
+from app.utils.utils import get_url_family
+
+FETCH_SECONDS = Histogram(
+    "transfermarkt_fetch_seconds",
+    "Latency of the requests to Transfermarkt, by URL family and status code",
+    ["family", "status"],
+)
+REVALIDATIONS = Counter(
+    "transfermarkt_revalidations",
+    "Conditional requests to Transfermarkt for expired cached responses, by URL family and outcome: not_modified (a "
+    "304, the cached body is reused) or modified",
+    ["family", "outcome"],
+)
+REVALIDATION_SAVED_BYTES = Counter(
+    "transfermarkt_revalidation_saved_bytes",
+    "Bytes of cached bodies reused on a 304 instead of being downloaded again, by URL family",
+    ["family"],
+)
+NEGATIVE_CACHE_HITS = Counter(
+    "transfermarkt_negative_cache_hits",
+    "Requests to Transfermarkt avoided by answering them with the client error their URL recently failed with, by "
+    "URL family",
+    ["family"],
+)
+STALE_PAGES = Counter(
+    "transfermarkt_stale_pages",
+    "Expired cached pages served as they are to API requests accepting stale pages, by URL family",
+    ["family"],
+)
+REFRESHES = Counter(
+    "transfermarkt_background_refreshes",
+    "Background refreshes of the services whose pages were served stale, by service class and outcome: completed, "
+    "failed, or dropped because the refresh queue was full",
+    ["service", "outcome"],
+)
+PARSE_SECONDS = Histogram(
+    "transfermarkt_parse_seconds",
+    "Time spent parsing the fetched pages, by parser",
+    ["parser"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+PARSE_BYTES = Histogram(
+    "transfermarkt_parse_bytes",
+    "Size of the parsed pages, by parser",
+    ["parser"],
+    buckets=(16_384, 65_536, 131_072, 262_144, 524_288, 1_048_576, 2_097_152, 4_194_304),
+)
+EXTRACT_SECONDS = Histogram(
+    "transfermarkt_extract_seconds",
+    "Time spent extracting the data from the parsed pages, by service class",
+    ["service"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+VALIDATE_SECONDS = Histogram(
+    "api_response_validation_seconds",
+    "Time spent validating the responses against their response model, by route",
+    ["route"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+SERIALIZE_SECONDS = Histogram(
+    "api_response_serialization_seconds",
+    "Time spent serializing the validated responses, by route",
+    ["route"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+def observe_fetch(url: str, status: Optional[int], start: float) -> None:
+    """
+    Record the latency of a request to Transfermarkt, if the metrics are enabled.
+
+    Args:
+        url (str): The URL requested.
+        status (int, optional): The status code of the response, or None if the request failed without one.
+        start (float): The `time.perf_counter()` value taken before the request was sent.
+    """
+    if settings.METRICS_ENABLE:
+        status = str(status) if status is not None else "error"
+        FETCH_SECONDS.labels(get_url_family(url), status).observe(time.perf_counter() - start)
+
+
+def observe_revalidation(url: str, not_modified: bool, size: int) -> None:
+    """
+    Record the outcome of a conditional request for an expired cached response, if the metrics are enabled.
+
+    Args:
+        url (str): The URL requested.
+        not_modified (bool): Whether Transfermarkt answered 304 Not Modified.
+        size (int): The size in bytes of the cached body, which a 304 saves downloading.
+    """
+    if settings.METRICS_ENABLE:
+        family = get_url_family(url)
+        REVALIDATIONS.labels(family, "not_modified" if not_modified else "modified").inc()
+        if not_modified:
+            REVALIDATION_SAVED_BYTES.labels(family).inc(size)
+
+
+def observe_negative_hit(url: str) -> None:
+    """
+    Record a request to Transfermarkt avoided thanks to the negative cache, if the metrics are enabled.
+
+    Args:
+        url (str): The URL that was not requested.
+    """
+    if settings.METRICS_ENABLE:
+        NEGATIVE_CACHE_HITS.labels(get_url_family(url)).inc()
+
+
+def observe_stale(url: str) -> None:
+    """
+    Record an expired cached page served as it is, if the metrics are enabled.
+
+    Args:
+        url (str): The URL of the page.
+    """
+    if settings.METRICS_ENABLE:
+        STALE_PAGES.labels(get_url_family(url)).inc()
+
+
+def observe_refresh(service: str, outcome: str) -> None:
+    """
+    Record the outcome of a background refresh, if the metrics are enabled.
+
+    Args:
+        service (str): The name of the service class refreshed.
+        outcome (str): 'completed', 'failed', or 'dropped' if the refresh queue was full.
+    """
+    if settings.METRICS_ENABLE:
+        REFRESHES.labels(service, outcome).inc()
+
+
+@contextmanager
+def observe_parse(parser: str, size: int) -> Iterator[None]:
+    """
+    Record the time spent parsing a page in the block, and the size of the page, if the metrics are enabled.
+
+    Args:
+        parser (str): The parser used, e.g. 'lxml' or 'bs4'.
+        size (int): The size of the page in bytes.
+    """
+    if not settings.METRICS_ENABLE:
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    PARSE_SECONDS.labels(parser).observe(time.perf_counter() - start)
+    PARSE_BYTES.labels(parser).observe(size)
+
+
+def timed_extraction(service: str, method: Callable) -> Callable:
+    """
+    Wrap an extraction method of a service so that its duration is recorded, if the metrics are enabled.
+
+    Args:
+        service (str): The name of the service class.
+        method (Callable): The extraction method, e.g. `get_player_profile`.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+    histogram = EXTRACT_SECONDS.labels(service)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not settings.METRICS_ENABLE:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+class _TimedResponseField:
+    """Proxy of the response field of a route, recording the time spent in its `validate` and `serialize`."""
+
+    def __init__(self, field, route: str):
+        self._field = field
+        self._validate_seconds = VALIDATE_SECONDS.labels(route)
+        self._serialize_seconds = SERIALIZE_SECONDS.labels(route)
+
+    def __getattr__(self, name: str):
+        return getattr(self._field, name)
+
+    def validate(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._field.validate(*args, **kwargs)
+        finally:
+            self._validate_seconds.observe(time.perf_counter() - start)
+
+    def serialize(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._field.serialize(*args, **kwargs)
+        finally:
+            self._serialize_seconds.observe(time.perf_counter() - start)
+
+
+class TimedAPIRoute(APIRoute):
+    """
+    Route recording the time FastAPI spends validating its response against the response model and serializing it.
+
+    Use it as the `route_class` of a router. Nothing is recorded if the metrics are disabled.
+    """
+
+    def get_route_handler(self) -> Callable:
+        if settings.METRICS_ENABLE and self.secure_cloned_response_field is not None:
+            self.secure_cloned_response_field = _TimedResponseField(self.secure_cloned_response_field, self.path)
+        return super().get_route_handler()
+
+
+class StatsCollector(Collector):
+    """
+    Expose the counters kept by the response cache and the single-flight groups, read when the metrics are scraped.
+
+    Args:
+        cache_stats (Callable[[], dict]): Returns the stats of the response cache by tier, the result cache
+            included, or an empty dict.
+        flights (dict): The single-flight groups by name.
+    """
+
+    def __init__(self, cache_stats: Callable[[], dict], flights: dict):
+        self.cache_stats = cache_stats
+        self.flights = flights
+
+    def collect(self):
+        counters = {
+            name: CounterMetricFamily(
+                f"transfermarkt_cache_{name}",
+                f"Response cache {name}, by tier, the cache of the extracted data being the results tier",
+                labels=["tier"],
+            )
+            for name in ["hits", "misses", "evictions"]
+        }
+        size = GaugeMetricFamily(
+            "transfermarkt_cache_size_bytes",
+            "Size of the response cache, by tier",
+            labels=["tier"],
+        )
+        ratio = GaugeMetricFamily(
+            "transfermarkt_cache_hit_ratio",
+            "Share of the lookups of the worker process answered by each cache tier, by tier and worker",
+            labels=["tier", "worker"],
+        )
+        for tier, stats in self.cache_stats().items():
+            for name, counter in counters.items():
+                counter.add_metric([tier], stats[name])
+            if stats["size"] is not None:
+                size.add_metric([tier], stats["size"])
+            lookups = stats["hits"] + stats["misses"]
+            ratio.add_metric([tier, str(os.getpid())], stats["hits"] / lookups if lookups else 0)
+        yield from counters.values()
+        yield size
+        yield ratio
+
+        calls = CounterMetricFamily(
+            "transfermarkt_single_flight_calls",
+            "Calls to the single-flight groups, by group and outcome: executed, or coalesced into a call in flight",
+            labels=["group", "outcome"],
+        )
+        for group, flight in self.flights.items():
+            calls.add_metric([group, "executed"], flight.stats.executed)
+            calls.add_metric([group, "coalesced"], flight.stats.coalesced)
+        yield calls
@@ -0,0 +1,96 @@
+from functools import lru_cache
+from typing import Optional, Union
+
+from app.utils.regex import REGEX_AMOUNT, REGEX_AMOUNT_IN_HTML
+
+MULTIPLIERS: dict[str, int] = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000, "bn": 1_000_000_000}
+
+_IGNORED_CHARS = str.maketrans("", "", "€+'")
+
+
+def _match_amount(text: str) -> Optional[int]:
+    """
+    Parse a number in any of the notations of Transfermarkt with `REGEX_AMOUNT`.
+
+    Args:
+        text (str): The text of the number.
+
+    Returns:
+        Optional[int]: The number, or None if the text is not in one of the notations.
+    """
+    if "<" in text:
+        match = REGEX_AMOUNT_IN_HTML.search(text)
+        if match is None:
+            return None
+        text = match["amount"]
+
+    match = REGEX_AMOUNT.fullmatch(text.translate(_IGNORED_CHARS))
+    if match is None:
+        return None
+    sign, integer, fraction, suffix = match.group("sign", "integer", "fraction", "suffix")
+    if not integer and not fraction:
+        return None
+    number = _to_int(integer.replace(",", "").replace(".", ""), fraction or "", suffix.lower() if suffix else "")
+    return -number if sign else number
+
+
+def _to_int(integer: str, fraction: str, suffix: str) -> int:
+    """
+    Compute a number from the digits of its integer part and of its fraction, and its suffix.
+
+    Args:
+        integer (str): The digits of the integer part, without separators.
+        fraction (str): The digits after the dot, read as thousands if there are three of them and no suffix.
+        suffix (str): The lowercase suffix, one of `MULTIPLIERS`.
+
+    Returns:
+        int: The number, truncated to an integer.
+    """
+    if integer.lstrip("0") and len(fraction) == 3 and not suffix:
+        integer, fraction = integer + fraction, ""
+    return int(integer + fraction) * MULTIPLIERS[suffix] // 10 ** len(fraction)
+
+
+@lru_cache(maxsize=4096)
+def _parse_amount(text: str) -> Optional[int]:
+    """
+    Parse a number in one of the notations of Transfermarkt.
+
+    The usual shapes (e.g. '€1.50m', '€500k' or "3.066'") are split with string methods, the others are matched against
+    `REGEX_AMOUNT`. The results are memoized, as the same amounts (e.g. '€1.00m') come up again and again.
+
+    Args:
+        text (str): The text of the number.
+
+    Returns:
+        Optional[int]: The number, or None if the text is not in one of the notations.
+    """
+    body = text.strip().lstrip("€+").rstrip("'")
+    suffix = "bn" if body.endswith("bn") else body[-1] if body.endswith(("k", "m", "b")) else ""
+    integer, _, fraction = body[: len(body) - len(suffix)].partition(".")
+    if integer.isdecimal() and (fraction.isdecimal() or not fraction):
+        return _to_int(integer, fraction, suffix)
+    return _match_amount(text)
+
+
+def parse_number(text: Optional[Union[str, int]]) -> Optional[int]:
+    """
+    Parse a number in one of the notations of Transfermarkt, like a market value ('€1.50m', '€500k', '€1.2bn'), a
+    number of minutes played ("3.066'") or a plain count ('12').
+
+    Commas are thousands separators, and so are the dots of a number without a suffix that are followed by three
+    digits (e.g. '3.066'). The other dots are decimal points, and the fraction of the amount is truncated, as `int`
+    does. A text with HTML markup (e.g. 'Loan fee:<br/>€1.50m') is read from its first amount in euros.
+
+    Args:
+        text (Optional[Union[str, int]]): The text of the number, or the number itself.
+
+    Returns:
+        Optional[int]: The number, or None if the text holds no number (e.g. '-' or '?') or is not in one of these
+            notations.
+    """
+    if text is None or isinstance(text, int):
+        return text
+    if text.isdecimal():
+        return int(text)
+    return _parse_amount(text)
@@ -1,17 +1,41 @@
-REGEX_DOB: str = r"^(?P<dob>.*)\s\((?P<age>\d*)\)"
-REGEX_MEMBERS_DATE: str = r"\(Score: (?P<date>.+)\)"
-REGEX_BG_COLOR: str = r"background-color:(?P<color>.+);"
-REGEX_CHART_CLUB_ID: str = r"(?P<club_id>\d+)"
-REGEX_COUNTRY_ID: str = r"(?P<id>\d)"
-REGEX_DOB_AGE: str = r"^(?P<dob>\w{3} \d{1,2}, \d{4}) \((?P<age>\d{2})\)"
+import re
 
-REGEX_CLUB_ID: str = r"/verein/(?P<club_id>\d+)"
+REGEX_DOB: re.Pattern = re.compile(r"^(?P<dob>.*)\s\((?P<age>\d*)\)")
+REGEX_MEMBERS_DATE: re.Pattern = re.compile(r"\(Score: (?P<date>.+)\)")
+REGEX_BG_COLOR: re.Pattern = re.compile(r"background-color:(?P<color>.+);")
+REGEX_CHART_CLUB_ID: re.Pattern = re.compile(r"(?P<club_id>\d+)")
+REGEX_COUNTRY_ID: re.Pattern = re.compile(r"(?P<id>\d)")
+REGEX_DOB_AGE: re.Pattern = re.compile(r"^(?P<dob>\w{3} \d{1,2}, \d{4}) \((?P<age>\d{2})\)")
+
+REGEX_CLUB_ID: re.Pattern = re.compile(r"/verein/(?P<club_id>\d+)")
 
 # For extracting player IDs from URLs like "https://www.transfermarkt.com/player-name/profil/spieler/28003"
-REGEX_PLAYER_ID: str = r"/spieler/(?P<player_id>\d+)"
+REGEX_PLAYER_ID: re.Pattern = re.compile(r"/spieler/(?P<player_id>\d+)")
 
 # For extracting manager IDs from URLs like "https://www.transfermarkt.com/manager-name/profil/trainer/5672"
-REGEX_MANAGER_ID: str = r"/trainer/(?P<manager_id>\d+)"
+REGEX_MANAGER_ID: re.Pattern = re.compile(r"/trainer/(?P<manager_id>\d+)")
 
 # For parsing dates that might appear in different formats on manager profiles
-REGEX_DATE_FORMAT: str = r"(?P<date>\w{3} \d{1,2}, \d{4}|\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2})"
\ No newline at end of file
+REGEX_DATE_FORMAT: re.Pattern = re.compile(r"(?P<date>\w{3} \d{1,2}, \d{4}|\d{2}/\d{2}/\d{4}|\d{4}-\d{2}-\d{2})")
+
+# For splitting Transfermarkt paths like "/fc-barcelona/startseite/verein/131/saison_id/2024" into their parts
+REGEX_TFMKT_URL: re.Pattern = re.compile(
+    r"/(?P<code>[\w%-]+)"
+    r"/(?P<category>[\w-]+)"
+    r"/(?P<type>[\w-]+)"
+    r"/(?P<id>\w+)"
+    r"(/saison_id/(?P<season_id>\d{4}))?"
+    r"(/transfer_id/(?P<transfer_id>\d+))?",
+)
+
+# For parsing amounts like "€1.50m", "€500k", "€1.2bn" or "3.066" (minutes played), once stripped of "€", "+" and "'"
+REGEX_AMOUNT: re.Pattern = re.compile(
+    r"\s*(?P<sign>-)?"
+    r"(?P<integer>(?:\d+(?:[,.]\d{3})*?)?)"
+    r"(?:\.(?P<fraction>\d*))?"
+    r"\s*(?P<suffix>k|m|bn|b)?\s*",
+    re.IGNORECASE,
+)
+
+# For finding the first amount of a text with HTML markup, like "Loan fee:<br/>€1.50m"
+REGEX_AMOUNT_IN_HTML: re.Pattern = re.compile(r"€(?P<amount>[\d,.]+[kmb]?)", re.IGNORECASE)
@@ -0,0 +1,155 @@
+from typing import Annotated, Any, AsyncIterator, Callable, Optional, get_args, get_origin
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.cache import StaleAPIRoute
+from app.settings import settings
+
+
+class JSONBytes(bytes):
+    """A response body already serialized to JSON by the response field of a route."""
+
+
+def _is_list(annotation: Any) -> bool:
+    """Whether a field annotation is a list, optional or not."""
+    return get_origin(annotation) is list or any(get_origin(arg) is list for arg in get_args(annotation))
+
+
+class JSONChunks:
+    """
+    A response body serialized to JSON by the response field of a route piece by piece, as it is sent.
+
+    The body is the validated response model, whose longest list is serialized `STREAMING_CHUNK_ITEMS` items at a time
+    between the JSON of the fields before and after it.
+
+    Args:
+        head (bytes): The JSON of the fields before the list, its key and the opening bracket.
+        items (list): The items of the list.
+        adapter (TypeAdapter): The type adapter of the list, serializing the chunks of items.
+        tail (bytes): The closing bracket and the JSON of the fields after the list.
+        options (dict): The options of the serialization, e.g. `by_alias`.
+    """
+
+    def __init__(self, head: bytes, items: list, adapter: TypeAdapter, tail: bytes, options: dict):
+        self.head = head
+        self.items = items
+        self.adapter = adapter
+        self.tail = tail
+        self.options = options
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.head
+        size = settings.STREAMING_CHUNK_ITEMS
+        for start in range(0, len(self.items), size):
+            # The chunk is serialized as a list, whose brackets are dropped in favour of the separating comma
+            chunk = self.adapter.dump_json(self.items[start : start + size], **self.options)
+            yield (b"," if start else b"") + chunk[1:-1]
+        yield self.tail
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoding its content with orjson, unless `JSON_ENCODER` is `json`."""
+
+    def render(self, content: Any) -> bytes:
+        if settings.JSON_ENCODER == "orjson":
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+class DumpJSONResponse(FastJSONResponse):
+    """
+    JSON response sending the bodies serialized by the response field as they are, streaming those serialized in
+    chunks, and encoding the others.
+    """
+
+    def __new__(cls, content: Any = None, *args, **kwargs):
+        # The bodies serialized in chunks are sent with a chunked transfer encoding, without a length known beforehand
+        if isinstance(content, JSONChunks):
+            return StreamingResponse(content, *args, media_type=cls.media_type, **kwargs)
+        return super().__new__(cls)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, JSONBytes):
+            return content
+        return super().render(content)
+
+
+class _DumpJSONResponseField:
+    """
+    Proxy of the response field of a route, serializing the validated response model straight to JSON.
+
+    FastAPI serializes the response model to Python objects, which the response class then encodes to JSON with the
+    `json` module. The model is dumped to JSON bytes by pydantic in one go instead, with the same options.
+    """
+
+    def __init__(self, field):
+        self._field = field
+        self._type_adapter = TypeAdapter(Annotated[field.field_info.annotation, field.field_info])
+        self._list_adapters = {}
+        annotation = field.field_info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            self._list_adapters = {
+                name: TypeAdapter(info.annotation)
+                for name, info in annotation.model_fields.items()
+                if _is_list(info.annotation)
+            }
+
+    def __getattr__(self, name: str):
+        return getattr(self._field, name)
+
+    def serialize(self, value: Any, *, mode: str = "json", **kwargs) -> Any:
+        if mode != "json" or not settings.FAST_SERIALIZATION_ENABLE:
+            return self._field.serialize(value, mode=mode, **kwargs)
+        return self._serialize_chunks(value, **kwargs) or JSONBytes(self._type_adapter.dump_json(value, **kwargs))
+
+    def _serialize_chunks(self, value: Any, include=None, exclude=None, **options) -> Optional[JSONChunks]:
+        """
+        Serialize the response model in chunks, if its longest list has at least `STREAMING_MIN_ITEMS` items.
+
+        Returns:
+            JSONChunks: The body to stream, or None if it is to be serialized at once, as are the responses with
+                `include` or `exclude` options, which would apply to the list too.
+        """
+        if not isinstance(value, BaseModel) or include is not None or exclude is not None:
+            return None
+        lists = [(len(items), name) for name in self._list_adapters if isinstance(items := getattr(value, name), list)]
+        if not lists or max(lists)[0] < settings.STREAMING_MIN_ITEMS:
+            return None
+
+        name = max(lists)[1]
+        names = list(type(value).model_fields)
+        before, after = set(names[: names.index(name)]), set(names[names.index(name) + 1 :])
+        field = type(value).model_fields[name]
+        key = (field.serialization_alias or field.alias or name) if options.get("by_alias") else name
+        # The fields before and after the list are serialized as objects of their own, spliced around it
+        head = self._type_adapter.dump_json(value, include=before, **options)[:-1]
+        tail = self._type_adapter.dump_json(value, include=after, **options)[1:]
+        head += (b"," if len(head) > 1 else b"") + orjson.dumps(key) + b":["
+        tail = b"]" + (b"," if len(tail) > 1 else b"") + tail
+        return JSONChunks(head, getattr(value, name), self._list_adapters[name], tail, options)
+
+
+class DumpJSONAPIRoute(StaleAPIRoute):
+    """
+    Route serializing its response model straight to JSON, unless `FAST_SERIALIZATION_ENABLE` is off, recording the
+    time spent doing so like `TimedAPIRoute`, and answered from stale cached pages like `StaleAPIRoute`.
+
+    The response is still validated against the response model, once, which parses the texts extracted by the services
+    (e.g. the dates and market values). Only its serialization is shortened. Responses whose longest list has at least
+    `STREAMING_MIN_ITEMS` items (e.g. a large squad) are streamed, their list serialized a chunk of items at a time,
+    so that the whole body is never held in memory at once; the time recorded for their serialization leaves out that
+    of the chunks. Responses returned as `Response` objects (e.g. the streamed batches) are sent as they are, as with
+    any route.
+    """
+
+    def get_route_handler(self) -> Callable:
+        # Routes with a response class of their own are left to it, as it would not know what to do with the bytes. The
+        # routes of a router are copied when it is included, along with the response class set here.
+        default_class = isinstance(self.response_class, DefaultPlaceholder) or self.response_class is DumpJSONResponse
+        if self.secure_cloned_response_field is not None and default_class:
+            self.secure_cloned_response_field = _DumpJSONResponseField(self.secure_cloned_response_field)
+            self.response_class = DumpJSONResponse
+        return super().get_route_handler()
@@ -0,0 +1,78 @@
+import asyncio
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.settings import settings
+
+HEADERS: dict = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/113.0.0.0 "
+        "Safari/537.36"
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session shared by all the Transfermarkt services.
+
+    The session keeps connections alive between requests, so consecutive scrapes to the same host reuse the
+    already established TCP+TLS connection instead of opening a new one each time.
+
+    Returns:
+        requests.Session: A session with a connection pool of `HTTP_POOL_MAXSIZE` connections per host, for up to
+            `HTTP_POOL_CONNECTIONS` different hosts.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+    )
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the HTTP client shared by all the async fetches running on the current event loop.
+
+    An `httpx.AsyncClient` is bound to the event loop it was first used on, so one client is kept per loop. Within a
+    loop, the client keeps up to `HTTP_POOL_MAXSIZE` idle connections alive and allows up to
+    `HTTP_ASYNC_MAX_CONNECTIONS` requests in flight at once.
+
+    Returns:
+        httpx.AsyncClient: The client for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=settings.HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_POOL_MAXSIZE,
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the async HTTP client of the current event loop, if one was opened."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """
+    Counters of a single-flight group.
+
+    Attributes:
+        executed (int): Calls that ran the work themselves.
+        coalesced (int): Calls that joined a call with the same key already in flight and shared its result.
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls with the same key, so that the work runs once and every caller shares its
+    result (or its exception).
+
+    The work runs in a task of its own, so a caller being cancelled does not cancel it for the others. Once the work
+    is done the key is released, and the next call runs it again: results are not cached.
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the work, or join the call with the same key already in flight on the running event loop.
+
+        Args:
+            key (Hashable): The key identifying identical calls, e.g. the upstream URL.
+            work (Callable[[], Awaitable[T]]): The coroutine function to run if no call is in flight for the key.
+
+        Returns:
+            T: The result of the work.
+        """
+        task = self._tasks.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.stats.coalesced += 1
+        else:
+            task = asyncio.ensure_future(work())
+            task.add_done_callback(lambda done: self._release(key, done))
+            self._tasks[key] = task
+            self.stats.executed += 1
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task, retrieving its exception in case every caller was cancelled before it ended."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
@@ -1,5 +1,10 @@
 import re
-from typing import Optional, Union
+from typing import Iterable, Iterator, Optional, Union
+from urllib.parse import urlsplit
+
+from app.utils.regex import REGEX_TFMKT_URL
+
+_TFMKT_BASE_URL_PATTERN = re.compile(r"^https?://(www\.)?transfermarkt\.[a-z.]+")
 
 
 def zip_lists_into_dict(list_keys: list, list_values: list) -> dict:
@@ -18,7 +23,7 @@ def zip_lists_into_dict(list_keys: list, list_values: list) -> dict:
 
 def extract_from_url(tfmkt_url: Optional[str], element: str = "id") -> Optional[str]:
     """
-    Extract a specific element from a Transfermarkt URL using regular expressions.
+    Extract a specific element from a Transfermarkt URL, matched against `REGEX_TFMKT_URL`.
 
     Args:
         tfmkt_url (str): The Transfermarkt URL from which to extract the element.
@@ -30,20 +35,26 @@ def extract_from_url(tfmkt_url: Optional[str], element: str = "id") -> Optional[
     if not tfmkt_url:
         return None
 
-    regex: str = (
-        r"/(?P<code>[\w%-]+)"
-        r"/(?P<category>[\w-]+)"
-        r"/(?P<type>[\w-]+)"
-        r"/(?P<id>\w+)"
-        r"(/saison_id/(?P<season_id>\d{4}))?"
-        r"(/transfer_id/(?P<transfer_id>\d+))?"
-    )
-
-    try:
-        groups: dict = re.match(regex, trim(tfmkt_url)).groupdict()
-    except TypeError:
-        return None
-    return groups.get(element)
+    match = REGEX_TFMKT_URL.match(trim(tfmkt_url))
+    return match.groupdict().get(element) if match else None
+
+
+def replace_base_url(url: str, base_url: Optional[str]) -> str:
+    """
+    Point a Transfermarkt URL to a different host, keeping its path and query string.
+
+    Args:
+        url (str): The Transfermarkt URL (e.g. 'https://www.transfermarkt.com/-/profil/spieler/28003').
+        base_url (str, optional): The scheme and host to use instead (e.g. 'http://localhost:8001'). If not
+            provided, the URL is returned unchanged.
+
+    Returns:
+        str: The URL with its Transfermarkt scheme and host replaced by the base URL.
+    """
+    if not base_url:
+        return url
+
+    return _TFMKT_BASE_URL_PATTERN.sub(base_url.rstrip("/"), url)
 
 
 def trim(text: Union[list, str]) -> str:
@@ -62,13 +73,28 @@ def trim(text: Union[list, str]) -> str:
     return text.strip().replace("\xa0", "")
 
 
-def safe_regex(text: Optional[Union[str, list]], regex, group: str) -> Optional[str]:
+def iter_trimmed(texts: Iterable[Union[list, str]], remove_empty: bool = True) -> Iterator[str]:
+    """
+    Lazily trim each text of an iterable, as `trim` does, trimming every text exactly once.
+
+    Args:
+        texts (Iterable[Union[list, str]]): The texts or lists of text to be trimmed, e.g. the result of an XPath query.
+        remove_empty (bool, optional): If True, skip the texts that are empty once trimmed. Default is True.
+
+    Returns:
+        Iterator[str]: The trimmed and cleaned texts, in order, computed as they are consumed.
+    """
+    trimmed = map(trim, texts)
+    return filter(None, trimmed) if remove_empty else trimmed
+
+
+def safe_regex(text: Optional[Union[str, list]], regex: Union[str, re.Pattern], group: str) -> Optional[str]:
     """
     Safely apply a regular expression and extract a specific group from the matched text.
 
     Args:
         text (Optional[str]): The text to apply the regular expression to.
-        regex: The regular expression pattern.
+        regex (Union[str, re.Pattern]): The regular expression, preferably compiled (e.g. one of `app.utils.regex`).
         group (str): The name of the group to extract.
 
     Returns:
@@ -77,11 +103,12 @@ def safe_regex(text: Optional[Union[str, list]], regex, group: str) -> Optional[
     if not isinstance(text, (str, list)) or not text:
         return None
 
-    try:
-        groups = re.search(regex, trim(text)).groupdict()
-        return groups.get(group)
-    except AttributeError:
+    if not isinstance(regex, re.Pattern):
+        regex = re.compile(regex)
+    match = regex.search(trim(text))
+    if match is None or group not in regex.groupindex:
         return None
+    return match[group]
 
 
 def remove_str(text: Optional[str], strings_to_remove: Union[str, list]) -> Optional[str]:
@@ -138,3 +165,35 @@ def to_camel_case(headers: list) -> list:
     camel_case_headers = [header[0].lower() + header[1:] for header in camel_case_headers]
 
     return [header for header in camel_case_headers]
+
+
+CEAPI_URL_FAMILIES: dict = {
+    "marketValueDevelopment": "ceapi_market_value",
+    "transferHistory": "ceapi_transfer_history",
+}
+
+
+def get_url_family(url: str) -> str:
+    """
+    Classify a Transfermarkt URL by the kind of page it points to.
+
+    Page URLs are classified by their section (e.g. 'kader' for '/-/kader/verein/131'), with 'profil' mapped to
+    'profile'. The ceapi JSON endpoints and the quick search get a family of their own.
+
+    Args:
+        url (str): The Transfermarkt URL to classify.
+
+    Returns:
+        str: The URL family, e.g. 'profile', 'kader', 'marktwertverlauf', 'ceapi_market_value',
+            'ceapi_transfer_history' or 'schnellsuche'.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if not segments:
+        return "other"
+    if segments[0] == "ceapi":
+        return CEAPI_URL_FAMILIES.get(segments[1] if len(segments) > 1 else "", "ceapi")
+    if segments[0] == "schnellsuche":
+        return "schnellsuche"
+    if len(segments) < 2:
+        return "other"
+    return "profile" if segments[1] == "profil" else segments[1]
@@ -1,3 +1,41 @@
+from functools import lru_cache
+
+from lxml import etree
+
+
+@lru_cache(maxsize=None)
+def compile_xpath(xpath: str, smart_strings: bool = True) -> etree.XPath:
+    """
+    Compile an XPath expression, memoizing the result so that each expression is only compiled once per process.
+
+    Args:
+        xpath (str): The XPath expression to compile.
+        smart_strings (bool, optional): If False, the string results are plain `str`, cheaper to build than the
+            default ones, which keep a reference to the element they come from. Default is True.
+
+    Returns:
+        etree.XPath: The compiled expression, callable with the element to evaluate it against.
+    """
+    return etree.XPath(xpath, smart_strings=smart_strings)
+
+
+class XPathElement(etree.ElementBase):
+    """
+    Element class of the parsed web pages, evaluating `xpath` queries through the compiled expressions.
+
+    lxml compiles the expression passed to `_Element.xpath` again on every call. Pages are parsed into this class
+    instead, so that both the queries on the page and the per-row queries on the elements it returns reuse the
+    expression compiled by `compile_xpath`.
+    """
+
+    def xpath(self, _path: str, **_variables):
+        """Evaluate the XPath expression against this element, see `lxml.etree._Element.xpath`."""
+        if _variables.keys() & {"namespaces", "extensions"}:
+            return super().xpath(_path, **_variables)
+        smart_strings = _variables.pop("smart_strings", True)
+        return compile_xpath(_path, smart_strings)(self, **_variables)
+
+
 class Players:
     class Injuries:
         RESULTS = "//div[@id='yw1']//tbody//tr"
@@ -152,91 +190,57 @@ class Clubs:
         TEAM_NAME = "//h1[@class='data-header__headline-wrapper data-header__headline-wrapper--oswald']//text()"
         TEAM_URL = "//li[@id='overview']//@href"
 
-        # Player rows
-        PLAYER_ROWS = "//table[@class='items']//tbody//tr"
-
-        # Player basic info - name, URL and position are correctly structured
-        NAMES = "//table[@class='inline-table']//td[@class='hauptlink']//a//text()"
-        URLS = "//table[@class='inline-table']//td[@class='hauptlink']//a//@href"
-        POSITIONS = "//table[@class='inline-table']//tr[2]//td//text()"
-
-        # Player details - column indexing with proper parent context
-        DOB_AGE = "//table[@class='items']//tbody//tr//td[3]//text()"  # Format: "Nov 6, 2001 (23)"
-
-        # Club information - needs to target the title attribute in the anchor
-        CURRENT_CLUBS = "//table[@class='items']//tbody//tr//td[4]//a/@title"
-        CURRENT_CLUB_URLS = "//table[@class='items']//tbody//tr//td[4]//a/@href"
-
-        # Physical attributes
-        HEIGHTS = "//table[@class='items']//tbody//tr//td[5]//text()"
-        FOOTS = "//table[@class='items']//tbody//tr//td[6]//text()"
-
-        # National team specifics
-        INTERNATIONAL_MATCHES = "//table[@class='items']//tbody//tr//td[7]//text()"
-        GOALS = "//table[@class='items']//tbody//tr//td[8]//text()"
-        JOINED_ON = ".//td[9]/text()"
-
-        # Market values
-        MARKET_VALUES = "//table[@class='items']//tbody//tr//td[10]//a//text()"
-
-        # Status indicators (injuries, captain)
-        STATUSES = "//table[@class='inline-table']//td[@class='hauptlink']//a//span[contains(@class, 'verletzt-table') or contains(@class, 'kapitaenicon-table')]/@title"
-
-        # Nationality flags - may appear elsewhere in the page
-        NATIONALITY = ".//img[@class='flaggenrahmen']/@title"
-
-        # Jersey numbers
-        JERSEY_NUMBERS = "//td[contains(@class, 'rueckennummer')]/div[@class='rn_nummer']/text()"
-
-        # Position categories
-        POSITION_CATEGORIES = "//td[contains(@class, 'rueckennummer')]/@title"
+        # Player rows, direct children of the body only: the player cell nests a table of its own
+        PLAYER_ROWS = "//table[@class='items']/tbody/tr[td/table[@class='inline-table']]"
 
         # For relative XPath within each player row context
         class WithinRow:
-            NAME = ".//table[@class='inline-table']//td[@class='hauptlink']//a//text()"
-            POSITION = ".//table[@class='inline-table']//tr[2]//td//text()"
-            DOB_AGE = ".//td[3]//text()"
-            CLUB = ".//td[4]//a/@title"
-            HEIGHT = ".//td[5]//text()"
-            FOOT = ".//td[6]//text()"
-            MATCHES = ".//td[7]//text()"
-            GOALS = ".//td[8]//text()"
-            DEBUT = ".//td[9]/text()"
-            MARKET_VALUE = ".//td[10]//a//text()"
+            URL = "td/table[@class='inline-table']//td[@class='hauptlink']//a/@href"
+            NAME = "td/table[@class='inline-table']//td[@class='hauptlink']//a//text()"
+            POSITION = "td/table[@class='inline-table']//tr[2]//td//text()"
+            DOB_AGE = "td[3]//text()"  # Format: "Nov 6, 2001 (23)"
+            CLUB = "td[4]//a/@title"
+            HEIGHT = "td[5]//text()"
+            FOOT = "td[6]//text()"
+            MATCHES = "td[7]//text()"
+            GOALS = "td[8]//text()"
+            DEBUT = "td[9]/text()"
+            MARKET_VALUE = "td[10]//a//text()"
             STATUS = ".//span[contains(@class, 'verletzt-table') or contains(@class, 'kapitaenicon-table')]/@title"
-            JERSEY_NUMBER = ".//td[1]/div[@class='rn_nummer']/text()"
-            POSITION_CATEGORY = ".//td[1]/@title"
+            JERSEY_NUMBER = "td[1]/div[@class='rn_nummer']/text()"
+            POSITION_CATEGORY = "td[1]/@title"
 
     class Players:
         PAST_FLAG = "//div[@id='yw1']//thead//text()"
         CLUB_NAME = "//header//h1//text()"
         CLUB_URL = "//li[@id='overview']//@href"
-        PAGE_NATIONALITIES = "//td[img[@class='flaggenrahmen']]"
-        PAGE_INFOS = "//td[@class='posrela']"
-        NAMES = "//td[@class='posrela']//a//text()"
-        URLS = "//td[@class='hauptlink']//@href"
-        POSITIONS = "//td[@class='posrela']//tr[2]//text()"
-        DOB_AGE = "//div[@id='yw1']//td[3]//text()"
-        NATIONALITIES = ".//img//@title"
-        JOINED = ".//span/node()/@title"
-        SIGNED_FROM = ".//a//img//@title"
-        MARKET_VALUES = "//td[@class='rechts hauptlink']//text()"
-        STATUSES = ".//td[@class='hauptlink']//span//@title"
-        JOINED_ON = ".//text()"
-
-        class Present:
-            PAGE_SIGNED_FROM = "//div[@id='yw1']//td[8]"
-            PAGE_JOINED_ON = "//div[@id='yw1']//td[7]"
-            HEIGHTS = "//div[@id='yw1']//td[5]//text()"
-            FOOTS = "//div[@id='yw1']//td[6]//text()"
-            CONTRACTS = "//div[@id='yw1']//td[9]//text()"
-
-        class Past:
-            PAGE_SIGNED_FROM = "//div[@id='yw1']//td[9]"
-            PAGE_JOINED_ON = "//div[@id='yw1']//td[8]"
-            CURRENT_CLUB = "//div[@id='yw1']//td[5]//img//@title"
-            HEIGHTS = "//div[@id='yw1']//td[6]/text()"
-            FOOTS = "//div[@id='yw1']//td[7]//text()"
+        # Direct children of the body only: the player cell nests a table of its own
+        ROWS = "//div[@id='yw1']//table[@class='items']/tbody/tr[td[@class='posrela']]"
+
+        # Relative to a row of ROWS, the second cell holding the player's own table
+        class WithinRow:
+            URL = "td[2]//td[@class='hauptlink']//@href"
+            NAME = "td[2]//a//text()"
+            POSITION = "td[2]//tr[2]//text()"
+            DOB_AGE = "td[3]//text()"
+            NATIONALITIES = "td[4]//img//@title"
+            JOINED = "td[2]//span/node()/@title"
+            MARKET_VALUE = "td[10]//text()"
+            STATUSES = "td[2]//td[@class='hauptlink']//span//@title"
+
+            class Present:
+                HEIGHT = "td[5]//text()"
+                FOOT = "td[6]//text()"
+                JOINED_ON = "td[7]//text()"
+                SIGNED_FROM = "td[8]//a//img//@title"
+                CONTRACT = "td[9]//text()"
+
+            class Past:
+                CURRENT_CLUB = "td[5]//img//@title"
+                HEIGHT = "td[6]/text()"
+                FOOT = "td[7]//text()"
+                JOINED_ON = "td[8]//text()"
+                SIGNED_FROM = "td[9]//a//img//@title"
 
     class Managers:
         # Main table selector
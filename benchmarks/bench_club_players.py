@@ -0,0 +1,171 @@
+"""
+Compare the squad extraction of `TransfermarktClubPlayers` reading the page column by column (the previous
+behaviour) and row by row.
+
+The column-wise extraction below is the previous implementation: one document-wide XPath query per field, zipped
+together afterwards. The row-wise one is the service's: a single query for the rows of the squad table, then
+relative queries within each row. Both are run against the club squad page (40 players) and the national team page
+(80 players) of `benchmarks/corpus`, counting the XPath queries evaluated against the whole document and timing the
+extraction.
+
+Usage:
+    python -m benchmarks.bench_club_players -n 200
+"""
+
+import argparse
+import time
+from collections import Counter
+from unittest import mock
+
+from app.services.clubs.players import TransfermarktClubPlayers
+from app.settings import settings
+from app.utils import xpath
+from app.utils.regex import REGEX_DOB
+from app.utils.utils import extract_from_url, safe_regex
+from benchmarks.stub_server import StubServer
+
+SQUADS = {
+    "club (40 players)": {"club_id": "131", "season_id": "2024"},
+    "national team (80 players)": {"club_id": "3262", "season_id": "2024", "is_national": True},
+}
+
+
+def column_wise_club_players(tfmkt: TransfermarktClubPlayers) -> list[dict]:
+    """The previous, column-wise extraction of the players of a club, on the present squad pages."""
+    page_nationalities = tfmkt.page.xpath("//td[img[@class='flaggenrahmen']]")
+    page_players_infos = tfmkt.page.xpath("//td[@class='posrela']")
+    page_players_signed_from = tfmkt.page.xpath("//div[@id='yw1']//td[8]")
+    page_players_joined_on = tfmkt.page.xpath("//div[@id='yw1']//td[7]")
+    players_ids = [extract_from_url(url) for url in tfmkt.get_list_by_xpath("//td[@class='hauptlink']//@href")]
+    players_names = tfmkt.get_list_by_xpath("//td[@class='posrela']//a//text()")
+    players_positions = tfmkt.get_list_by_xpath("//td[@class='posrela']//tr[2]//text()")
+    players_dobs = [
+        safe_regex(dob_age, REGEX_DOB, "dob") for dob_age in tfmkt.get_list_by_xpath("//div[@id='yw1']//td[3]//text()")
+    ]
+    players_ages = [
+        safe_regex(dob_age, REGEX_DOB, "age") for dob_age in tfmkt.get_list_by_xpath("//div[@id='yw1']//td[3]//text()")
+    ]
+    players_nationalities = [nationality.xpath(".//img//@title") for nationality in page_nationalities]
+    players_heights = tfmkt.get_list_by_xpath("//div[@id='yw1']//td[5]//text()")
+    players_foots = tfmkt.get_list_by_xpath("//div[@id='yw1']//td[6]//text()", remove_empty=False)
+    players_joined_on = ["; ".join(e.xpath(".//text()")) for e in page_players_joined_on]
+    players_joined = ["; ".join(e.xpath(".//span/node()/@title")) for e in page_players_infos]
+    players_signed_from = ["; ".join(e.xpath(".//a//img//@title")) for e in page_players_signed_from]
+    players_contracts = tfmkt.get_list_by_xpath("//div[@id='yw1']//td[9]//text()")
+    players_marketvalues = tfmkt.get_list_by_xpath("//td[@class='rechts hauptlink']//text()")
+    players_statuses = ["; ".join(e.xpath(".//td[@class='hauptlink']//span//@title")) for e in page_players_infos]
+    return [
+        dict(zip(["id", "name", "position", "dateOfBirth", "age", "nationality", "height", "foot"], values))
+        | dict(zip(["joinedOn", "joined", "signedFrom", "contract", "marketValue", "status"], more))
+        for values, more in zip(
+            zip(
+                players_ids,
+                players_names,
+                players_positions,
+                players_dobs,
+                players_ages,
+                players_nationalities,
+                players_heights,
+                players_foots,
+            ),
+            zip(
+                players_joined_on,
+                players_joined,
+                players_signed_from,
+                players_contracts,
+                players_marketvalues,
+                players_statuses,
+            ),
+        )
+    ]
+
+
+def column_wise_national_team_players(tfmkt: TransfermarktClubPlayers) -> list[dict]:
+    """The previous, column-wise extraction of the players of a national team."""
+    rows = "//table[@class='items']//tbody//tr"
+    player_rows = tfmkt.page.xpath(rows)
+    players_ids = [
+        extract_from_url(url)
+        for url in tfmkt.get_list_by_xpath("//table[@class='inline-table']//td[@class='hauptlink']//a//@href")
+    ]
+    players_names = tfmkt.get_list_by_xpath("//table[@class='inline-table']//td[@class='hauptlink']//a//text()")
+    players_positions = tfmkt.get_list_by_xpath("//table[@class='inline-table']//tr[2]//td//text()")
+    dob_age_data = tfmkt.get_list_by_xpath(rows + "//td[3]//text()")
+    players_dobs = [safe_regex(dob_age, REGEX_DOB, "dob") for dob_age in dob_age_data]
+    players_ages = [safe_regex(dob_age, REGEX_DOB, "age") for dob_age in dob_age_data]
+    players_current_club = tfmkt.get_list_by_xpath(rows + "//td[4]//a/@title")
+    players_heights = tfmkt.get_list_by_xpath(rows + "//td[5]//text()")
+    players_foots = tfmkt.get_list_by_xpath(rows + "//td[6]//text()", remove_empty=False)
+    players_intl_matches = tfmkt.get_list_by_xpath(rows + "//td[7]//text()")
+    players_goals = tfmkt.get_list_by_xpath(rows + "//td[8]//text()")
+    players_joined_on = [(row.xpath(".//td[9]/text()") or [""])[0] for row in player_rows]
+    players_marketvalues = tfmkt.get_list_by_xpath(rows + "//td[10]//a//text()")
+    status = ".//span[contains(@class, 'verletzt-table') or contains(@class, 'kapitaenicon-table')]/@title"
+    players_statuses = ["; ".join(row.xpath(status)) for row in player_rows]
+    return [
+        dict(zip(["id", "name", "position", "dateOfBirth", "age", "currentClub", "height", "foot"], values))
+        | dict(zip(["internationalMatches", "goals", "joinedOn", "marketValue", "status"], more))
+        for values, more in zip(
+            zip(
+                players_ids,
+                players_names,
+                players_positions,
+                players_dobs,
+                players_ages,
+                players_current_club,
+                players_heights,
+                players_foots,
+            ),
+            zip(players_intl_matches, players_goals, players_joined_on, players_marketvalues, players_statuses),
+        )
+    ]
+
+
+def count_queries(extract) -> Counter:
+    """Run an extraction once, counting the XPath queries evaluated against the whole document and within rows."""
+    queries = Counter()
+    compile_xpath = xpath.compile_xpath
+
+    def counting_compile_xpath(path: str, *args):
+        queries["document" if path.startswith("/") else "relative"] += 1
+        return compile_xpath(path, *args)
+
+    with mock.patch.object(xpath, "compile_xpath", counting_compile_xpath):
+        extract()
+    return queries
+
+
+def time_extraction(extract, n: int) -> float:
+    """Time n runs of an extraction, in milliseconds per run."""
+    extract()
+    start = time.perf_counter()
+    for _ in range(n):
+        extract()
+    return (time.perf_counter() - start) / n * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="extraction runs per page and method")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        squads = {name: TransfermarktClubPlayers(**kwargs) for name, kwargs in SQUADS.items()}
+
+    print(f"{'squad':<28}{'method':<14}{'doc queries':>12}{'row queries':>12}{'time (ms)':>12}{'speed-up':>10}")
+    for name, tfmkt in squads.items():
+        column_wise = column_wise_national_team_players if tfmkt.is_national else column_wise_club_players
+        methods = {
+            "column-wise": lambda: column_wise(tfmkt),
+            "row-wise": tfmkt.get_club_players,
+        }
+        timings = {}
+        for method, extract in methods.items():
+            queries = count_queries(extract)
+            timings[method] = time_extraction(extract, args.n)
+            speed_up = timings["column-wise"] / timings[method]
+            print(
+                f"{name:<28}{method:<14}{queries['document']:>12}{queries['relative']:>12}{timings[method]:>12.3f}"
+                f"{speed_up:>10.2f}",
+            )
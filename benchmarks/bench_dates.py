@@ -0,0 +1,74 @@
+"""
+Compare the validation of the services' data against their response models with the dates parsed by
+`dateutil.parser.parse` (the previous behaviour) and by `app.utils.dates.parse_date`.
+
+The data of the services whose responses hold the most dates (the club and national team squads, the injuries,
+transfers and manager contracts) is extracted once from the pages of `benchmarks/corpus`, then validated against the
+response model of its route `-n` times with each parser patched into `app.schemas.base`. `parse_date` is timed warm,
+with its memos filled by the previous runs, and cold, with the memos cleared before each run. The club players route,
+`/clubs/{club_id}/players`, is the first case.
+
+Usage:
+    python -m benchmarks.bench_dates -n 200
+"""
+
+import argparse
+import time
+from typing import Optional
+from unittest import mock
+
+from dateutil import parser
+
+from app.schemas import base
+from app.settings import settings
+from app.utils.dates import _NOT_DATES, _parse_known_date
+from benchmarks.cases import SERVICE_CASES, ServiceCase
+from benchmarks.stub_server import StubServer
+
+CASES = ["clubs.players", "clubs.players_national", "players.injuries", "players.transfers", "managers.contracts"]
+
+
+def dateutil_parse_date(text: Optional[str]) -> Optional[object]:
+    """The previous date parsing of `TransfermarktBaseModel.parse_str_to_date`."""
+    if text is None:
+        return None
+    try:
+        return parser.parse(text).date() if text else None
+    except parser.ParserError:
+        return None
+
+
+def time_validation(case: ServiceCase, data: dict, n: int, clear_memo: bool = False) -> float:
+    """Time n validations of the data of a case against its response model, in milliseconds per validation."""
+    case.schema.model_validate(data)
+    elapsed = 0.0
+    for _ in range(n):
+        if clear_memo:
+            _parse_known_date.cache_clear()
+            _NOT_DATES.clear()
+        start = time.perf_counter()
+        case.schema.model_validate(data)
+        elapsed += time.perf_counter() - start
+    return elapsed / n * 1000
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("-n", type=int, default=200, help="validations per case and parser")
+    args = arg_parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        cases = {case.name: (case, case.run()) for case in SERVICE_CASES if case.name in CASES}
+
+    print(f"{'service':<28}{'dateutil (ms)':>15}{'cold (ms)':>12}{'warm (ms)':>12}{'speed-up':>10}")
+    for name in CASES:
+        case, data = cases[name]
+        with mock.patch.object(base, "parse_date", dateutil_parse_date):
+            before = time_validation(case, data, args.n)
+            expected = case.schema.model_validate(data).model_dump(exclude={"updated_at"})
+        cold = time_validation(case, data, args.n, clear_memo=True)
+        warm = time_validation(case, data, args.n)
+        if case.schema.model_validate(data).model_dump(exclude={"updated_at"}) != expected:
+            raise AssertionError(f"{name}: the validated data differs")
+        print(f"{name:<28}{before:>15.3f}{cold:>12.3f}{warm:>12.3f}{before / warm:>10.2f}")
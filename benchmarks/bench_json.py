@@ -0,0 +1,100 @@
+"""
+Compare the throughput, in megabytes of JSON per second, of the ways the responses of the routes can be serialized.
+
+The data of every service in `benchmarks.cases` is extracted once from the pages of `benchmarks/corpus` and validated
+against the response model of its route. Each route is then serialized `-n` times:
+
+- json: dumped to Python objects by FastAPI and encoded by `JSONResponse` with the `json` module (the previous
+  behaviour, and that of `FAST_SERIALIZATION_ENABLE=false JSON_ENCODER=json`);
+- orjson: dumped to Python objects by FastAPI and encoded by `FastJSONResponse` with orjson;
+- dump_json: dumped to JSON bytes by pydantic and sent as they are by `DumpJSONResponse`;
+- streamed: its longest list dumped `--chunk-items` items at a time, as the responses with `STREAMING_MIN_ITEMS`
+  items or more are. The largest chunk is reported alongside the size of the whole body: it bounds the memory the
+  serialization takes at once.
+
+All of them are checked to give the same bytes.
+
+Usage:
+    python -m benchmarks.bench_json -n 200 --chunk-items 50
+"""
+
+import argparse
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.utils import create_model_field
+
+from app.settings import settings
+from app.utils.responses import DumpJSONResponse, FastJSONResponse, JSONChunks, _DumpJSONResponseField
+from benchmarks.cases import SERVICE_CASES
+from benchmarks.stub_server import StubServer
+
+OPTIONS = {"by_alias": True, "exclude_none": True}
+
+
+def drain(chunks: JSONChunks) -> list[bytes]:
+    """Collect the chunks of a streamed body, driving their iterator without an event loop as it never awaits."""
+    iterator, collected = chunks.__aiter__(), []
+    while True:
+        try:
+            iterator.__anext__().send(None)
+        except StopIteration as e:
+            collected.append(e.value)
+        except StopAsyncIteration:
+            return collected
+
+
+def time_runs(run, n: int) -> float:
+    """Time n runs of a function, in seconds per run."""
+    run()
+    start = time.perf_counter()
+    for _ in range(n):
+        run()
+    return (time.perf_counter() - start) / n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="serializations per route and method")
+    parser.add_argument("--chunk-items", type=int, default=50, help="list items per streamed chunk")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        cases = [(case, case.run()) for case in SERVICE_CASES]
+    settings.STREAMING_CHUNK_ITEMS = args.chunk_items
+
+    print(
+        f"{'route':<32}{'size (KB)':>11}{'json (MB/s)':>13}{'orjson (MB/s)':>15}{'dump_json (MB/s)':>18}"
+        f"{'streamed (MB/s)':>17}{'max chunk (KB)':>16}",
+    )
+    for case, data in cases:
+        field = _DumpJSONResponseField(create_model_field(name="Response", type_=case.schema, mode="serialization"))
+        model = field.validate(data, {}, loc=("response",))[0]
+
+        def json_module():
+            return JSONResponse(field._field.serialize(model, mode="json", **OPTIONS)).body
+
+        def orjson():
+            settings.JSON_ENCODER = "orjson"
+            return FastJSONResponse(field._field.serialize(model, mode="json", **OPTIONS)).body
+
+        def dump_json():
+            settings.STREAMING_MIN_ITEMS = 1_000_000
+            return DumpJSONResponse(field.serialize(model, mode="json", **OPTIONS)).body
+
+        def streamed():
+            settings.STREAMING_MIN_ITEMS = 1
+            body = field.serialize(model, mode="json", **OPTIONS)
+            return drain(body) if isinstance(body, JSONChunks) else [DumpJSONResponse(body).body]
+
+        body = json_module()
+        chunks = streamed()
+        if not body == orjson() == dump_json() == b"".join(chunks):
+            raise AssertionError(f"{case.name}: the serialized responses differ")
+        size = len(body) / 1_000_000
+        rates = [size / time_runs(run, args.n) for run in [json_module, orjson, dump_json, streamed]]
+        print(
+            f"{case.name:<32}{len(body) / 1000:>11.1f}{rates[0]:>13.1f}{rates[1]:>15.1f}{rates[2]:>18.1f}"
+            f"{rates[3]:>17.1f}{max(map(len, chunks)) / 1000:>16.1f}",
+        )
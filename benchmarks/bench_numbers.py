@@ -0,0 +1,105 @@
+"""
+Compare the parsing of Transfermarkt numbers by the previous `TransfermarktBaseModel.parse_str_to_int` and by
+`app.utils.numbers.parse_number`.
+
+The numbers are those of the full stats page of a player (appearances, goals, assists, cards and minutes played, as
+extracted by `TransfermarktPlayerStats`) and the market values of the competition clubs page, from
+`benchmarks/corpus`. Each parser goes through all of them `-n` times; `parse_number` is timed warm, with its memo
+filled by the previous runs, and cold, with the memo cleared before each run. The numbers the parsers read differently
+are counted: the minutes played above 999 (e.g. "3.066'"), which the previous parser read as 3.
+
+Usage:
+    python -m benchmarks.bench_numbers -n 1000
+"""
+
+import argparse
+import re
+import time
+from typing import Optional
+
+import httpx
+
+from app.services.base import TransfermarktBase
+from app.services.players.stats import TransfermarktPlayerStats
+from app.settings import settings
+from app.utils.numbers import _parse_amount, parse_number
+from benchmarks.stub_server import CORPUS_DIR, StubServer
+
+STATS_FIELDS = ["appearances", "goals", "assists", "yellowCards", "redCards", "minutesPlayed"]
+
+MARKET_VALUES = "//table[@class='items']//td[contains(@class, 'rechts')]//text()"
+
+
+def previous_parse_str_to_int(v) -> Optional[int]:
+    """The previous `TransfermarktBaseModel.parse_str_to_int`."""
+    if v is None:
+        return None
+    if not v or not any(char.isdigit() for char in v):
+        return None
+
+    # Clean up HTML tags if present
+    if "<" in str(v):
+        matches = re.findall(r"€([\d,.]+[kmb]?)", v.lower())
+        if not matches:
+            return None
+        value_str = matches[0]
+    else:
+        value_str = v.lower().replace("€", "").replace("+", "").replace("'", "").strip()
+
+    if "k" in value_str:
+        return int(float(value_str.replace("k", "")) * 1_000)
+    elif "m" in value_str:
+        return int(float(value_str.replace("m", "")) * 1_000_000)
+    elif "bn" in value_str:
+        return int(float(value_str.replace("bn", "")) * 1_000_000_000)
+    elif "b" in value_str:
+        return int(float(value_str.replace("b", "")) * 1_000_000_000)
+    else:
+        return int(float(value_str))
+
+
+def stats_numbers() -> list[str]:
+    """The numbers of the stats page of a player, as extracted by the service."""
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        stats = TransfermarktPlayerStats(player_id="28003").get_player_stats()["stats"]
+    return [stat[field] for stat in stats for field in STATS_FIELDS if field in stat]
+
+
+def market_values() -> list[str]:
+    """The market values of the clubs of the competition clubs page."""
+    content = (CORPUS_DIR / "startseite_wettbewerb.html").read_bytes()
+    page = TransfermarktBase.convert_response_to_page(httpx.Response(200, content=content))
+    return [value.strip() for value in page.xpath(MARKET_VALUES) if value.strip()]
+
+
+def time_parsing(parse, texts: list[str], n: int, clear_memo: bool = False) -> float:
+    """Time n runs of a parser through all the texts, in microseconds per text."""
+    elapsed = 0.0
+    for _ in range(n):
+        if clear_memo:
+            _parse_amount.cache_clear()
+        start = time.perf_counter()
+        for text in texts:
+            parse(text)
+        elapsed += time.perf_counter() - start
+    return elapsed / n / len(texts) * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=1000, help="runs of each parser through the numbers of each page")
+    args = parser.parse_args()
+
+    pages = {"player stats": stats_numbers(), "competition clubs": market_values()}
+
+    print(
+        f"{'page':<20}{'numbers':>9}{'differ':>8}{'before (us)':>13}{'cold (us)':>11}{'warm (us)':>11}"
+        f"{'speed-up':>10}",
+    )
+    for name, texts in pages.items():
+        differ = sum(previous_parse_str_to_int(text) != parse_number(text) for text in texts)
+        before = time_parsing(previous_parse_str_to_int, texts, args.n)
+        cold = time_parsing(parse_number, texts, args.n, clear_memo=True)
+        warm = time_parsing(parse_number, texts, args.n)
+        print(f"{name:<20}{len(texts):>9}{differ:>8}{before:>13.3f}{cold:>11.3f}{warm:>11.3f}{before / warm:>10.2f}")
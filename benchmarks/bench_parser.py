@@ -0,0 +1,143 @@
+"""
+Compare the `lxml` and `bs4` values of the `HTML_PARSER` setting on the pages in `benchmarks/corpus`.
+
+Reports, per backend:
+
+* the time to parse each corpus page into the ElementTree the services query,
+* the time to run every service in `benchmarks.cases` end to end against the local stub server,
+* the peak memory of parsing the corpus 20 times over, keeping every tree, measured in a fresh process per backend:
+  the peak of the Python heap (tracemalloc, which does not see the libxml2 trees) and the peak resident set size of
+  the process, which both backends start from the same imports.
+
+Usage:
+    python -m benchmarks.bench_parser -n 50
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import httpx
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from app.services.base import TransfermarktBase
+from app.settings import settings
+from benchmarks.cases import SERVICE_CASES
+from benchmarks.stub_server import CORPUS_DIR, StubServer
+
+PAGES = sorted(CORPUS_DIR.glob("*.html"))
+
+
+def parse_bs4(response: httpx.Response) -> etree.ElementBase:
+    """Parse a page the way `HTML_PARSER=bs4` does."""
+    bsoup = BeautifulSoup(markup=response.content, features="html.parser")
+    return TransfermarktBase.convert_bsoup_to_page(bsoup=bsoup)
+
+
+def parse_lxml(response: httpx.Response) -> etree.ElementBase:
+    """Parse a page the way `HTML_PARSER=lxml` does."""
+    return TransfermarktBase.convert_response_to_page(response=response)
+
+
+PARSERS: dict[str, Callable[[httpx.Response], etree.ElementBase]] = {"bs4": parse_bs4, "lxml": parse_lxml}
+
+
+def load_responses() -> dict[str, httpx.Response]:
+    """Wrap every corpus page in a response, as served by the stub."""
+    return {
+        page.name: httpx.Response(
+            200,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=page.read_bytes(),
+        )
+        for page in PAGES
+    }
+
+
+def bench_parse(n: int) -> dict[str, dict[str, float]]:
+    """Time n parses of every corpus page per backend, in milliseconds per parse."""
+    responses = load_responses()
+    timings = {}
+    for name, response in responses.items():
+        timings[name] = {}
+        for backend, parse in PARSERS.items():
+            start = time.perf_counter()
+            for _ in range(n):
+                parse(response)
+            timings[name][backend] = (time.perf_counter() - start) / n * 1000
+    return timings
+
+
+def bench_services(n: int) -> dict[str, dict[str, float]]:
+    """Time n end-to-end runs of every service case per backend, in milliseconds per run."""
+    timings = {case.name: {} for case in SERVICE_CASES}
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        for backend in PARSERS:
+            settings.HTML_PARSER = backend
+            for case in SERVICE_CASES:
+                start = time.perf_counter()
+                for _ in range(n):
+                    case.run()
+                timings[case.name][backend] = (time.perf_counter() - start) / n * 1000
+    return timings
+
+
+def measure_memory(backend: str, rounds: int = 20) -> dict[str, float]:
+    """Parse the corpus `rounds` times, keeping every tree, and report the peak Python heap and RSS, in KiB."""
+    responses = load_responses()
+    parse = PARSERS[backend]
+    tracemalloc.start()
+    pages = [parse(response) for _ in range(rounds) for response in responses.values()]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del pages
+    return {"heap_peak_kib": peak / 1024, "rss_peak_kib": float(rss_peak)}
+
+
+def bench_memory() -> dict[str, dict[str, float]]:
+    """Measure the memory of each backend in its own process, so that one does not inflate the other."""
+    return {
+        backend: json.loads(
+            subprocess.check_output([sys.executable, "-m", "benchmarks.bench_parser", "--memory", backend]),
+        )
+        for backend in PARSERS
+    }
+
+
+def print_table(title: str, rows: dict[str, dict[str, float]], unit: str) -> None:
+    """Print one row per entry with a column per backend and the lxml speed-up."""
+    print(f"\n{title}")
+    print(f"{'':<40}{'bs4 (' + unit + ')':>14}{'lxml (' + unit + ')':>14}{'ratio':>8}")
+    for name, values in rows.items():
+        ratio = values["bs4"] / values["lxml"] if values["lxml"] else float("nan")
+        print(f"{name:<40}{values['bs4']:>14.2f}{values['lxml']:>14.2f}{ratio:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=50, help="repetitions per page and per service")
+    parser.add_argument("--memory", choices=list(PARSERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.memory:
+        print(json.dumps(measure_memory(args.memory)))
+        sys.exit()
+
+    parse_timings = bench_parse(args.n)
+    parse_timings["total"] = {backend: sum(timing[backend] for timing in parse_timings.values()) for backend in PARSERS}
+    print_table("Parse time per page", parse_timings, "ms")
+    print_table("Service time per run, fetch from stub included", bench_services(args.n), "ms")
+    memory = bench_memory()
+    print_table(
+        "Memory to parse the corpus",
+        {metric: {backend: memory[backend][metric] for backend in PARSERS} for metric in memory["lxml"]},
+        "KiB",
+    )
@@ -0,0 +1,84 @@
+"""
+Compare `extract_from_url` matching a regex given as a string (the previous behaviour) and matching the precompiled
+`REGEX_TFMKT_URL`.
+
+The URLs are the links of the pages in `benchmarks/corpus`, cycled up to `-n` of them, so the mix of path shapes is
+the one the services see. Each implementation extracts the `id` of every URL; the previous one is reproduced below,
+and is checked to give the same results.
+
+Usage:
+    python -m benchmarks.bench_regex -n 100000
+"""
+
+import argparse
+import itertools
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from lxml import etree
+
+from app.utils.regex import REGEX_TFMKT_URL
+from app.utils.utils import extract_from_url, trim
+
+CORPUS = Path(__file__).parent / "corpus"
+
+
+def string_regex_extract_from_url(tfmkt_url: Optional[str], element: str = "id") -> Optional[str]:
+    """The previous `extract_from_url`, matching a regex given as a string on every call."""
+    if not tfmkt_url:
+        return None
+
+    regex: str = (
+        r"/(?P<code>[\w%-]+)"
+        r"/(?P<category>[\w-]+)"
+        r"/(?P<type>[\w-]+)"
+        r"/(?P<id>\w+)"
+        r"(/saison_id/(?P<season_id>\d{4}))?"
+        r"(/transfer_id/(?P<transfer_id>\d+))?"
+    )
+
+    match = re.match(regex, trim(tfmkt_url))
+    return match.groupdict().get(element) if match else None
+
+
+def corpus_urls() -> list[str]:
+    """The links of the HTML pages of the corpus."""
+    return [
+        href
+        for path in sorted(CORPUS.glob("*.html"))
+        for href in etree.HTML(path.read_bytes()).xpath("//a/@href")
+        if href.startswith("/")
+    ]
+
+
+def time_extraction(extract, urls: list[str]) -> float:
+    """Time the extraction of the id of every URL, in milliseconds."""
+    start = time.perf_counter()
+    for url in urls:
+        extract(url)
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=100_000, help="URLs to extract the id of")
+    args = parser.parse_args()
+
+    links = corpus_urls()
+    urls = list(itertools.islice(itertools.cycle(links), args.n))
+    matched = sum(REGEX_TFMKT_URL.match(trim(url)) is not None for url in links)
+    mismatches = sum(string_regex_extract_from_url(url) != extract_from_url(url) for url in links)
+    print(f"{len(links)} links, {matched} matching REGEX_TFMKT_URL, {mismatches} mismatches\n")
+
+    methods = {
+        "string regex": string_regex_extract_from_url,
+        "compiled regex": extract_from_url,
+    }
+    timings = {}
+    print(f"{'method':<18}{'time (ms)':>12}{'per URL (us)':>14}{'speed-up':>10}")
+    for method, extract in methods.items():
+        timings[method] = time_extraction(extract, urls)
+        speed_up = timings["string regex"] / timings[method]
+        print(f"{method:<18}{timings[method]:>12.1f}{timings[method] * 1000 / args.n:>14.3f}{speed_up:>10.2f}")
@@ -0,0 +1,62 @@
+"""
+Compare the serialization of the responses of the routes by FastAPI (the previous behaviour) and by `DumpJSONAPIRoute`.
+
+The data of every service in `benchmarks.cases` is extracted once from the pages of `benchmarks/corpus` and validated
+against the response model of its route, as FastAPI does before serializing it. FastAPI then dumps the model to
+Python objects and `JSONResponse` encodes them with the `json` module; `DumpJSONAPIRoute` has pydantic dump the model
+to JSON bytes directly. Both are timed `-n` times per route, the validation alongside for scale, and checked to give
+the same bytes.
+
+Usage:
+    python -m benchmarks.bench_serialization -n 200
+"""
+
+import argparse
+import time
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.settings import settings
+from app.utils.responses import DumpJSONResponse, JSONBytes
+from benchmarks.cases import SERVICE_CASES
+from benchmarks.stub_server import StubServer
+
+OPTIONS = {"by_alias": True, "exclude_none": True}
+
+
+def time_runs(run, n: int) -> float:
+    """Time n runs of a function, in milliseconds per run."""
+    run()
+    start = time.perf_counter()
+    for _ in range(n):
+        run()
+    return (time.perf_counter() - start) / n * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="serializations per route and method")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        cases = [(case, case.run()) for case in SERVICE_CASES]
+
+    print(f"{'route':<32}{'validate (ms)':>15}{'fastapi (ms)':>14}{'dump json (ms)':>16}{'speed-up':>10}")
+    for case, data in cases:
+        adapter = TypeAdapter(case.schema)
+        model = adapter.validate_python(data)
+
+        def fastapi_serialize():
+            return JSONResponse(adapter.dump_python(model, mode="json", **OPTIONS)).body
+
+        def dump_json():
+            return DumpJSONResponse(JSONBytes(adapter.dump_json(model, **OPTIONS))).body
+
+        if dump_json() != fastapi_serialize():
+            raise AssertionError(f"{case.name}: the serialized responses differ")
+        validate = time_runs(lambda: adapter.validate_python(data), args.n)
+        before = time_runs(fastapi_serialize, args.n)
+        after = time_runs(dump_json, args.n)
+        print(f"{case.name:<32}{validate:>15.3f}{before:>14.3f}{after:>16.3f}{before / after:>10.2f}")
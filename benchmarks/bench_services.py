@@ -0,0 +1,201 @@
+"""
+Benchmark every service in `benchmarks.cases` end to end and per stage, on the pages in `benchmarks/corpus` served by
+the local stub server, and check the timings against a stored baseline.
+
+The pages of the corpus are synthetic: hand-built after the Transfermarkt markup the XPaths target and trimmed, not
+recorded from transfermarkt.com. They are smaller than the live pages, so the timings, those of the baseline included,
+only tell runs of this script apart, not how long a request to the live site takes.
+
+Reports, per service case:
+
+* the end-to-end time of one call, as served by its route: construct the service (fetch and parse its pages), extract
+  the data, validate it against the response model and serialize it to JSON, in milliseconds and operations per second,
+* how that time splits into stages: fetch, parse and extract, read from the histograms of `app.utils.metrics`, and
+  validate and serialize, timed here,
+* the peak of the Python heap during one call served from the response cache, in KiB (tracemalloc, which does not
+  see the libxml2 trees).
+
+Each case is run `-n` times per round, and the fastest of `--rounds` rounds is kept for each timing. The rounds go
+through the cases in turn, so that a slow spell of the machine is spread over all of them. With `--save-baseline` the
+results are written to the baseline file. Otherwise, if the baseline file exists, every timing of at least `--min-ms`
+in the baseline is compared with the new one, and the script exits with status 1 if any of them is slower by more than
+`--threshold` (e.g. 0.25 for 25%). Timings depend on the machine, so compare against a baseline saved on the same one.
+
+Usage:
+    python -m benchmarks.bench_services
+    python -m benchmarks.bench_services --save-baseline
+    python -m benchmarks.bench_services -k players --threshold 0.1
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from prometheus_client import Histogram
+
+from app.cache import get_response_cache
+from app.settings import settings
+from app.utils.metrics import EXTRACT_SECONDS, FETCH_SECONDS, PARSE_SECONDS
+from benchmarks.cases import SERVICE_CASES, ServiceCase
+from benchmarks.stub_server import StubServer
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+CORPUS_NOTE = "synthetic pages, smaller than the live ones: compare runs against each other, not with the live site"
+
+STAGES = ["fetch", "parse", "extract", "validate", "serialize"]
+
+
+def histogram_sum(histogram: Histogram, **labels) -> float:
+    """The sum of the observations of a histogram, over the label values matching the given ones."""
+    return sum(
+        sample.value
+        for metric in histogram.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_sum") and all(sample.labels.get(name) == value for name, value in labels.items())
+    )
+
+
+def stage_sums(case: ServiceCase) -> dict[str, float]:
+    """The seconds recorded so far by the histograms of the stages of a case."""
+    return {
+        "fetch": histogram_sum(FETCH_SECONDS),
+        "parse": histogram_sum(PARSE_SECONDS),
+        "extract": histogram_sum(EXTRACT_SECONDS, service=case.service.__name__),
+    }
+
+
+def run_once(case: ServiceCase, timings: dict[str, float]) -> None:
+    """Serve a case once like its route does, adding the validation and serialization times to the timings."""
+    data = case.run()
+    start = time.perf_counter()
+    model = case.schema.model_validate(data)
+    validated = time.perf_counter()
+    model.model_dump_json(by_alias=True, exclude_none=True)
+    timings["validate"] += validated - start
+    timings["serialize"] += time.perf_counter() - validated
+
+
+def bench_round(case: ServiceCase, n: int) -> dict[str, float]:
+    """Time n calls of a case end to end and per stage, in milliseconds per call."""
+    timings = defaultdict(float)
+    before = stage_sums(case)
+    start = time.perf_counter()
+    for _ in range(n):
+        run_once(case, timings)
+    elapsed = time.perf_counter() - start
+    after = stage_sums(case)
+    for stage in before:
+        timings[stage] = after[stage] - before[stage]
+    return {"e2e_ms": elapsed / n * 1000, **{f"{stage}_ms": timings[stage] / n * 1000 for stage in STAGES}}
+
+
+def bench_cases(cases: list[ServiceCase], n: int, rounds: int) -> dict[str, dict[str, float]]:
+    """
+    Time every case, keeping the fastest round of each timing.
+
+    The rounds go through all the cases in turn, so that a slow spell of the machine does not hit a single case.
+    """
+    for case in cases:
+        run_once(case, defaultdict(float))
+    results = {}
+    for _ in range(rounds):
+        for case in cases:
+            result = bench_round(case, n)
+            best = results.setdefault(case.name, result)
+            for key, value in result.items():
+                best[key] = min(best[key], value)
+    for case in cases:
+        results[case.name]["ops_per_sec"] = 1000 / results[case.name]["e2e_ms"]
+        results[case.name]["alloc_peak_kib"] = measure_allocations(case)
+    return results
+
+
+def measure_allocations(case: ServiceCase) -> float:
+    """
+    The peak of the traced Python heap during one call, in KiB.
+
+    The pages are served from the warmed response cache, so that the buffers of the stub server, which runs in the
+    same process, are not counted.
+    """
+    settings.CACHE_ENABLE = True
+    run_once(case, defaultdict(float))
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        run_once(case, defaultdict(float))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        settings.CACHE_ENABLE = False
+        get_response_cache().clear()
+    return (peak - baseline) / 1024
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float, min_ms: float) -> list[str]:
+    """Describe every timing slower than its baseline by more than the threshold."""
+    regressions = []
+    for name, result in results.items():
+        for key, value in result.items():
+            reference = baseline.get(name, {}).get(key)
+            if not key.endswith("_ms") or reference is None or reference < min_ms:
+                continue
+            if value > reference * (1 + threshold):
+                regressions.append(f"{name} {key}: {reference:.3f} -> {value:.3f} ({value / reference - 1:+.0%})")
+    return regressions
+
+
+def print_results(results: dict, baseline: dict) -> None:
+    """Print the results as a table, with the end-to-end change against the baseline if there is one."""
+    columns = ["e2e_ms", "ops_per_sec", *[f"{stage}_ms" for stage in STAGES], "alloc_peak_kib"]
+    print(f"{'service':<30}" + "".join(f"{column:>16}" for column in columns) + f"{'vs baseline':>14}")
+    for name, result in results.items():
+        reference = baseline.get(name, {}).get("e2e_ms")
+        change = f"{result['e2e_ms'] / reference - 1:+.1%}" if reference else "-"
+        print(f"{name:<30}" + "".join(f"{result[column]:>16.3f}" for column in columns) + f"{change:>14}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=20, help="calls per case and round")
+    parser.add_argument("--rounds", type=int, default=10, help="rounds per case, the fastest is kept")
+    parser.add_argument("-k", default="", help="only run the cases whose name contains this")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="the baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown against the baseline")
+    parser.add_argument("--min-ms", type=float, default=0.05, help="ignore baseline timings shorter than this")
+    args = parser.parse_args()
+
+    settings.METRICS_ENABLE = True
+    settings.CACHE_ENABLE = False
+    cases = [case for case in SERVICE_CASES if args.k in case.name]
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        results = bench_cases(cases, args.n, args.rounds)
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print_results(results, stored.get("results", {}))
+
+    if args.save_baseline:
+        rounded = {name: {key: round(value, 4) for key, value in result.items()} for name, result in results.items()}
+        stored_results = {**stored.get("results", {}), **rounded}
+        metadata = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "n": args.n,
+            "rounds": args.rounds,
+            "corpus": CORPUS_NOTE,
+        }
+        args.baseline.write_text(json.dumps({**metadata, "results": stored_results}, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+    elif stored:
+        regressions = find_regressions(results, stored["results"], args.threshold, args.min_ms)
+        if regressions:
+            print(f"\n{len(regressions)} timings regressed by more than {args.threshold:.0%}:")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print(f"\nNo timing regressed by more than {args.threshold:.0%}")
@@ -0,0 +1,64 @@
+"""
+Compare one-connection-per-request fetching with the shared keep-alive session.
+
+Fetches the same player profile N times from the local stub server, first with a bare `requests.get` per call (the
+previous behaviour of `TransfermarktBase.make_request`) and then through `TransfermarktPlayerProfile`, and reports how
+many TCP connections the stub had to accept for each. Loopback connections are cheap, so the latency gap here is
+a lower bound of the TLS handshake saved against transfermarkt.com.
+
+Usage:
+    python -m benchmarks.bench_session -n 200
+"""
+
+import argparse
+import time
+
+import requests
+
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.utils.session import get_session
+from benchmarks.stub_server import StubServer
+
+
+def bench_unpooled(stub: StubServer, url: str, n: int) -> tuple[float, int]:
+    """Fetch the profile page n times opening a new connection each time."""
+    stub.reset_counters()
+    start = time.perf_counter()
+    for _ in range(n):
+        requests.get(url.format(player_id="28003"))
+    return time.perf_counter() - start, stub.connections
+
+
+def bench_session(stub: StubServer, url: str, n: int) -> tuple[float, int]:
+    """Fetch the profile page n times through the shared session."""
+    stub.reset_counters()
+    start = time.perf_counter()
+    for _ in range(n):
+        get_session().get(url.format(player_id="28003"))
+    return time.perf_counter() - start, stub.connections
+
+
+def bench_pooled(stub: StubServer, url: str, n: int) -> tuple[float, int]:
+    """Fetch and parse the profile page n times through the shared session."""
+    stub.reset_counters()
+    start = time.perf_counter()
+    for _ in range(n):
+        TransfermarktPlayerProfile(player_id="28003", URL=url).get_player_profile()
+    return time.perf_counter() - start, stub.connections
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="number of consecutive fetches")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        url = stub.url + "/-/profil/spieler/{player_id}"
+        print(f"{'mode':<32}{'connections':>12}{'total (s)':>12}{'per fetch (ms)':>16}")
+        for mode, bench in [
+            ("requests.get (fetch only)", bench_unpooled),
+            ("TransfermarktPlayerProfile", bench_pooled),
+            ("shared session (fetch only)", bench_session),
+        ]:
+            elapsed, connections = bench(stub, url, args.n)
+            print(f"{mode:<32}{connections:>12}{elapsed:>12.3f}{elapsed / args.n * 1000:>16.2f}")
@@ -0,0 +1,101 @@
+"""
+Compare the cache hit rates of several worker processes keeping private caches and sharing the SQLite cache of
+`CACHE_SHARED_PATH`.
+
+`--workers` processes are started at once, as uvicorn starts its workers, each with the response and result caches
+enabled and pointed at the stub upstream serving `benchmarks/corpus`. Every worker goes `--rounds` times through the
+services in `benchmarks.cases`, in an order of its own, creating each with `acreate` and extracting its data as the
+routes do. This runs twice:
+
+- private: each worker has its in-memory caches only, the previous behaviour with several workers;
+- shared: the workers share a SQLite cache in a temporary directory, behind their in-memory caches.
+
+For each run and worker, the report gives the share of the response lookups answered from memory and from the shared
+cache, the share of the extractions answered by the result cache, and the time the worker took. The requests the stub
+upstream received are reported per run. The data extracted by every worker in both runs is checked to be the same.
+
+Usage:
+    python -m benchmarks.bench_shared_cache --workers 4 --rounds 3
+"""
+
+import argparse
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from typing import Optional
+
+import orjson
+
+from app.cache import get_response_cache, get_result_cache
+from app.settings import settings
+from benchmarks.cases import SERVICE_CASES
+from benchmarks.stub_server import StubServer
+
+
+def ratio(stats: Optional[dict]) -> float:
+    """The share of the lookups of a cache tier that were hits, in percent."""
+    lookups = stats["hits"] + stats["misses"] if stats else 0
+    return stats["hits"] / lookups * 100 if lookups else 0
+
+
+def run_worker(base_url: str, shared_path: Optional[str], rounds: int, seed: int) -> dict:
+    """Go through the services in a worker process, returning the stats of its caches and a digest of the data."""
+    settings.TRANSFERMARKT_BASE_URL = base_url
+    settings.CACHE_ENABLE = True
+    settings.CACHE_SHARED_PATH = shared_path
+    order = random.Random(seed)
+    digests = {}
+
+    async def run():
+        for _ in range(rounds):
+            for case in order.sample(SERVICE_CASES, len(SERVICE_CASES)):
+                data = getattr(await case.service.acreate(**case.kwargs), case.method)()
+                digests[case.name] = hashlib.sha1(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    results = get_result_cache().stats
+    return {
+        "pid": os.getpid(),
+        "seconds": time.perf_counter() - start,
+        "tiers": get_response_cache().stats(),
+        "results": {"hits": results.hits, "misses": results.misses},
+        "digests": digests,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="worker processes")
+    parser.add_argument("--rounds", type=int, default=3, help="passes of every worker through the services")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    digests = []
+    print(
+        f"{'run':<10}{'worker':>8}{'memory hits (%)':>17}{'shared hits (%)':>17}{'result hits (%)':>17}"
+        f"{'time (s)':>10}",
+    )
+    with StubServer() as stub, tempfile.TemporaryDirectory() as directory:
+        for run, shared_path in [("private", None), ("shared", os.path.join(directory, "cache.sqlite3"))]:
+            stub.reset_counters()
+            with context.Pool(args.workers) as pool:
+                workers = pool.starmap(
+                    run_worker,
+                    [(stub.url, shared_path, args.rounds, seed) for seed in range(args.workers)],
+                )
+            for worker in workers:
+                tiers = worker["tiers"]
+                print(
+                    f"{run:<10}{worker['pid']:>8}{ratio(tiers['memory']):>17.1f}{ratio(tiers.get('shared')):>17.1f}"
+                    f"{ratio(worker['results']):>17.1f}{worker['seconds']:>10.2f}",
+                )
+                digests.append(worker["digests"])
+            print(f"{run:<10}{'upstream requests:':>26} {sum(stub.hits.values())}")
+
+    if any(digest != digests[0] for digest in digests):
+        raise AssertionError("the workers extracted different data")
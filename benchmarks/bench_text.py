@@ -0,0 +1,147 @@
+"""
+Compare the text extraction of `TransfermarktBase.get_list_by_xpath` and `get_text_by_xpath` trimming every text
+twice (the previous behaviour) and once.
+
+The previous implementations are reproduced below. They are patched into `TransfermarktBase` to time the extraction
+method of every service in `benchmarks.cases` against its page, and checked to extract the same data. The text
+nodes of the largest pages of `benchmarks/corpus` (the squads, the competition clubs and the stats) are then listed
+with both `get_list_by_xpath`, as the raw cost of the normalization.
+
+Usage:
+    python -m benchmarks.bench_text -n 200
+"""
+
+import argparse
+import time
+from typing import Optional
+from unittest import mock
+
+import httpx
+
+from app.services.base import TransfermarktBase
+from app.settings import settings
+from app.utils.utils import trim
+from benchmarks.cases import SERVICE_CASES, ServiceCase
+from benchmarks.stub_server import CORPUS_DIR, StubServer
+
+LARGEST_PAGES = [
+    "kader_verein_national.html",
+    "kader_verein.html",
+    "startseite_wettbewerb.html",
+    "leistungsdatendetails_spieler.html",
+]
+
+
+def double_trim_get_list_by_xpath(self, xpath: str, remove_empty: Optional[bool] = True) -> Optional[list]:
+    """The previous `get_list_by_xpath`, trimming each element in the filter and again in the projection."""
+    elements: list = self.page.xpath(xpath)
+    if remove_empty:
+        elements_valid: list = [trim(e) for e in elements if trim(e)]
+    else:
+        elements_valid: list = [trim(e) for e in elements]
+    return elements_valid or []
+
+
+def double_trim_get_text_by_xpath(
+    self,
+    xpath: str,
+    pos: int = 0,
+    iloc: Optional[int] = None,
+    iloc_from: Optional[int] = None,
+    iloc_to: Optional[int] = None,
+    join_str: Optional[str] = None,
+) -> Optional[str]:
+    """The previous `get_text_by_xpath`, trimming each element in the filter, in the projection and once picked."""
+    element = self.page.xpath(xpath)
+
+    if not element:
+        return None
+
+    if isinstance(element, list):
+        element = [trim(e) for e in element if trim(e)]
+
+    if isinstance(iloc, int):
+        element = element[iloc]
+
+    if isinstance(iloc_from, int) and isinstance(iloc_to, int):
+        element = element[iloc_from:iloc_to]
+
+    if isinstance(iloc_to, int):
+        element = element[:iloc_to]
+
+    if isinstance(iloc_from, int):
+        element = element[iloc_from:]
+
+    if isinstance(join_str, str):
+        return join_str.join([trim(e) for e in element])
+
+    try:
+        return trim(element[pos])
+    except IndexError:
+        return None
+
+
+def double_trim():
+    """Patch the previous implementations into `TransfermarktBase`."""
+    return mock.patch.multiple(
+        TransfermarktBase,
+        get_list_by_xpath=double_trim_get_list_by_xpath,
+        get_text_by_xpath=double_trim_get_text_by_xpath,
+    )
+
+
+def time_runs(extract, n: int, repeat: int = 5) -> float:
+    """Time n runs of an extraction, in milliseconds per run, keeping the fastest of a few repeats against noise."""
+    extract()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n):
+            extract()
+        timings.append((time.perf_counter() - start) / n * 1000)
+    return min(timings)
+
+
+def bench_case(case: ServiceCase, n: int) -> tuple[float, float]:
+    """Time the extraction method of a service with both implementations, checking they extract the same data."""
+    tfmkt = case.service(**case.kwargs)
+    extract = getattr(tfmkt, case.method)
+    with double_trim():
+        before = time_runs(extract, n)
+        expected = extract()
+    after = time_runs(extract, n)
+    if extract() != expected:
+        raise AssertionError(f"{case.name}: the extracted data differs")
+    return before, after
+
+
+def bench_page(name: str, n: int) -> tuple[int, float, float]:
+    """Time listing the text nodes of a page of the corpus with both implementations."""
+    tfmkt = TransfermarktBase(URL=name)
+    content = (CORPUS_DIR / name).read_bytes()
+    tfmkt.page = TransfermarktBase.convert_response_to_page(httpx.Response(200, content=content))
+    with double_trim():
+        before = time_runs(lambda: tfmkt.get_list_by_xpath("//text()"), n)
+        expected = tfmkt.get_list_by_xpath("//text()")
+    after = time_runs(lambda: tfmkt.get_list_by_xpath("//text()"), n)
+    if tfmkt.get_list_by_xpath("//text()") != expected:
+        raise AssertionError(f"{name}: the listed texts differ")
+    return len(tfmkt.page.xpath("//text()")), before, after
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="runs per service or page and implementation")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        print(f"{'service':<32}{'double (ms)':>14}{'once (ms)':>14}{'speed-up':>10}")
+        for case in SERVICE_CASES:
+            before, after = bench_case(case, args.n)
+            print(f"{case.name:<32}{before:>14.3f}{after:>14.3f}{before / after:>10.2f}")
+
+        print(f"\n{'page':<36}{'texts':>8}{'double (ms)':>14}{'once (ms)':>14}{'speed-up':>10}")
+        for name in LARGEST_PAGES:
+            texts, before, after = bench_page(name, args.n)
+            print(f"{name:<36}{texts:>8}{before:>14.3f}{after:>14.3f}{before / after:>10.2f}")
@@ -0,0 +1,53 @@
+"""
+Compare per-page extraction time with XPath expressions compiled on every call and compiled once.
+
+Every service in `benchmarks.cases` is constructed once against the local stub server. Its page is then parsed twice
+from the same response: by a plain lxml parser, whose elements compile the expression passed to `xpath` on every
+call (the previous behaviour), and by the parser of `TransfermarktBase`, whose `XPathElement` elements reuse the
+expressions memoized by `compile_xpath`. The extraction method of the service is timed against each page.
+
+Usage:
+    python -m benchmarks.bench_xpath -n 200
+"""
+
+import argparse
+import time
+
+from lxml import etree
+
+from app.services.base import TransfermarktBase
+from app.settings import settings
+from benchmarks.cases import SERVICE_CASES, ServiceCase
+from benchmarks.stub_server import StubServer
+
+
+def bench_extraction(case: ServiceCase, n: int) -> tuple[float, float]:
+    """Time n runs of the extraction method of a service on both pages, in milliseconds per run."""
+    tfmkt = case.service(**case.kwargs)
+    response = tfmkt.make_request()
+    timings = []
+    for page in [etree.HTML(response.content), TransfermarktBase.convert_response_to_page(response)]:
+        tfmkt.page = page
+        extract = getattr(tfmkt, case.method)
+        extract()
+        start = time.perf_counter()
+        for _ in range(n):
+            extract()
+        timings.append((time.perf_counter() - start) / n * 1000)
+    return timings[0], timings[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="extraction runs per page")
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+        settings.TRANSFERMARKT_BASE_URL = stub.url
+        print(f"{'service':<32}{'per call (ms)':>16}{'compiled (ms)':>16}{'speed-up':>10}")
+        totals = [0.0, 0.0]
+        for case in SERVICE_CASES:
+            before, after = bench_extraction(case, args.n)
+            totals = [totals[0] + before, totals[1] + after]
+            print(f"{case.name:<32}{before:>16.3f}{after:>16.3f}{before / after:>10.2f}")
+        print(f"{'total':<32}{totals[0]:>16.3f}{totals[1]:>16.3f}{totals[0] / totals[1]:>10.2f}")
@@ -0,0 +1,161 @@
+"""
+Service calls answered by the pages in `benchmarks/corpus`, shared by the tests and the benchmark scripts.
+"""
+
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from app.schemas import clubs, competitions, managers, players
+from app.services.base import TransfermarktBase
+from app.services.clubs.managers import TransfermarktClubManagers
+from app.services.clubs.players import TransfermarktClubPlayers
+from app.services.clubs.profile import TransfermarktClubProfile
+from app.services.clubs.search import TransfermarktClubSearch
+from app.services.competitions.clubs import TransfermarktCompetitionClubs
+from app.services.competitions.search import TransfermarktCompetitionSearch
+from app.services.managers.contracts import TransfermarktManagerContracts
+from app.services.managers.profile import TransfermarktManagerProfile
+from app.services.players.achievements import TransfermarktPlayerAchievements
+from app.services.players.injuries import TransfermarktPlayerInjuries
+from app.services.players.jersey_numbers import TransfermarktPlayerJerseyNumbers
+from app.services.players.market_value import TransfermarktPlayerMarketValue
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.services.players.search import TransfermarktPlayerSearch
+from app.services.players.stats import TransfermarktPlayerStats
+from app.services.players.transfers import TransfermarktPlayerTransfers
+
+
+class ServiceCase(NamedTuple):
+    """
+    A service class, the arguments it is constructed with, the method extracting its data, and the response model of
+    the route serving it.
+    """
+
+    name: str
+    service: type[TransfermarktBase]
+    kwargs: dict
+    method: str
+    schema: type[BaseModel]
+
+    def run(self) -> dict:
+        """Construct the service, fetching its pages, and extract the data."""
+        return getattr(self.service(**self.kwargs), self.method)()
+
+
+SERVICE_CASES: list[ServiceCase] = [
+    ServiceCase(
+        "players.profile",
+        TransfermarktPlayerProfile,
+        {"player_id": "28003"},
+        "get_player_profile",
+        players.PlayerProfile,
+    ),
+    ServiceCase(
+        "players.market_value",
+        TransfermarktPlayerMarketValue,
+        {"player_id": "28003"},
+        "get_player_market_value",
+        players.PlayerMarketValue,
+    ),
+    ServiceCase(
+        "players.transfers",
+        TransfermarktPlayerTransfers,
+        {"player_id": "28003"},
+        "get_player_transfers",
+        players.PlayerTransfers,
+    ),
+    ServiceCase(
+        "players.jersey_numbers",
+        TransfermarktPlayerJerseyNumbers,
+        {"player_id": "28003"},
+        "get_player_jersey_numbers",
+        players.PlayerJerseyNumbers,
+    ),
+    ServiceCase(
+        "players.stats",
+        TransfermarktPlayerStats,
+        {"player_id": "28003"},
+        "get_player_stats",
+        players.PlayerStats,
+    ),
+    ServiceCase(
+        "players.injuries",
+        TransfermarktPlayerInjuries,
+        {"player_id": "28003"},
+        "get_player_injuries",
+        players.PlayerInjuries,
+    ),
+    ServiceCase(
+        "players.achievements",
+        TransfermarktPlayerAchievements,
+        {"player_id": "28003"},
+        "get_player_achievements",
+        players.PlayerAchievements,
+    ),
+    ServiceCase(
+        "players.search",
+        TransfermarktPlayerSearch,
+        {"query": "messi"},
+        "search_players",
+        players.PlayerSearch,
+    ),
+    ServiceCase("clubs.profile", TransfermarktClubProfile, {"club_id": "131"}, "get_club_profile", clubs.ClubProfile),
+    ServiceCase(
+        "clubs.players",
+        TransfermarktClubPlayers,
+        {"club_id": "131", "season_id": "2024"},
+        "get_club_players",
+        clubs.ClubPlayers,
+    ),
+    ServiceCase(
+        "clubs.players_national",
+        TransfermarktClubPlayers,
+        {"club_id": "3262", "season_id": "2024", "is_national": True},
+        "get_club_players",
+        clubs.ClubPlayers,
+    ),
+    ServiceCase(
+        "clubs.managers",
+        TransfermarktClubManagers,
+        {"club_id": "131"},
+        "get_club_managers",
+        clubs.ClubManagers,
+    ),
+    ServiceCase("clubs.search", TransfermarktClubSearch, {"query": "barcelona"}, "search_clubs", clubs.ClubSearch),
+    ServiceCase(
+        "competitions.clubs",
+        TransfermarktCompetitionClubs,
+        {"competition_id": "ES1", "season_id": "2024"},
+        "get_competition_clubs",
+        competitions.CompetitionClubs,
+    ),
+    ServiceCase(
+        "competitions.clubs_knockout",
+        TransfermarktCompetitionClubs,
+        {"competition_id": "CAM", "season_id": "2023", "is_knockout": True},
+        "get_competition_clubs",
+        competitions.CompetitionClubs,
+    ),
+    ServiceCase(
+        "competitions.search",
+        TransfermarktCompetitionSearch,
+        {"query": "liga"},
+        "search_competitions",
+        competitions.CompetitionSearch,
+    ),
+    ServiceCase(
+        "managers.profile",
+        TransfermarktManagerProfile,
+        {"manager_id": "1002"},
+        "get_manager_profile",
+        managers.ManagerProfile,
+    ),
+    ServiceCase(
+        "managers.contracts",
+        TransfermarktManagerContracts,
+        {"manager_id": "1002"},
+        "get_manager_contracts",
+        managers.ManagerContracts,
+    ),
+]
@@ -0,0 +1,115 @@
+"""
+Load test comparing the sync (thread pool) and async route modes against the local stub upstream.
+
+Both modes serve `/players/{player_id}/profile`: the sync one from a `def` handler that blocks a Starlette worker
+thread on `TransfermarktPlayerProfile(...)`, the async one from the API app, which awaits
+`TransfermarktPlayerProfile.acreate(...)`. Each app runs in its own uvicorn process pointed at the stub upstream,
+which answers after a fixed latency to mimic the round trip to transfermarkt.com.
+
+The sync mode tops out at roughly (thread pool size / upstream latency) requests per second, since every request
+holds one of Starlette's 40 worker threads for the whole upstream round trip; the async mode is only bound by CPU.
+
+Usage:
+    python -m benchmarks.load_async --requests 400 --concurrency 200 --latency 3
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.services.players.profile import TransfermarktPlayerProfile
+from benchmarks.stub_server import StubServer
+
+sync_app = FastAPI()
+
+
+@sync_app.get("/players/{player_id}/profile")
+def get_player_profile(player_id: str):
+    """Previous, thread pool based implementation of the player profile route."""
+    tfmkt = TransfermarktPlayerProfile(player_id=player_id)
+    return tfmkt.get_player_profile()
+
+
+MODES = {
+    "sync": "benchmarks.load_async:sync_app",
+    "async": "app.main:app",
+}
+
+
+async def generate_load(base_url: str, requests: int, concurrency: int) -> tuple[float, list]:
+    """
+    Send requests to the API with a fixed number of them in flight at any time.
+
+    Returns:
+        tuple[float, list]: The elapsed wall time, and the latency of each successful request.
+    """
+    queue = iter(range(requests))
+    latencies = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+
+        async def worker() -> None:
+            for _ in queue:
+                start = time.perf_counter()
+                try:
+                    response = await client.get("/players/28003/profile")
+                except httpx.TransportError:
+                    continue
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        return time.perf_counter() - start, latencies
+
+
+def wait_until_ready(base_url: str, timeout: float = 30) -> None:
+    """Poll the API until it accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(base_url + "/docs")
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise TimeoutError(f"API at {base_url} did not start")
+
+
+def run_mode(app: str, upstream: str, port: int, requests: int, concurrency: int) -> tuple[float, list]:
+    """Start the app under uvicorn, load it, and stop it."""
+    env = {**os.environ, "TRANSFERMARKT_BASE_URL": upstream}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_until_ready(base_url)
+        return asyncio.run(generate_load(base_url, requests, concurrency))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=1.0, help="stub upstream latency in seconds")
+    parser.add_argument("--port", type=int, default=8010)
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency) as stub:
+        print(f"{'mode':<8}{'ok':>8}{'req/s':>10}{'mean (ms)':>12}{'max (ms)':>12}")
+        for mode, app in MODES.items():
+            elapsed, latencies = run_mode(app, stub.url, args.port, args.requests, args.concurrency)
+            mean = sum(latencies) / len(latencies) * 1000 if latencies else float("nan")
+            worst = max(latencies) * 1000 if latencies else float("nan")
+            print(f"{mode:<8}{len(latencies):>8}{len(latencies) / elapsed:>10.1f}{mean:>12.1f}{worst:>12.1f}")
@@ -0,0 +1,214 @@
+"""
+Load test of the API routes against the local stub upstream, reporting the latency percentiles and the throughput of
+each route.
+
+The API runs in a uvicorn process pointed at the stub upstream through `TRANSFERMARKT_BASE_URL`, so no request
+reaches transfermarkt.com. The stub answers after `--latency` seconds plus up to `--jitter` random seconds, and
+answers a share `--error-rate` of the requests with `--error-status`, to load the API under a slow or failing
+upstream. Pass `--api` to load an API that is already running (pointed at a stub server of its own) instead.
+
+The requests cycle through the routes in `ROUTES` (or those whose path contains `-k`), with `--concurrency` of them
+in flight at any time. For each route, the report gives the number of requests, the number answered with a 2xx
+status, the 50th, 95th and 99th latency percentiles in milliseconds, and the requests per second served over the
+whole run.
+
+Usage:
+    python -m benchmarks.load_routes --requests 2000 --concurrency 50 --latency 0.2 --jitter 0.1
+    python -m benchmarks.load_routes --error-rate 0.1 --error-status 503 -k players
+    python -m benchmarks.load_routes --api http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import NamedTuple, Optional
+
+import httpx
+
+from benchmarks.load_async import wait_until_ready
+from benchmarks.stub_server import StubServer
+
+ROUTES: list[str] = [
+    "/players/search/messi",
+    "/players/28003/profile",
+    "/players/28003/market_value",
+    "/players/28003/transfers",
+    "/players/28003/jersey_numbers",
+    "/players/28003/stats",
+    "/players/28003/injuries",
+    "/players/28003/achievements",
+    "/clubs/search/barcelona",
+    "/clubs/131/profile",
+    "/clubs/131/players?season_id=2024",
+    "/clubs/131/managers",
+    "/competitions/search/liga",
+    "/competitions/ES1/clubs?season_id=2024",
+    "/managers/profile/1002",
+    "/managers/contracts/1002",
+]
+
+
+class RouteReport(NamedTuple):
+    """The load test results of one route."""
+
+    route: str
+    requests: int
+    ok: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput: float
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    The q-th percentile of the values, by the nearest-rank method.
+
+    Args:
+        values (list[float]): The values, in any order.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The smallest value that is greater than or equal to q percent of the values, or NaN if there are none.
+    """
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize(samples: dict[str, list[tuple[int, float]]], elapsed: float) -> list[RouteReport]:
+    """
+    Summarize the samples of every route, and of all of them together as a last `total` row.
+
+    Args:
+        samples (dict): The status code and latency in seconds of every request, by route.
+        elapsed (float): The wall time of the run in seconds.
+
+    Returns:
+        list[RouteReport]: The report of each route, in the order of the samples, followed by the total.
+    """
+    reports = []
+    everything = [sample for route_samples in samples.values() for sample in route_samples]
+    for route, route_samples in [*samples.items(), ("total", everything)]:
+        latencies = [latency * 1000 for _, latency in route_samples]
+        reports.append(
+            RouteReport(
+                route=route,
+                requests=len(route_samples),
+                ok=sum(200 <= status < 300 for status, _ in route_samples),
+                p50_ms=percentile(latencies, 50),
+                p95_ms=percentile(latencies, 95),
+                p99_ms=percentile(latencies, 99),
+                throughput=len(route_samples) / elapsed if elapsed else math.nan,
+            ),
+        )
+    return reports
+
+
+async def generate_load(
+    base_url: str,
+    routes: list[str],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, dict[str, list[tuple[int, float]]]]:
+    """
+    Send requests to the routes in turn, with a fixed number of them in flight at any time.
+
+    Requests that fail without a response (e.g. timed out) are recorded with status 0.
+
+    Returns:
+        tuple[float, dict]: The elapsed wall time, and the status code and latency of each request by route.
+    """
+    queue = iter(itertools.islice(itertools.cycle(routes), requests))
+    samples = defaultdict(list)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+
+        async def worker() -> None:
+            for route in queue:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(route)
+                    status = response.status_code
+                except httpx.TransportError:
+                    status = 0
+                samples[route].append((status, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+
+    return elapsed, {route: samples[route] for route in routes if route in samples}
+
+
+def print_reports(reports: list[RouteReport]) -> None:
+    """Print the reports as a table."""
+    width = max(len(report.route) for report in reports) + 2
+    print(f"{'route':<{width}}{'requests':>10}{'ok':>8}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}{'req/s':>10}")
+    for report in reports:
+        print(
+            f"{report.route:<{width}}{report.requests:>10}{report.ok:>8}{report.p50_ms:>12.1f}{report.p95_ms:>12.1f}"
+            f"{report.p99_ms:>12.1f}{report.throughput:>10.1f}",
+        )
+
+
+def run(
+    api: Optional[str],
+    upstream: str,
+    port: int,
+    routes: list[str],
+    requests: int,
+    concurrency: int,
+) -> list[RouteReport]:
+    """Start the API under uvicorn pointed at the upstream, unless one is given, load it, and stop it."""
+    process = None
+    if api is None:
+        env = {**os.environ, "TRANSFERMARKT_BASE_URL": upstream, "RATE_LIMITING_ENABLE": "false"}
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+            env=env,
+        )
+        api = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(api)
+        elapsed, samples = asyncio.run(generate_load(api, routes, requests, concurrency))
+        return summarize(samples, elapsed)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1600, help="requests in total, spread over the routes")
+    parser.add_argument("--concurrency", type=int, default=50, help="requests in flight at any time")
+    parser.add_argument("-k", default="", help="only load the routes whose path contains this")
+    parser.add_argument("--api", default=None, help="base URL of a running API to load instead of starting one")
+    parser.add_argument("--port", type=int, default=8010, help="port of the API started by the script")
+    parser.add_argument("--latency", type=float, default=0.1, help="stub upstream latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of upstream requests failing")
+    parser.add_argument("--error-status", type=int, default=503, help="status code of the injected upstream errors")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random jitter and errors")
+    args = parser.parse_args()
+
+    selected = [route for route in ROUTES if args.k in route]
+    stub = StubServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    with stub:
+        print_reports(run(args.api, stub.url, args.port, selected, args.requests, args.concurrency))
+        print(f"\nUpstream: {sum(stub.hits.values())} requests, {sum(stub.errors.values())} injected errors")
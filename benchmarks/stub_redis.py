@@ -0,0 +1,158 @@
+"""
+Local stand-in for a Redis server, speaking enough of its protocol (RESP2) for `RedisCache`: PING, AUTH, SELECT, GET,
+SET (with PX or EX), PTTL and DEL.
+
+The values are kept by a `MemoryRemoteCache`, so the server behaves like the in-process stand-in the API can use
+instead, over the network. It runs on its own asyncio event loop, counting the commands it answered by name.
+
+Usage:
+    python -m benchmarks.stub_redis --port 6380
+"""
+
+import argparse
+import asyncio
+import threading
+from collections import Counter
+from typing import Optional
+
+from app.cache.remote import MemoryRemoteCache
+
+
+def encode_reply(reply) -> bytes:
+    """Encode a reply: None as a null bulk string, an int as an integer, bytes as a bulk string."""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    return b"$%d\r\n%s\r\n" % (len(reply), reply)
+
+
+class StubRedisServer:
+    """
+    Server bound to a local port, answering the commands of `RedisCache` from a `MemoryRemoteCache`.
+
+    Args:
+        host (str): The interface to bind to.
+        port (int): The port to bind to. Port 0 picks a free one.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.store = MemoryRemoteCache()
+        self.commands = Counter()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writers: set = set()
+
+    @property
+    def url(self) -> str:
+        """The URL the server is reachable at."""
+        return f"redis://{self.host}:{self.port}/0"
+
+    def execute(self, name: str, args: list[bytes]) -> bytes:
+        """
+        Run a command.
+
+        Args:
+            name (str): The upper-cased name of the command.
+            args (list[bytes]): Its arguments.
+
+        Returns:
+            bytes: The encoded reply.
+        """
+        self.commands[name] += 1
+        if name in ("PING", "AUTH", "SELECT"):
+            return b"+PONG\r\n" if name == "PING" else b"+OK\r\n"
+        if name == "GET" and len(args) == 1:
+            return encode_reply(self.store.get(args[0].decode()))
+        if name == "SET" and len(args) == 4 and args[2].upper() in (b"PX", b"EX"):
+            ttl = int(args[3]) / (1000 if args[2].upper() == b"PX" else 1)
+            self.store.set(args[0].decode(), args[1], ttl)
+            return b"+OK\r\n"
+        if name == "PTTL" and len(args) == 1:
+            ttl = self.store.ttl(args[0].decode())
+            return encode_reply(-2 if ttl is None else int(ttl * 1000))
+        if name == "DEL" and len(args) == 1:
+            existed = self.store.get(args[0].decode()) is not None
+            self.store.delete(args[0].decode())
+            return encode_reply(int(existed))
+        return f"-ERR unsupported command '{name}'\r\n".encode()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the commands sent over one connection until the client closes it."""
+        self._writers.add(writer)
+        try:
+            while True:
+                count = int((await reader.readuntil(b"\r\n"))[1:-2])
+                args = []
+                for _ in range(count):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self.execute(args[0].decode().upper(), args[1:]))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError, IndexError):
+            pass
+        finally:
+            writer.close()
+            self._writers.discard(writer)
+
+    async def serve(self) -> None:
+        """Bind the listening socket and record the port it got."""
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def serve_forever(self) -> None:
+        """Serve commands from the calling thread until interrupted."""
+
+        async def main() -> None:
+            await self.serve()
+            print(f"Serving {self.url}")
+            await self._server.serve_forever()
+
+        asyncio.run(main())
+
+    def start(self) -> "StubRedisServer":
+        """Serve commands from a background thread."""
+        started = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.serve())
+            started.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+
+        async def close() -> None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            while self._writers:
+                await asyncio.sleep(0.01)
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> "StubRedisServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6380)
+    args = parser.parse_args()
+    StubRedisServer(host=args.host, port=args.port).serve_forever()
@@ -0,0 +1,287 @@
+"""
+Local stand-in for transfermarkt.com that serves the pages in `benchmarks/corpus`: synthetic pages hand-built after the
+Transfermarkt markup the XPaths target and trimmed, and ceapi JSON documents of the same shape, not recordings of the
+live site.
+
+The server runs on its own asyncio event loop, so it can hold thousands of concurrent keep-alive connections open
+while it waits out the configured latency, and never becomes the bottleneck of a load test. On top of the fixed
+latency, each answer can be delayed by a random jitter, and a share of the requests can be answered with an error
+status instead of the page, to see how the API behaves when transfermarkt.com is slow or failing.
+
+The pages are served with an `ETag` (a hash of their content) and a `Last-Modified` date (the modification time of
+their file), and conditional requests for pages that did not change are answered with a 304 Not Modified.
+
+Usage:
+    python -m benchmarks.stub_server --port 8001 --latency 0.2
+    python -m benchmarks.stub_server --port 8001 --latency 0.2 --jitter 0.1 --error-rate 0.05 --error-status 503
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import re
+import threading
+from collections import Counter
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+# Player 0 does not exist, and player 1 has no market value nor transfer history, as the ceapi JSON tells neither apart
+ROUTES: list[tuple[re.Pattern, Optional[str]]] = [
+    (re.compile(r"^/[^/]+/[^/]+/spieler/0$"), None),
+    (re.compile(r"^/ceapi/marketValueDevelopment/graph/[01]$"), "ceapi_market_value_graph_empty.json"),
+    (re.compile(r"^/ceapi/transferHistory/list/[01]$"), "ceapi_transfer_history_empty.json"),
+    (re.compile(r"^/[^/]+/profil/spieler/\d+$"), "profil_spieler.html"),
+    (re.compile(r"^/[^/]+/marktwertverlauf/spieler/\d+$"), "marktwertverlauf_spieler.html"),
+    (re.compile(r"^/ceapi/marketValueDevelopment/graph/\d+$"), "ceapi_market_value_graph.json"),
+    (re.compile(r"^/[^/]+/transfers/spieler/\d+$"), "transfers_spieler.html"),
+    (re.compile(r"^/ceapi/transferHistory/list/\d+$"), "ceapi_transfer_history.json"),
+    (re.compile(r"^/[^/]+/rueckennummern/spieler/\d+$"), "rueckennummern_spieler.html"),
+    (re.compile(r"^/[^/]+/leistungsdatendetails/spieler/\d+$"), "leistungsdatendetails_spieler.html"),
+    (re.compile(r"^/[^/]+/verletzungen/spieler/\d+(/plus/1)?(/page/\d+)?$"), "verletzungen_spieler.html"),
+    (re.compile(r"^/[^/]+/erfolge/spieler/\d+$"), "erfolge_spieler.html"),
+    (re.compile(r"^/schnellsuche/ergebnis/schnellsuche$"), "schnellsuche.html"),
+    (re.compile(r"^/[^/]+/datenfakten/verein/\d+$"), "datenfakten_verein.html"),
+    (re.compile(r"^/[^/]+/kader/verein/3262(/saison_id/\d+)?(/plus/1)?$"), "kader_verein_national.html"),
+    (re.compile(r"^/[^/]+/kader/verein/\d+(/saison_id/\d+)?(/plus/1)?$"), "kader_verein.html"),
+    (re.compile(r"^/[^/]+/mitarbeiterhistorie/verein/\d+(/personalie_id/\d+)?$"), "mitarbeiterhistorie_verein.html"),
+    (re.compile(r"^/[^/]+/startseite/wettbewerb/\w+(/plus/?)?$"), "startseite_wettbewerb.html"),
+    (re.compile(r"^/[^/]+/teilnehmer/pokalwettbewerb/\w+(/saison_id/\d+)?$"), "teilnehmer_pokalwettbewerb.html"),
+    (re.compile(r"^/[^/]+/profil/trainer/\d+$"), "profil_trainer.html"),
+    (re.compile(r"^/[^/]+/stationen/trainer/\d+$"), "stationen_trainer.html"),
+]
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+}
+
+
+def resolve(path: str) -> Optional[Path]:
+    """
+    Resolve a request path to the corpus file that answers it.
+
+    Args:
+        path (str): The request path, without the query string.
+
+    Returns:
+        Optional[Path]: The corpus file for the path, or None if no route matches or the page does not exist.
+    """
+    for pattern, filename in ROUTES:
+        if pattern.match(path):
+            return CORPUS_DIR / filename if filename else None
+    return None
+
+
+def is_not_modified(headers: dict, etag: str, mtime: float) -> bool:
+    """
+    Check whether a conditional request is for the current version of a page.
+
+    Args:
+        headers (dict): The request headers, with lower-cased names.
+        etag (str): The ETag of the page.
+        mtime (float): The Unix time the page was last modified at.
+
+    Returns:
+        bool: True if the page matches the `If-None-Match` header, or, without one, if it was not modified since the
+            `If-Modified-Since` date.
+    """
+    if "if-none-match" in headers:
+        return etag in [tag.strip() for tag in headers["if-none-match"].split(",")] or headers["if-none-match"] == "*"
+    if "if-modified-since" in headers:
+        try:
+            return int(mtime) <= parsedate_to_datetime(headers["if-modified-since"]).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class StubServer:
+    """
+    HTTP/1.1 server bound to a local port, counting accepted connections, hits and 304 answers per path.
+
+    Args:
+        host (str): The interface to bind to.
+        port (int): The port to bind to. Port 0 picks a free one.
+        latency (float): Seconds to wait before answering each request, to mimic the upstream round trip.
+        jitter (float): Maximum number of seconds added at random to the latency of each request.
+        error_rate (float): Share of the requests, between 0 and 1, answered with `error_status` instead of the page.
+        error_status (int): The status code of the injected errors.
+        seed (int, optional): Seed of the random jitter and errors, to make a run reproducible.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.connections = 0
+        self.hits = Counter()
+        self.errors = Counter()
+        self.not_modified = Counter()
+        self._random = random.Random(seed)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._writers: set = set()
+
+    @property
+    def url(self) -> str:
+        """The base URL the server is reachable at."""
+        return f"http://{self.host}:{self.port}"
+
+    def reset_counters(self) -> None:
+        """Reset the connection, hit, injected error and 304 counters."""
+        self.connections = 0
+        self.hits.clear()
+        self.errors.clear()
+        self.not_modified.clear()
+
+    async def respond(self, path: str, headers: dict) -> tuple[int, dict, bytes]:
+        """
+        Build the response to a GET request.
+
+        Args:
+            path (str): The request path, without the query string.
+            headers (dict): The request headers, with lower-cased names.
+
+        Returns:
+            tuple[int, dict, bytes]: The status code, the response headers and the body.
+        """
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors[path] += 1
+            phrase = HTTPStatus(self.error_status).phrase
+            return (
+                self.error_status,
+                {"Content-Type": "text/html; charset=utf-8"},
+                f"<html><body>{phrase}</body></html>".encode(),
+            )
+        file = resolve(path)
+        if file is None:
+            return 404, {"Content-Type": "text/html; charset=utf-8"}, b"<html><body>Not found</body></html>"
+        content, mtime = file.read_bytes(), file.stat().st_mtime
+        validators = {"ETag": f'"{hashlib.sha1(content).hexdigest()}"', "Last-Modified": formatdate(mtime, usegmt=True)}
+        if is_not_modified(headers, validators["ETag"], mtime):
+            self.not_modified[path] += 1
+            return 304, validators, b""
+        return 200, {"Content-Type": CONTENT_TYPES[file.suffix], **validators}, content
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer the requests sent over one connection until the client closes it."""
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                target = request_line.split(" ")[1]
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, value in (line.split(":", 1) for line in header_lines if ":" in line)
+                }
+                path = target.split("?", 1)[0]
+                self.hits[path] += 1
+
+                status, response_headers, body = await self.respond(path, headers)
+                response_headers["Content-Length"] = str(len(body))
+                lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+                lines += [f"{name}: {value}" for name, value in response_headers.items()]
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            self._writers.discard(writer)
+
+    async def serve(self) -> None:
+        """Bind the listening socket and record the port it got."""
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def serve_forever(self) -> None:
+        """Serve requests from the calling thread until interrupted."""
+
+        async def main() -> None:
+            await self.serve()
+            print(f"Serving {CORPUS_DIR} on {self.url}")
+            await self._server.serve_forever()
+
+        asyncio.run(main())
+
+    def start(self) -> "StubServer":
+        """Serve requests from a background thread."""
+        started = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.serve())
+            started.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+
+        async def close() -> None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            while self._writers:
+                await asyncio.sleep(0.01)
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before each answer")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of the requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503, help="status code of the injected errors")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random jitter and errors")
+    args = parser.parse_args()
+    StubServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    ).serve_forever()
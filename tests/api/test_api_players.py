@@ -0,0 +1,158 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import players
+from app.main import app
+from app.settings import settings
+
+
+def test_get_player_profile(stub_upstream):
+    with TestClient(app) as client:
+        response = client.get("/players/28003/profile")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Lionel Messi"
+    assert response.json()["marketValue"] == 30_000_000
+
+
+def test_get_player_profile_concurrent_coalesced(stub_upstream):
+    stub_upstream.latency = 0.1
+
+    async def get_many():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*[client.get("/players/28003/profile") for _ in range(20)])
+
+    responses = asyncio.run(get_many())
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.json()["name"] for response in responses}) == 1
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 1
+
+
+def test_get_players_profiles_batch(stub_upstream):
+    with TestClient(app) as client:
+        response = client.post("/players/profile:batch", json={"ids": ["28003", "abc"]})
+
+    assert response.status_code == 200
+    found, not_found = response.json()["results"]
+    assert found["id"] == "28003"
+    assert found["result"]["name"] == "Lionel Messi"
+    assert "error" not in found
+    assert not_found["id"] == "abc"
+    assert not_found["error"]["statusCode"] == 404
+    assert "result" not in not_found
+
+
+def test_get_players_market_values_batch_stream(stub_upstream):
+    with TestClient(app) as client:
+        response = client.post("/players/market_value:batch?stream=true", json={"ids": ["28003", "28003", "abc"]})
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(item["id"] for item in items) == ["28003", "28003", "abc"]
+    assert all(item["result"]["id"] == "28003" for item in items if item["id"] == "28003")
+
+
+def test_get_players_batch_isolates_unexpected_errors(stub_upstream, monkeypatch):
+    get_player_profile = players.get_player_profile
+
+    async def broken_profile(player_id: str):
+        if player_id == "broken":
+            raise IndexError("list index out of range")
+        return await get_player_profile(player_id)
+
+    monkeypatch.setattr(players, "get_player_profile", broken_profile)
+    with TestClient(app) as client:
+        response = client.post("/players/profile:batch", json={"ids": ["broken", "28003"]})
+        streamed = client.post("/players/profile:batch?stream=true", json={"ids": ["broken", "28003"]})
+
+    assert response.status_code == 200
+    broken, found = response.json()["results"]
+    assert broken["error"]["statusCode"] == 500
+    assert found["result"]["name"] == "Lionel Messi"
+    items = {item["id"]: item for item in map(json.loads, streamed.text.splitlines())}
+    assert items["broken"]["error"]["statusCode"] == 500
+    assert items["28003"]["result"]["name"] == "Lionel Messi"
+
+
+def test_get_players_profiles_batch_too_many_ids():
+    with TestClient(app) as client:
+        response = client.post("/players/profile:batch", json={"ids": ["28003"] * (settings.BATCH_MAX_IDS + 1)})
+
+    assert response.status_code == 422
+
+
+def test_get_player_market_value_history_only(stub_upstream):
+    with TestClient(app) as client:
+        response = client.get("/players/28003/market_value?history_only=true")
+
+    assert response.status_code == 200
+    assert response.json()["marketValueHistory"]
+    assert "ranking" not in response.json()
+    assert stub_upstream.hits["/-/marktwertverlauf/spieler/28003"] == 0
+
+
+@pytest.mark.parametrize("route", ["market_value", "transfers"])
+def test_get_player_history_only_not_found(stub_upstream, route):
+    with TestClient(app) as client:
+        not_found = client.get(f"/players/0/{route}?history_only=true")
+        empty = client.get(f"/players/1/{route}?history_only=true")
+
+    assert not_found.status_code == 404
+    assert empty.status_code == 200
+    assert empty.json()["marketValueHistory" if route == "market_value" else "transfers"] == []
+
+
+def test_get_player_full(stub_upstream):
+    with TestClient(app) as client:
+        response = client.get("/players/28003/full")
+
+    assert response.status_code == 200
+    full = response.json()
+    sections = ["profile", "marketValue", "transfers", "stats", "injuries", "achievements", "jerseyNumbers", "search"]
+    assert all("result" in full[section] and "error" not in full[section] for section in sections)
+    assert all(full[section]["durationMs"] >= 0 for section in sections)
+    assert full["profile"]["result"]["name"] == "Lionel Messi"
+    assert stub_upstream.hits["/schnellsuche/ergebnis/schnellsuche"] == 1
+
+
+def test_get_player_full_isolates_errors(stub_upstream, monkeypatch):
+    async def broken_stats(player_id: str):
+        raise HTTPException(status_code=500, detail="Broken")
+
+    monkeypatch.setattr(players, "get_player_stats", broken_stats)
+    with TestClient(app) as client:
+        response = client.get("/players/28003/full")
+
+    assert response.status_code == 200
+    assert response.json()["stats"]["error"] == {"statusCode": 500, "detail": "Broken"}
+    assert response.json()["profile"]["result"]["id"] == "28003"
+
+
+def test_get_player_full_isolates_unexpected_errors(stub_upstream, monkeypatch):
+    async def broken_injuries(player_id: str):
+        raise IndexError("list index out of range")
+
+    monkeypatch.setattr(players, "get_player_injuries", broken_injuries)
+    with TestClient(app) as client:
+        response = client.get("/players/28003/full")
+
+    assert response.status_code == 200
+    assert response.json()["injuries"]["error"]["statusCode"] == 500
+    assert "result" not in response.json()["injuries"]
+    assert response.json()["stats"]["result"]["id"] == "28003"
+
+
+def test_get_player_full_not_found(stub_upstream):
+    with TestClient(app) as client:
+        response = client.get("/players/abc/full")
+
+    assert response.status_code == 200
+    assert response.json()["profile"]["error"]["statusCode"] == 404
+    assert response.json()["search"]["error"]["statusCode"] == 424
@@ -0,0 +1,56 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.settings import settings
+from benchmarks.load_routes import ROUTES
+
+# The parts of a response that change from one request to the next
+VOLATILE = re.compile(rb'"(updatedAt|durationMs)":("[^"]*"|[\d.e+-]+)')
+
+ROUTES = [*ROUTES, "/clubs/3262/players?season_id=2024", "/players/28003/full"]
+
+REQUESTS = [("GET", route, None) for route in ROUTES] + [
+    ("POST", "/players/profile:batch", {"ids": ["28003", "abc"]}),
+    ("POST", "/players/market_value:batch", {"ids": ["28003"]}),
+]
+
+
+# The settings serializing the responses differently from FastAPI with the `json` module
+VARIANTS = {
+    "dump_json": {"FAST_SERIALIZATION_ENABLE": True},
+    "orjson": {"FAST_SERIALIZATION_ENABLE": False, "JSON_ENCODER": "orjson"},
+    "streaming": {"FAST_SERIALIZATION_ENABLE": True, "STREAMING_MIN_ITEMS": 1, "STREAMING_CHUNK_ITEMS": 2},
+}
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("method,url,body", REQUESTS, ids=[url for _, url, _ in REQUESTS])
+def test_serialization_same_json(method, url, body, variant, stub_upstream, monkeypatch):
+    with TestClient(app) as client:
+        monkeypatch.setattr(settings, "FAST_SERIALIZATION_ENABLE", False)
+        monkeypatch.setattr(settings, "JSON_ENCODER", "json")
+        expected = client.request(method, url, json=body)
+        for name, value in VARIANTS[variant].items():
+            monkeypatch.setattr(settings, name, value)
+        response = client.request(method, url, json=body)
+
+    assert response.status_code == expected.status_code == 200
+    assert response.headers["content-type"] == expected.headers["content-type"]
+    assert VOLATILE.sub(rb"\1", response.content) == VOLATILE.sub(rb"\1", expected.content)
+
+
+def test_streaming_long_lists(stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "STREAMING_MIN_ITEMS", 10)
+    monkeypatch.setattr(settings, "STREAMING_CHUNK_ITEMS", 4)
+    with TestClient(app) as client:
+        streamed = client.get("/clubs/131/players?season_id=2024")
+        monkeypatch.setattr(settings, "STREAMING_MIN_ITEMS", 1000)
+        whole = client.get("/clubs/131/players?season_id=2024")
+
+    assert "content-length" not in streamed.headers
+    assert whole.headers["content-length"] == str(len(whole.content))
+    assert len(streamed.json()["players"]) >= 10
+    assert VOLATILE.sub(rb"\1", streamed.content) == VOLATILE.sub(rb"\1", whole.content)
@@ -0,0 +1,59 @@
+import os
+import time
+
+from app.cache import CacheEntry, DiskCache
+from app.cache.disk import LOW_WATER_RATIO
+
+
+def entry(content: bytes, ttl: float = 60) -> CacheEntry:
+    return CacheEntry(
+        content=content,
+        headers={"Content-Type": "text/html; charset=utf-8"},
+        status_code=200,
+        expires_at=time.time() + ttl,
+    )
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=10_000)
+    stored = entry(b"<html>\n</html>")
+    cache.set("https://www.transfermarkt.com/-/profil/spieler/28003", stored)
+
+    assert cache.get("https://www.transfermarkt.com/-/profil/spieler/28003") == stored
+    assert cache.get("https://www.transfermarkt.com/-/profil/spieler/1") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    DiskCache(str(tmp_path), max_bytes=10_000).set("a", entry(b"body"))
+    cache = DiskCache(str(tmp_path), max_bytes=10_000)
+
+    assert cache.size > 0
+    assert cache.get("a").content == b"body"
+
+
+def test_disk_cache_expired_entry_is_deleted(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=10_000)
+    cache.set("a", entry(b"body", ttl=-1))
+
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=100_000)
+    for i in range(10):
+        cache.set(str(i), entry(b"x" * 1000))
+        os.utime(cache._path(str(i)), (i + 1, i + 1))
+    cache.max_bytes = cache.size + 100
+    cache.set("new", entry(b"x" * 1000))
+
+    assert cache.get("0") is None and cache.get("1") is None
+    assert all(cache.get(str(i)) is not None for i in range(3, 10))
+    assert cache.get("new") is not None
+    assert cache.size <= cache.max_bytes * LOW_WATER_RATIO
+    evictions = cache.stats.evictions
+    assert evictions >= 2
+
+    cache.set("other", entry(b"x" * 100))
+    assert cache.stats.evictions == evictions
@@ -0,0 +1,70 @@
+import time
+
+from app.cache import CacheEntry, MemoryCache
+
+
+def entry(content: bytes, ttl: float = 60) -> CacheEntry:
+    return CacheEntry(content=content, headers={}, status_code=200, expires_at=time.time() + ttl)
+
+
+def test_memory_cache_hit_and_miss():
+    cache = MemoryCache(max_bytes=100)
+    cache.set("a", entry(b"body"))
+
+    assert cache.get("a").content == b"body"
+    assert cache.get("b") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_memory_cache_expired_entry_is_dropped():
+    cache = MemoryCache(max_bytes=100)
+    cache.set("a", entry(b"body", ttl=-1))
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", entry(b"aaaa"))
+    cache.set("b", entry(b"bbbb"))
+    cache.get("a")
+    cache.set("c", entry(b"cccc"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size == 8
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_skips_entries_over_bound():
+    cache = MemoryCache(max_bytes=4)
+    cache.set("a", entry(b"too large"))
+
+    assert len(cache) == 0
+
+
+def test_memory_cache_keeps_expired_entries_on_request():
+    cache = MemoryCache(max_bytes=100)
+    cache.set("a", entry(b"body", ttl=-1))
+
+    assert cache.get("a", include_expired=True).content == b"body"
+    assert cache.get("a") is None
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+
+def test_memory_cache_accounts_for_kept_pages():
+    cache = MemoryCache(max_bytes=100)
+    kept, other = entry(b"aaaa"), entry(b"bbbb")
+    cache.set("a", kept)
+    cache.set("b", other)
+    cache.keep_page("a", kept, page=object())
+    cache.keep_page("b", entry(b"bbbb"), page=object())
+
+    assert cache.get("a").page is not None
+    assert cache.get("b").page is None
+    assert cache.size == 4 * 11 + 4
+    cache.delete("a")
+    assert cache.size == 4
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.cache import NegativeCache, NegativeEntry, get_negative_cache
+from app.main import app
+from app.services.base import TransfermarktBase
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+URL = "https://www.transfermarkt.com/-/profil/spieler/28003"
+
+
+def avoided(family: str = "profile") -> float:
+    return REGISTRY.get_sample_value("transfermarkt_negative_cache_hits_total", {"family": family}) or 0
+
+
+def test_negative_cache_expiry_and_bound():
+    cache = NegativeCache(max_entries=2)
+    cache.set("a", NegativeEntry(404, "Not found", expires_at=time.time() - 1))
+    cache.set("b", NegativeEntry(404, "Not found", expires_at=time.time() + 60))
+    cache.set("c", NegativeEntry(403, "Forbidden", expires_at=time.time() + 60))
+    cache.set("d", NegativeEntry(404, "Not found", expires_at=time.time() + 60))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c").status_code == 403
+    assert cache.stats.evictions == 2
+
+
+def test_client_errors_answered_from_memory(stub_upstream, response_cache):
+    before = avoided()
+    for _ in range(3):
+        with pytest.raises(HTTPException) as error:
+            TransfermarktPlayerProfile(player_id="abc")
+        assert error.value.status_code == 404
+
+    assert stub_upstream.hits["/-/profil/spieler/abc"] == 1
+    assert avoided() == before + 2
+
+
+def test_not_found_pages_answered_from_memory(stub_upstream, response_cache):
+    tfmkt = TransfermarktBase(URL=URL)
+    tfmkt.page = tfmkt.request_url_page()
+    with pytest.raises(HTTPException):
+        tfmkt.raise_exception_if_not_found("//div[@id='missing']")
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003"))
+
+    assert error.value.detail == f"Invalid request (url: {URL})"
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 1
+
+
+def test_negative_entries_expire(stub_upstream, response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_NEGATIVE_TTL", 0)
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            TransfermarktPlayerProfile(player_id="abc")
+
+    assert stub_upstream.hits["/-/profil/spieler/abc"] == 2
+    assert len(get_negative_cache()) == 0
+
+
+def test_server_errors_not_cached(stub_upstream, response_cache):
+    stub_upstream.error_rate = 1.0
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            TransfermarktBase(URL=URL).make_request()
+        assert error.value.status_code == 503
+
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 2
+
+
+def test_api_answers_probes_from_memory(stub_upstream, response_cache):
+    with TestClient(app) as client:
+        responses = [client.get("/players/abc/profile") for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [404, 404]
+    assert responses[0].json() == responses[1].json()
+    assert stub_upstream.hits["/-/profil/spieler/abc"] == 1
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.cache import (
+    CacheEntry,
+    MemoryRemoteCache,
+    RedisCache,
+    RemoteEntries,
+    get_remote_entries,
+    get_response_cache,
+    get_result_cache,
+)
+from app.main import app
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+from benchmarks.stub_redis import StubRedisServer
+
+PATH = "/-/profil/spieler/28003"
+URL = "https://www.transfermarkt.com" + PATH
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        yield MemoryRemoteCache()
+    elif os.environ.get("TEST_REDIS_URL"):
+        yield RedisCache(os.environ["TEST_REDIS_URL"], timeout=1)
+    else:
+        with StubRedisServer() as server:
+            yield RedisCache(server.url, timeout=1)
+
+
+@pytest.fixture
+def key():
+    return f"test:{uuid.uuid4()}"
+
+
+@pytest.fixture
+def remote_cache(response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_REMOTE_URL", "memory://")
+    get_remote_entries.cache_clear()
+    get_response_cache.cache_clear()
+    yield get_remote_entries()
+    get_remote_entries.cache_clear()
+
+
+def join_other_node() -> None:
+    """Drop the local caches, as another node would not have them."""
+    get_response_cache.cache_clear()
+    get_result_cache.cache_clear()
+
+
+def test_contract_get_and_set(backend, key):
+    assert backend.get(key) is None
+    backend.set(key, b"\x00binary\r\n$-1\r\n", ttl=60)
+    backend.set(key + ":other", b"", ttl=60)
+
+    assert backend.get(key) == b"\x00binary\r\n$-1\r\n"
+    assert backend.get(key + ":other") == b""
+
+
+def test_contract_set_replaces_and_delete(backend, key):
+    backend.set(key, b"first", ttl=60)
+    backend.set(key, b"second", ttl=60)
+    assert backend.get(key) == b"second"
+
+    backend.delete(key)
+    backend.delete(key)
+    assert backend.get(key) is None
+
+
+def test_contract_ttl(backend, key):
+    assert backend.ttl(key) is None
+    backend.set(key, b"value", ttl=60)
+    assert 59 < backend.ttl(key) <= 60
+
+    backend.set(key, b"value", ttl=0.05)
+    time.sleep(0.1)
+    assert backend.get(key) is None
+    assert backend.ttl(key) is None
+
+
+def test_contract_get_many_in_one_round_trip(backend, key):
+    keys = [f"{key}:{i}" for i in range(50)]
+    for i in range(0, 50, 2):
+        backend.set(keys[i], str(i).encode(), ttl=60)
+    round_trips = backend.round_trips
+
+    values = backend.get_many(keys)
+
+    assert values == [str(i).encode() if i % 2 == 0 else None for i in range(50)]
+    assert backend.round_trips == round_trips + 1
+    assert backend.get_many([]) == []
+
+
+def test_entries_round_trip_and_failures_miss():
+    entries = RemoteEntries(MemoryRemoteCache(), "prefix:", lambda: 60)
+    entry = CacheEntry(content=b"<html>" * 100, headers={"ETag": '"v1"'}, status_code=200, expires_at=time.time() - 1)
+    entries.set("https://example.com", entry)
+
+    assert entries.get("https://example.com") is None
+    assert entries.get("https://example.com", include_expired=True) == entry
+    assert entries.backend.get("prefix:https://example.com") is not None
+
+    unreachable = RemoteEntries(RedisCache("redis://127.0.0.1:1/0", timeout=0.1), "prefix:", lambda: 60)
+    unreachable.set("https://example.com", entry)
+    assert unreachable.get("https://example.com") is None
+    assert unreachable.errors == 2
+
+
+def test_entries_cancelled_lookup_misses():
+    entries = RemoteEntries(MemoryRemoteCache(), "prefix:", lambda: 60)
+
+    async def lookup():
+        loop = asyncio.get_running_loop()
+
+        def cancelled(*args):
+            future = loop.create_future()
+            future.cancel()
+            return future
+
+        loop.run_in_executor = cancelled
+        return await asyncio.wait_for(entries.aget("https://example.com"), timeout=1)
+
+    assert asyncio.run(lookup()) is None
+
+
+def test_version_checks_stay_on_the_host(stub_upstream, remote_cache):
+    asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+    join_other_node()
+    round_trips = remote_cache.backend.round_trips
+
+    assert get_response_cache().peek(URL) is None
+    assert remote_cache.backend.round_trips == round_trips
+
+
+def test_nodes_share_pages(stub_upstream, remote_cache):
+    profile = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+    join_other_node()
+
+    again = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+    join_other_node()
+    synchronous = TransfermarktPlayerProfile(player_id="28003").get_player_profile()
+
+    assert again == synchronous == profile
+    assert stub_upstream.hits[PATH] == 1
+    assert remote_cache.stats.hits == 2
+
+
+def test_batch_lookups_are_pipelined(stub_upstream, remote_cache, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_MAX_CONCURRENCY", 20)
+    ids = [str(id) for id in range(1, 21)]
+    with TestClient(app) as client:
+        first = client.post("/players/profile:batch", json={"ids": ids})
+        join_other_node()
+        round_trips = remote_cache.backend.round_trips
+        second = client.post("/players/profile:batch", json={"ids": ids})
+
+    assert second.status_code == 200
+    assert [item["result"]["name"] for item in second.json()["results"]] == [
+        item["result"]["name"] for item in first.json()["results"]
+    ]
+    assert sum(stub_upstream.hits.values()) == 20
+    assert remote_cache.stats.hits == 20
+    assert remote_cache.backend.round_trips - round_trips == 1
@@ -0,0 +1,131 @@
+import asyncio
+import dataclasses
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.cache import ResultCache, ResultEntry, get_result_cache
+from app.main import app
+from app.services.players.market_value import TransfermarktPlayerMarketValue
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+URL = "https://www.transfermarkt.com/-/profil/spieler/28003"
+PATH = "/-/profil/spieler/28003"
+
+
+def extractions(service: str = "TransfermarktPlayerProfile") -> float:
+    return REGISTRY.get_sample_value("transfermarkt_extract_seconds_count", {"service": service}) or 0
+
+
+def profile(**kwargs) -> dict:
+    return asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003", **kwargs)).get_player_profile()
+
+
+def test_result_cache_bounds_and_versions():
+    cache = ResultCache(max_entries=2, max_bytes=250)
+    versions = {"a": "1"}
+    cache.set("a", ResultEntry({"id": "a"}, {"a": "1"}, size=100))
+    cache.set("b", ResultEntry({"id": "b"}, {"b": "1"}, size=100))
+    cache.set("c", ResultEntry({"id": "c"}, {"c": "1"}, size=100))
+    cache.set("d", ResultEntry({"id": "d"}, {"d": "1"}, size=300))
+
+    assert cache.get("a", versions.get) is None
+    assert len(cache) == 2 and cache.size == 200
+    assert cache.stats.evictions == 1
+    assert cache.get("b", {"b": "1"}.get).result == {"id": "b"}
+    assert cache.get("b", {"b": "2"}.get) is None
+    assert len(cache) == 1 and cache.size == 100
+
+
+def test_result_cache_checks_versions_without_the_lock():
+    cache = ResultCache(max_entries=2, max_bytes=250)
+    cache.set("a", ResultEntry({"id": "a"}, {"a": "1"}, size=100))
+    locked = []
+
+    def current_version(url: str) -> str:
+        locked.append(cache._lock.locked())
+        return "1"
+
+    assert cache.get("a", current_version).result == {"id": "a"}
+    assert locked == [False]
+
+
+def test_cached_result_skips_fetch_and_extraction(stub_upstream, response_cache):
+    before = extractions()
+    first = profile()
+    second = profile()
+
+    assert second == first
+    assert stub_upstream.hits[PATH] == 1
+    assert extractions() == before + 1
+    second["name"] = "Changed"
+    assert profile()["name"] == first["name"]
+
+
+def test_version_checks_not_counted(stub_upstream, response_cache):
+    profile()
+    stats = response_cache.stats()
+
+    profile()
+
+    assert get_result_cache().stats.hits == 1
+    assert response_cache.stats() == stats
+
+
+def test_results_keyed_by_arguments(stub_upstream, response_cache):
+    before = extractions("TransfermarktPlayerMarketValue")
+    profile()
+    asyncio.run(TransfermarktPlayerMarketValue.acreate(player_id="28003")).get_player_market_value()
+    market_value = asyncio.run(TransfermarktPlayerMarketValue.acreate(player_id="28003")).get_player_market_value()
+
+    assert market_value["id"] == "28003"
+    assert "marketValueHistory" in market_value
+    assert extractions("TransfermarktPlayerMarketValue") == before + 1
+
+
+def test_changed_page_invalidates_result(stub_upstream, response_cache):
+    first = profile()
+    entry = response_cache.get(URL)
+    response_cache.set(URL, dataclasses.replace(entry, content=entry.content.replace(b"Messi", b"Lionel"), page=None))
+    before = extractions()
+
+    second = profile()
+
+    assert second != first
+    assert extractions() == before + 1
+    assert profile() == second
+    assert extractions() == before + 1
+
+
+def test_expired_page_invalidates_result(stub_upstream, response_cache):
+    profile()
+    response_cache.get(URL).expires_at = 0
+    before = extractions()
+
+    profile()
+
+    assert stub_upstream.not_modified[PATH] == 1
+    assert extractions() == before + 1
+
+
+def test_result_cache_disabled(stub_upstream, response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_RESULTS_ENABLE", False)
+    before = extractions()
+    profile()
+    profile()
+
+    assert len(get_result_cache()) == 0
+    assert extractions() == before + 2
+
+
+def test_routes_answered_from_cached_results(stub_upstream, response_cache):
+    with TestClient(app) as client:
+        first = client.get("/players/28003/profile")
+        before = extractions()
+        second = client.get("/players/28003/profile")
+
+    assert second.status_code == 200
+    assert second.json()["name"] == first.json()["name"]
+    assert stub_upstream.hits[PATH] == 1
+    assert extractions() == before
@@ -0,0 +1,82 @@
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from app.services.base import TransfermarktBase
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+URL = "https://www.transfermarkt.com/-/profil/spieler/28003"
+PATH = "/-/profil/spieler/28003"
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def expire(cache, url: str = URL) -> None:
+    cache.get(url).expires_at = 0
+
+
+def test_not_modified_reuses_cached_page(stub_upstream, response_cache):
+    not_modified = sample("transfermarkt_revalidations_total", family="profile", outcome="not_modified")
+    saved = sample("transfermarkt_revalidation_saved_bytes_total", family="profile")
+    parsed = sample("transfermarkt_parse_seconds_count", parser="lxml")
+
+    first = TransfermarktPlayerProfile(player_id="28003")
+    expire(response_cache)
+    second = TransfermarktPlayerProfile(player_id="28003")
+
+    assert second.page is first.page
+    assert second.get_player_profile()["name"] == first.get_player_profile()["name"]
+    assert stub_upstream.hits[PATH] == 2
+    assert stub_upstream.not_modified[PATH] == 1
+    assert not response_cache.get(URL).is_expired()
+    assert sample("transfermarkt_parse_seconds_count", parser="lxml") == parsed + 1
+    assert sample("transfermarkt_revalidations_total", family="profile", outcome="not_modified") == not_modified + 1
+    size = len(response_cache.get(URL).content)
+    assert sample("transfermarkt_revalidation_saved_bytes_total", family="profile") == saved + size
+
+
+def test_async_requests_revalidate(stub_upstream, response_cache):
+    first = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003"))
+    expire(response_cache)
+    second = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003"))
+
+    assert second.page is first.page
+    assert stub_upstream.not_modified[PATH] == 1
+
+
+def test_modified_page_is_fetched_again(stub_upstream, response_cache):
+    modified = sample("transfermarkt_revalidations_total", family="profile", outcome="modified")
+    TransfermarktBase(URL=URL).make_request()
+    response_cache.get(URL).headers["ETag"] = '"outdated"'
+    expire(response_cache)
+
+    response = TransfermarktBase(URL=URL).make_request()
+
+    assert response.status_code == 200
+    assert stub_upstream.not_modified[PATH] == 0
+    assert response_cache.get(URL).headers["ETag"] == response.headers["ETag"]
+    assert sample("transfermarkt_revalidations_total", family="profile", outcome="modified") == modified + 1
+
+
+def test_last_modified_revalidation(stub_upstream, response_cache):
+    TransfermarktBase(URL=URL).make_request()
+    del response_cache.get(URL).headers["ETag"]
+    expire(response_cache)
+
+    response = TransfermarktBase(URL=URL).make_request()
+
+    assert response.status_code == 200
+    assert stub_upstream.not_modified[PATH] == 1
+
+
+def test_revalidation_disabled(stub_upstream, response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_REVALIDATE_ENABLE", False)
+    TransfermarktBase(URL=URL).make_request()
+    expire(response_cache)
+    TransfermarktBase(URL=URL).make_request()
+
+    assert stub_upstream.hits[PATH] == 2
+    assert stub_upstream.not_modified[PATH] == 0
@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+import os
+import sqlite3
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+import app.main  # noqa: F401 (registers the cache stats collector)
+from app.cache import (
+    CacheEntry,
+    MemoryCache,
+    ResultEntry,
+    SharedCache,
+    TieredCache,
+    get_response_cache,
+    get_result_cache,
+    get_shared_cache,
+)
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+PATH = "/-/profil/spieler/28003"
+
+
+def make_entry(content: bytes = b"<html>" + b"page " * 1000, ttl: float = 60) -> CacheEntry:
+    return CacheEntry(content=content, headers={"ETag": '"v1"'}, status_code=200, expires_at=time.time() + ttl)
+
+
+def store_in_child(path: str) -> None:
+    SharedCache(path, max_bytes=1_000_000).set("https://example.com/child", make_entry(b"from the child"))
+
+
+@pytest.fixture
+def shared_cache(response_cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_SHARED_PATH", str(tmp_path / "cache.sqlite3"))
+    get_response_cache.cache_clear()
+    get_result_cache.cache_clear()
+    get_shared_cache.cache_clear()
+    yield get_shared_cache()
+    get_shared_cache.cache_clear()
+
+
+def extractions() -> float:
+    return REGISTRY.get_sample_value("transfermarkt_extract_seconds_count", {"service": "TransfermarktPlayerProfile"})
+
+
+def restart_worker() -> None:
+    """Drop the in-process caches, as a freshly started worker process would not have them."""
+    get_response_cache.cache_clear()
+    get_result_cache.cache_clear()
+
+
+def test_shared_cache_compresses_and_expires(tmp_path):
+    cache = SharedCache(str(tmp_path / "cache.sqlite3"), max_bytes=1_000_000)
+    entry = make_entry()
+    cache.set("fresh", entry)
+    cache.set("expired", make_entry(ttl=-1))
+
+    assert cache.get("fresh") == entry
+    assert cache.size < len(entry.content)
+    assert cache.get("expired", include_expired=True).is_expired()
+    assert cache.get("expired") is None
+    assert len(cache) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_shared_cache_evicts_entries_expiring_first(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SharedCache(path, max_bytes=600)
+    for key, ttl in [("late", 300), ("early", 100), ("middle", 200), ("middle", 200)]:
+        cache.set(key, make_entry(os.urandom(150), ttl=ttl))
+
+    assert cache.get("early") is None
+    assert cache.get("late") is not None and cache.get("middle") is not None
+    assert cache.size <= 600
+    assert cache.size == sqlite3.connect(path).execute("SELECT SUM(size) FROM entries").fetchone()[0]
+    assert cache.stats.evictions == 1
+
+
+def test_shared_cache_failures_miss(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SharedCache(path, max_bytes=1_000_000)
+    cache.set("corrupt", make_entry())
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("UPDATE entries SET data = ?", (b"corrupt",))
+
+    assert cache.get("corrupt") is None
+    other.execute("BEGIN IMMEDIATE")
+    start = time.perf_counter()
+    cache.set("locked", make_entry())
+    assert time.perf_counter() - start < 1
+    other.rollback()
+    assert cache.get("locked") is None
+    other.execute("DROP TABLE entries")
+    assert len(cache) == 0
+    assert cache.errors == 3
+
+
+def test_shared_cache_results(tmp_path):
+    cache = SharedCache(str(tmp_path / "cache.sqlite3"), max_bytes=1_000_000)
+    cache.set_result("fresh", ResultEntry({"id": "1", "clubs": [{"id": "2"}]}, {"url": "abc"}, 100, time.time() + 60))
+    cache.set_result("expired", ResultEntry({"id": "3"}, {"url": "def"}, 100, time.time() - 1))
+
+    entry = cache.get_result("fresh")
+    assert entry.result == {"id": "1", "clubs": [{"id": "2"}]}
+    assert entry.versions == {"url": "abc"}
+    assert cache.get_result("expired") is None
+
+
+def test_shared_cache_seen_by_other_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SharedCache(path, max_bytes=1_000_000)
+    process = multiprocessing.get_context("spawn").Process(target=store_in_child, args=(path,))
+    process.start()
+    process.join()
+
+    tiered = TieredCache(MemoryCache(1_000_000), shared=cache)
+    assert process.exitcode == 0
+    assert tiered.get("https://example.com/child").content == b"from the child"
+    assert tiered.memory.get("https://example.com/child").content == b"from the child"
+
+
+def test_workers_share_pages_and_results(stub_upstream, shared_cache):
+    profile = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+    restart_worker()
+    extracted = extractions()
+
+    again = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+
+    assert again == profile
+    assert stub_upstream.hits[PATH] == 1
+    assert get_result_cache().stats.hits == 1
+    assert shared_cache.stats.hits == 1
+    ratio = REGISTRY.get_sample_value("transfermarkt_cache_hit_ratio", {"tier": "shared", "worker": str(os.getpid())})
+    assert ratio == shared_cache.stats.hits / (shared_cache.stats.hits + shared_cache.stats.misses)
+    assert extractions() == extracted
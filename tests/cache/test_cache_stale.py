@@ -0,0 +1,79 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.cache import refresh_queue
+from app.main import app
+from app.settings import settings
+
+ROUTE = "/players/28003/market_value"
+URLS = [
+    "https://www.transfermarkt.com/-/marktwertverlauf/spieler/28003",
+    "https://www.transfermarkt.com/ceapi/marketValueDevelopment/graph/28003",
+]
+PATH = "/-/marktwertverlauf/spieler/28003"
+
+
+def refreshes(outcome: str) -> float:
+    labels = {"service": "TransfermarktPlayerMarketValue", "outcome": outcome}
+    return REGISTRY.get_sample_value("transfermarkt_background_refreshes_total", labels) or 0
+
+
+@pytest.fixture
+def stale_cache(stub_upstream, response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_STALE_WHILE_REVALIDATE", True)
+    with TestClient(app) as client:
+        client.get(ROUTE)
+        for url in URLS:
+            response_cache.get(url).expires_at = time.time() - 60
+        yield client
+
+
+def test_stale_pages_served_and_refreshed(stale_cache, stub_upstream, response_cache):
+    completed = refreshes("completed")
+
+    response = stale_cache.get(ROUTE)
+    assert response.status_code == 200
+    assert 60 <= int(response.headers["X-Cache-Stale"]) < 70
+
+    stale_cache.portal.call(refresh_queue.join)
+    assert stub_upstream.hits[PATH] == 2
+    assert stub_upstream.not_modified[PATH] == 1
+    assert all(not response_cache.get(url).is_expired() for url in URLS)
+    assert refreshes("completed") == completed + 1
+
+    response = stale_cache.get(ROUTE)
+    assert "X-Cache-Stale" not in response.headers
+    assert stub_upstream.hits[PATH] == 2
+
+
+def test_max_stale_per_route(stale_cache, stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_MAX_STALE_ROUTES", {"/players/{player_id}/market_value": 30})
+
+    response = stale_cache.get(ROUTE)
+
+    assert "X-Cache-Stale" not in response.headers
+    assert stub_upstream.hits[PATH] == 2
+    assert len(refresh_queue) == 0
+
+
+def test_full_refresh_queue_drops_refreshes(stale_cache, stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_REFRESH_QUEUE_SIZE", 0)
+    dropped = refreshes("dropped")
+
+    response = stale_cache.get(ROUTE)
+
+    assert "X-Cache-Stale" in response.headers
+    assert stub_upstream.hits[PATH] == 1
+    assert refreshes("dropped") == dropped + 1
+
+
+def test_stale_pages_not_served_by_default(stale_cache, stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_STALE_WHILE_REVALIDATE", False)
+
+    response = stale_cache.get(ROUTE)
+
+    assert "X-Cache-Stale" not in response.headers
+    assert stub_upstream.not_modified[PATH] == 1
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from app.cache import CacheEntry, DiskCache, MemoryCache, TieredCache, get_ttl
+from app.services.base import TransfermarktBase
+from app.services.players.market_value import TransfermarktPlayerMarketValue
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+
+def test_tiered_cache_promotes_disk_entries(tmp_path):
+    disk = DiskCache(str(tmp_path), max_bytes=10_000)
+    disk.set("a", CacheEntry(content=b"body", headers={}, status_code=200, expires_at=time.time() + 60))
+    cache = TieredCache(MemoryCache(max_bytes=10_000), disk)
+
+    assert cache.get("a").content == b"body"
+    assert cache.get("a").content == b"body"
+    assert cache.stats()["memory"]["hits"] == 1
+    assert cache.stats()["disk"]["hits"] == 1
+
+
+def test_tiered_cache_prefers_fresher_disk_entries(tmp_path):
+    disk = DiskCache(str(tmp_path), max_bytes=10_000)
+    cache = TieredCache(MemoryCache(max_bytes=10_000), disk)
+    cache.memory.set("a", CacheEntry(content=b"old", headers={}, status_code=200, expires_at=0, stored_at=1))
+    disk.set("a", CacheEntry(content=b"new", headers={}, status_code=200, expires_at=time.time() + 60))
+
+    assert cache.get("a", include_expired=True).content == b"new"
+    assert cache.memory.get("a").content == b"new"
+
+
+def test_tiered_cache_peek_does_not_count_nor_promote(tmp_path):
+    disk = DiskCache(str(tmp_path), max_bytes=10_000)
+    cache = TieredCache(MemoryCache(max_bytes=10_000), disk)
+    cache.memory.set("a", CacheEntry(content=b"old", headers={}, status_code=200, expires_at=0))
+    disk.set("a", CacheEntry(content=b"new", headers={}, status_code=200, expires_at=time.time() + 60))
+    stats = cache.stats()
+
+    assert cache.peek("a").content == b"new"
+    assert cache.peek("b") is None
+    assert cache.stats() == stats
+    assert cache.memory.peek("a") is None
+
+
+def test_get_ttl_by_url_family(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_TTL_KADER", 42)
+
+    assert get_ttl("https://www.transfermarkt.com/-/kader/verein/131") == 42
+    assert get_ttl("https://www.transfermarkt.com/ceapi/transferHistory/list/28003") == (
+        settings.CACHE_TTL_CEAPI_TRANSFER_HISTORY
+    )
+    assert get_ttl("https://www.transfermarkt.com/-/erfolge/spieler/28003") == settings.CACHE_TTL_DEFAULT
+
+
+def test_cached_responses_skip_upstream(stub_upstream, response_cache):
+    first = TransfermarktPlayerMarketValue(player_id="28003").get_player_market_value()
+    second = TransfermarktPlayerMarketValue(player_id="28003").get_player_market_value()
+
+    assert first == second
+    assert stub_upstream.hits["/-/marktwertverlauf/spieler/28003"] == 1
+    assert stub_upstream.hits["/ceapi/marketValueDevelopment/graph/28003"] == 1
+    assert response_cache.stats()["memory"]["hits"] == 2
+
+
+def test_async_requests_share_cache(stub_upstream, response_cache):
+    TransfermarktPlayerProfile(player_id="28003")
+    tfmkt = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003"))
+
+    assert tfmkt.get_player_profile()["id"] == "28003"
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 1
+
+
+def test_zero_ttl_disables_caching(stub_upstream, response_cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_TTL_PROFILE", 0)
+    TransfermarktBase(URL="https://www.transfermarkt.com/-/profil/spieler/28003").make_request()
+    TransfermarktBase(URL="https://www.transfermarkt.com/-/profil/spieler/28003").make_request()
+
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 2
+
+
+def test_cache_disabled_by_default(stub_upstream):
+    TransfermarktPlayerProfile(player_id="28003")
+    TransfermarktPlayerProfile(player_id="28003")
+
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 2
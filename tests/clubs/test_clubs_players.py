@@ -1,10 +1,12 @@
 from datetime import datetime
 from unittest.mock import patch
 
+import httpx
 import pytest
 from fastapi import HTTPException
 from schema import And, Or, Schema
 
+from app.services.base import TransfermarktBase
 from app.services.clubs.players import TransfermarktClubPlayers
 
 
@@ -55,3 +57,34 @@ def test_get_club_players(
     )
 
     assert expected_schema.validate(result)
+
+
+def test_get_club_players_empty_cells_keep_rows_aligned(stub_upstream):
+    tfmkt = TransfermarktClubPlayers(club_id="131", season_id="2024")
+    expected = tfmkt.get_club_players()["players"]
+    html = tfmkt.make_request().text
+    html = html.replace('<td class="zentriert">1,77m</td>', '<td class="zentriert"></td>', 1)
+    html = html.replace('<td class="zentriert">Jun 25, 2000 (24)</td>', '<td class="zentriert"></td>', 1)
+    response = httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, content=html.encode())
+    tfmkt.page = TransfermarktBase.convert_response_to_page(response)
+    result = tfmkt.get_club_players()["players"]
+
+    assert len(result) == len(expected) == 40
+    assert result[0] == {**expected[0], "height": None, "dateOfBirth": None, "age": None}
+    assert result[1:] == expected[1:]
+
+
+def test_get_club_players_national_team_rows(stub_upstream):
+    tfmkt = TransfermarktClubPlayers(club_id="3262", season_id="2024", is_national=True)
+    result = tfmkt.get_club_players()["players"]
+
+    assert len(result) == 80
+    assert [player["status"] for player in result[:6]] == [
+        "",
+        "",
+        "",
+        "Team captain",
+        "",
+        "Hamstring injury - Return expected on Nov 30, 2024",
+    ]
+    assert all(player["joinedOn"] for player in result)
@@ -1,6 +1,28 @@
 import pytest
 from schema import Regex
 
+from app.cache import (
+    get_negative_cache,
+    get_remote_entries,
+    get_response_cache,
+    get_result_cache,
+    get_shared_cache,
+)
+from app.settings import settings
+from benchmarks.stub_server import StubServer
+
+
+@pytest.fixture
+def stub_server():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub_upstream(stub_server, monkeypatch):
+    monkeypatch.setattr(settings, "TRANSFERMARKT_BASE_URL", stub_server.url)
+    return stub_server
+
 
 @pytest.fixture
 def len_greater_than_0():
@@ -40,3 +62,19 @@ def regex_integer():
 @pytest.fixture
 def regex_height():
     return Regex(r"^(\d+,\d+m)|(m)$")
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLE", True)
+    get_response_cache.cache_clear()
+    get_negative_cache.cache_clear()
+    get_result_cache.cache_clear()
+    get_shared_cache.cache_clear()
+    get_remote_entries.cache_clear()
+    yield get_response_cache()
+    get_response_cache.cache_clear()
+    get_negative_cache.cache_clear()
+    get_result_cache.cache_clear()
+    get_shared_cache.cache_clear()
+    get_remote_entries.cache_clear()
@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.services.base import TransfermarktBase, construction_flights
+from app.services.players.market_value import TransfermarktPlayerMarketValue
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.services.players.transfers import TransfermarktPlayerTransfers
+from app.settings import settings
+
+
+def test_acreate_matches_sync(stub_upstream):
+    sync_result = TransfermarktPlayerProfile(player_id="28003").get_player_profile()
+    async_result = asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003")).get_player_profile()
+
+    assert async_result == sync_result
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 2
+
+
+def test_acreate_not_found(stub_upstream):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(TransfermarktPlayerProfile.acreate(player_id="abc"))
+
+    assert exc_info.value.status_code == 404
+
+
+async def acreate_many(n: int, **kwargs) -> list:
+    return await asyncio.gather(*[TransfermarktPlayerProfile.acreate(**kwargs) for _ in range(n)])
+
+
+def test_acreate_concurrent_coalesced(stub_upstream):
+    coalesced = construction_flights.stats.coalesced
+    results = asyncio.run(acreate_many(20, player_id="28003"))
+
+    assert len({tfmkt.get_player_profile()["id"] for tfmkt in results}) == 1
+    assert len({id(tfmkt.response) for tfmkt in results}) == 20
+    assert len({id(tfmkt.page) for tfmkt in results}) == 1
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 1
+    assert construction_flights.stats.coalesced - coalesced == 19
+
+
+def test_acreate_concurrent_coalesced_errors(stub_upstream):
+    async def acreate_many_not_found():
+        return await asyncio.gather(
+            *[TransfermarktPlayerProfile.acreate(player_id="abc") for _ in range(5)],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(acreate_many_not_found())
+
+    assert all(isinstance(result, HTTPException) and result.status_code == 404 for result in results)
+    assert stub_upstream.hits["/-/profil/spieler/abc"] == 1
+
+
+def test_acreate_concurrent_single_flight_disabled(stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "SINGLE_FLIGHT_ENABLE", False)
+    results = asyncio.run(acreate_many(20, player_id="28003"))
+
+    assert len({tfmkt.get_player_profile()["id"] for tfmkt in results}) == 1
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 20
+
+
+def test_acreate_sequential_not_coalesced(stub_upstream):
+    asyncio.run(acreate_many(1, player_id="28003"))
+    asyncio.run(acreate_many(1, player_id="28003"))
+
+    assert stub_upstream.hits["/-/profil/spieler/28003"] == 2
+
+
+def test_acreate_prefetches_concurrently(stub_upstream):
+    stub_upstream.latency = 0.1
+    tfmkt = asyncio.run(TransfermarktPlayerMarketValue.acreate(player_id="28003"))
+
+    assert (
+        tfmkt.get_player_market_value() == TransfermarktPlayerMarketValue(player_id="28003").get_player_market_value()
+    )
+    assert stub_upstream.hits["/-/marktwertverlauf/spieler/28003"] == 2
+    assert stub_upstream.hits["/ceapi/marketValueDevelopment/graph/28003"] == 2
+    # Both pages were in flight at once, so the async client had to open a second connection.
+    assert stub_upstream.connections == 3
+
+
+def test_acreate_history_only(stub_upstream):
+    tfmkt = asyncio.run(TransfermarktPlayerTransfers.acreate(player_id="28003", history_only=True))
+    result = tfmkt.get_player_transfers()
+
+    assert result["transfers"]
+    assert "youthClubs" not in result
+    assert stub_upstream.hits["/-/transfers/spieler/28003"] == 0
+    assert stub_upstream.hits["/ceapi/transferHistory/list/28003"] == 1
+
+
+def test_acreate_upstream_error(stub_upstream, monkeypatch):
+    monkeypatch.setattr(stub_upstream, "error_rate", 1.0)
+    monkeypatch.setattr(stub_upstream, "error_status", 503)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(TransfermarktPlayerProfile.acreate(player_id="28003"))
+
+    assert exc_info.value.status_code == 503
+    assert stub_upstream.errors["/-/profil/spieler/28003"] == 1
+
+
+def test_text_by_xpath_trims_once():
+    html = "<html><body><p> a\xa0b </p><p>\xa0</p><p></p><p> c </p></body></html>"
+    tfmkt = TransfermarktBase(URL="https://www.transfermarkt.com")
+    tfmkt.page = TransfermarktBase.convert_response_to_page(httpx.Response(200, html=html))
+
+    assert tfmkt.get_list_by_xpath("//p/text()") == ["ab", "c"]
+    assert tfmkt.get_list_by_xpath("//p/text()", remove_empty=False) == ["ab", "", "c"]
+    assert list(tfmkt.iter_list_by_xpath("//p/text()")) == ["ab", "c"]
+    assert tfmkt.get_text_by_xpath("//p/text()", pos=1) == "c"
+    assert tfmkt.get_text_by_xpath("//p/text()", join_str="-") == "ab-c"
+    assert tfmkt.get_text_by_xpath("//p/text()", iloc=0, join_str="-") == "a-b"
+    assert tfmkt.get_text_by_xpath("//p/text()", pos=2) is None
+    assert tfmkt.get_text_by_xpath("//span/text()") is None
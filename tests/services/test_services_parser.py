@@ -0,0 +1,30 @@
+import httpx
+import pytest
+
+from app.services.base import TransfermarktBase
+from app.settings import settings
+from benchmarks.cases import SERVICE_CASES
+
+
+@pytest.mark.parametrize("case", SERVICE_CASES, ids=[case.name for case in SERVICE_CASES])
+def test_parsers_extract_same_data(case, stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "HTML_PARSER", "bs4")
+    expected = case.run()
+    monkeypatch.setattr(settings, "HTML_PARSER", "lxml")
+    result = case.run()
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "content_type,content",
+    [
+        ("text/html; charset=iso-8859-1", "<html><body><p>Müller</p></body></html>".encode("latin-1")),
+        ("text/html", '<html><head><meta charset="utf-8"></head><body><p>Müller</p></body></html>'.encode()),
+    ],
+)
+def test_convert_response_to_page_encoding(content_type, content):
+    response = httpx.Response(200, headers={"Content-Type": content_type}, content=content)
+    page = TransfermarktBase.convert_response_to_page(response=response)
+
+    assert page.xpath("//p//text()") == ["Müller"]
@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from dateutil import parser
+from hypothesis import given
+from hypothesis import strategies as st
+
+from app.utils.dates import parse_date
+
+month_names = st.sampled_from(["Jan", "Feb", "Mar", "Jun", "Sep", "Sept", "dec", "MAY", "June", "September", "Foo"])
+numbers = st.integers(min_value=0, max_value=2100)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Jun 24, 1987", date(1987, 6, 24)),
+        ("Jul 1, 2005", date(2005, 7, 1)),
+        (" Jun 24, 1987 ", date(1987, 6, 24)),
+        ("2023-07-15", date(2023, 7, 15)),
+        ("05/06/2020", date(2020, 6, 5)),
+        ("24.06.1987", date(1987, 6, 24)),
+        ("Feb 30, 2020", None),
+        ("-", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date(text, expected):
+    assert parse_date(text) == expected
+
+
+def test_parse_date_falls_back_to_dateutil():
+    assert parse_date("24 June 1987") == date(1987, 6, 24)
+    assert parse_date("1987-06-24T12:00:00") == date(1987, 6, 24)
+
+
+def test_parse_date_calls_dateutil_once(monkeypatch):
+    calls = []
+    parse = parser.parse
+    monkeypatch.setattr(parser, "parse", lambda text: calls.append(text) or parse(text))
+
+    assert parse_date("24 June 1987") == date(1987, 6, 24)
+    assert parse_date("99999999999999999999") is None
+    assert parse_date("99999999999999999999") is None
+    assert calls == ["24 June 1987", "99999999999999999999"]
+
+
+@given(month_names, numbers, numbers)
+def test_parse_month_day_year_matches_dateutil(month, day, year):
+    text = f"{month} {day}, {year:04}"
+    try:
+        expected = parser.parse(text).date()
+    except (parser.ParserError, OverflowError):
+        expected = None
+
+    assert parse_date(text) == expected
+
+
+@given(numbers, numbers, numbers, st.sampled_from(["{y:04}-{m:02}-{d:02}", "{d}/{m}/{y:04}", "{d:02}.{m:02}.{y:04}"]))
+def test_parse_numeric_matches_dateutil(day, month, year, template):
+    text = template.format(d=day, m=month, y=year)
+    try:
+        # Transfermarkt writes the day first, so it is read first where the date is ambiguous
+        expected = parser.parse(text, dayfirst="-" not in text).date()
+    except (parser.ParserError, OverflowError):
+        expected = None
+
+    assert parse_date(text) == expected
@@ -0,0 +1,59 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.main import app
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_service_stages_recorded(stub_upstream):
+    fetches = sample("transfermarkt_fetch_seconds_count", family="profile", status="200")
+    parsed = sample("transfermarkt_parse_bytes_sum", parser="lxml")
+    extractions = sample("transfermarkt_extract_seconds_count", service="TransfermarktPlayerProfile")
+
+    tfmkt = TransfermarktPlayerProfile(player_id="28003")
+    tfmkt.get_player_profile()
+
+    assert sample("transfermarkt_fetch_seconds_count", family="profile", status="200") == fetches + 1
+    assert sample("transfermarkt_parse_bytes_sum", parser="lxml") == parsed + len(tfmkt.make_request().content)
+    assert sample("transfermarkt_extract_seconds_count", service="TransfermarktPlayerProfile") == extractions + 1
+
+
+def test_failed_fetch_recorded(stub_upstream):
+    fetches = sample("transfermarkt_fetch_seconds_count", family="profile", status="404")
+    with pytest.raises(HTTPException):
+        TransfermarktPlayerProfile(player_id="abc")
+
+    assert sample("transfermarkt_fetch_seconds_count", family="profile", status="404") == fetches + 1
+
+
+def test_metrics_endpoint(stub_upstream):
+    route = "/players/{player_id}/profile"
+    validations = sample("api_response_validation_seconds_count", route=route)
+    serializations = sample("api_response_serialization_seconds_count", route=route)
+
+    with TestClient(app) as client:
+        client.get("/players/28003/profile")
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "transfermarkt_single_flight_calls_total" in response.text
+    assert sample("api_response_validation_seconds_count", route=route) == validations + 1
+    assert sample("api_response_serialization_seconds_count", route=route) == serializations + 1
+
+
+def test_metrics_disabled(stub_upstream, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLE", False)
+    fetches = sample("transfermarkt_fetch_seconds_count", family="profile", status="200")
+    extractions = sample("transfermarkt_extract_seconds_count", service="TransfermarktPlayerProfile")
+
+    TransfermarktPlayerProfile(player_id="28003").get_player_profile()
+
+    assert sample("transfermarkt_fetch_seconds_count", family="profile", status="200") == fetches
+    assert sample("transfermarkt_extract_seconds_count", service="TransfermarktPlayerProfile") == extractions
@@ -0,0 +1,92 @@
+import re
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from app.utils.numbers import parse_number
+
+numbers = st.decimals(min_value=0, max_value=99_999, places=2).map(str)
+
+
+def previous_parse_str_to_int(v) -> Optional[int]:
+    """The previous `TransfermarktBaseModel.parse_str_to_int`."""
+    if v is None:
+        return None
+    if not v or not any(char.isdigit() for char in v):
+        return None
+
+    # Clean up HTML tags if present
+    if "<" in str(v):
+        matches = re.findall(r"€([\d,.]+[kmb]?)", v.lower())
+        if not matches:
+            return None
+        value_str = matches[0]
+    else:
+        value_str = v.lower().replace("€", "").replace("+", "").replace("'", "").strip()
+
+    if "k" in value_str:
+        return int(float(value_str.replace("k", "")) * 1_000)
+    elif "m" in value_str:
+        return int(float(value_str.replace("m", "")) * 1_000_000)
+    elif "bn" in value_str:
+        return int(float(value_str.replace("bn", "")) * 1_000_000_000)
+    elif "b" in value_str:
+        return int(float(value_str.replace("b", "")) * 1_000_000_000)
+    else:
+        return int(float(value_str))
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("€1.50m", 1_500_000),
+        ("€500k", 500_000),
+        ("€1.2bn", 1_200_000_000),
+        ("€12.00m", 12_000_000),
+        ("Loan fee:<br/>€1.50m", 1_500_000),
+        ("+12", 12),
+        ("-3", -3),
+        ("3.066'", 3_066),
+        ("1,234,567", 1_234_567),
+        ("7.5", 7),
+        ("-", None),
+        ("?", None),
+        ("free transfer", None),
+        ("12 goals", None),
+        ("", None),
+        (None, None),
+        (28, 28),
+    ],
+)
+def test_parse_number(text, expected):
+    assert parse_number(text) == expected
+
+
+@given(numbers, st.sampled_from(["k", "m", "bn", "b"]), st.sampled_from(["€", "", "+"]), st.booleans())
+def test_parse_amount_matches_previous_parser(number, suffix, prefix, negative):
+    text = ("-" if negative else "") + prefix + number + suffix
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(suffix, 1_000_000_000)
+    exact = int(Decimal(number) * multiplier)
+    result = parse_number(text)
+
+    assert result == (-exact if negative else exact)
+    # The previous parser agrees, but for the rounding of its float products (e.g. 1.2 * 1e9 = 1199999999.9999998)
+    assert abs(result - previous_parse_str_to_int(text)) <= 1
+
+
+@given(st.text(alphabet="0123456789.,€kmbn+-'? <>", max_size=10))
+def test_parse_number_fuzz(text):
+    result = parse_number(text)
+    try:
+        expected = previous_parse_str_to_int(text)
+    except ValueError:
+        return
+
+    # The previous parser read a dot followed by three digits as a decimal point, and some odd texts (e.g. '5kk' or
+    # 'm5') as numbers, which now give None
+    cleaned = re.sub(r"[€+' ]", "", text)
+    if result is not None and not re.search(r"\d\.\d{3}$", cleaned):
+        assert result == expected
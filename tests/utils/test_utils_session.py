@@ -0,0 +1,23 @@
+from app.services.players.profile import TransfermarktPlayerProfile
+from app.settings import settings
+from app.utils.session import get_session
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
+def test_get_session_pool_size():
+    adapter = get_session().get_adapter("https://www.transfermarkt.com")
+
+    assert adapter._pool_connections == settings.HTTP_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == settings.HTTP_POOL_MAXSIZE
+
+
+def test_consecutive_fetches_reuse_connection(stub_server):
+    url = stub_server.url + "/-/profil/spieler/{player_id}"
+    for _ in range(5):
+        TransfermarktPlayerProfile(player_id="28003", URL=url)
+
+    assert stub_server.hits["/-/profil/spieler/28003"] == 5
+    assert stub_server.connections == 1
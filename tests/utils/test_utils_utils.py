@@ -0,0 +1,27 @@
+import pytest
+
+from app.utils.regex import REGEX_DOB
+from app.utils.utils import extract_from_url, safe_regex
+
+
+@pytest.mark.parametrize(
+    "url,element,expected",
+    [
+        ("/-/profil/spieler/28003", "id", "28003"),
+        ("/fc-barcelona/startseite/verein/131/saison_id/2024", "season_id", "2024"),
+        ("/fc-barcelona/startseite/verein/131/saison_id/2024", "code", "fc-barcelona"),
+        ("/-/transfers/spieler/8198/transfer_id/3421", "transfer_id", "3421"),
+        ("/-/kader/verein/131?saison_id=2024", "id", "131"),
+        ("https://www.transfermarkt.com/-/profil/spieler/28003", "id", None),
+        (None, "id", None),
+    ],
+)
+def test_extract_from_url(url, element, expected):
+    assert extract_from_url(url, element) == expected
+
+
+def test_safe_regex_compiled_and_str_patterns():
+    assert safe_regex(" Jun 25, 2000 (24) ", REGEX_DOB, "age") == "24"
+    assert safe_regex(["Jun 25, 2000", " (24)"], REGEX_DOB.pattern, "dob") == "Jun 25, 2000"
+    assert safe_regex("Jun 25, 2000", REGEX_DOB, "age") is None
+    assert safe_regex("Jun 25, 2000 (24)", REGEX_DOB, "unknown") is None
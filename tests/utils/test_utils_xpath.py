@@ -0,0 +1,31 @@
+from lxml import etree
+
+from app.services.players.injuries import TransfermarktPlayerInjuries
+from app.utils.xpath import Players, XPathElement, compile_xpath
+
+
+def test_compile_xpath_memoized():
+    assert compile_xpath(Players.Profile.URL) is compile_xpath(Players.Profile.URL)
+
+
+def test_parsed_page_uses_compiled_xpath(stub_upstream):
+    tfmkt = TransfermarktPlayerInjuries(player_id="28003")
+    rows = tfmkt.page.xpath(Players.Injuries.RESULTS)
+
+    assert isinstance(tfmkt.page, XPathElement)
+    assert rows and all(isinstance(row, XPathElement) for row in rows)
+
+
+def test_compiled_xpath_matches_lxml(stub_upstream):
+    tfmkt = TransfermarktPlayerInjuries(player_id="28003")
+    plain = etree.HTML(tfmkt.make_request().content)
+    plain_rows = plain.xpath(Players.Injuries.RESULTS)
+    rows = tfmkt.page.xpath(Players.Injuries.RESULTS)
+
+    assert len(rows) == len(plain_rows)
+    for row, plain_row in zip(rows, plain_rows):
+        assert row.xpath(Players.Injuries.INJURY) == plain_row.xpath(Players.Injuries.INJURY)
+        assert row.xpath(Players.Injuries.GAMES_MISSED_CLUBS_URLS) == plain_row.xpath(
+            Players.Injuries.GAMES_MISSED_CLUBS_URLS,
+        )
+    assert tfmkt.page.xpath("count(//tr)") == plain.xpath("count(//tr)")